@@ -0,0 +1,66 @@
+"""
+Benchmark Excel workbook loading time and peak memory usage (max RSS) with
+the xlrd and openpyxl (read-only) engines of ExcelTableFileLoader.
+Each engine runs in a separate process to measure the peak memory usage.
+
+Usage:
+    python benchmark/bench_excel_loader.py [NUM_ROWS]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import xlsxwriter
+
+import pytablereader as ptr
+
+
+def write_workbook(file_path, num_rows):
+    workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("data")
+
+    worksheet.write_row(0, 1, ["id", "name", "value", "flag"])
+    for i in range(num_rows):
+        worksheet.write_row(i + 1, 1, [i, f"name_{i}", i * 0.5, i % 2 == 0])
+
+    workbook.close()
+
+
+def load(file_path, engine):
+    loader = ptr.ExcelTableFileLoader(file_path)
+    loader.engine = engine
+
+    start_time = time.perf_counter()
+    num_rows = sum(len(table_data.rows) for table_data in loader.load())
+    elapsed = time.perf_counter() - start_time
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"{engine:<10s} {elapsed:8.3f} [sec] {max_rss:8.1f} [MiB] ({num_rows} rows)")
+
+
+def main():
+    if len(sys.argv) > 2:
+        # child process: load the file with the engine
+        load(sys.argv[1], sys.argv[2])
+        return
+
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "bench.xlsx")
+        write_workbook(file_path, num_rows)
+
+        print(f"rows: {num_rows}")
+
+        for engine in ("xlrd", "openpyxl"):
+            subprocess.run([sys.executable, __file__, file_path, engine], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark HTML table loading time and peak memory usage with a whole
+BeautifulSoup tree, a tree that only includes title/table elements, and
+the event-driven streaming parser.
+
+Usage:
+    python benchmark/bench_html_loader.py [REPEAT]
+
+The ``python - Wiktionary.html`` test fixture is repeated ``REPEAT`` times to
+make a larger document.
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pytablereader as ptr
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "test", "data", "python - Wiktionary.html"
+)
+
+
+def measure(func):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start_time
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def report(name, elapsed, peak):
+    print(f"{name:<30s} {elapsed:8.3f} [sec] {peak / 1024**2:8.1f} [MiB]")
+
+
+def load(file_path, **attrs):
+    loader = ptr.HtmlTableFileLoader(file_path)
+    for name, value in attrs.items():
+        setattr(loader, name, value)
+
+    return list(loader.load())
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        html_text = f.read() * repeat
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "bench.html")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(html_text)
+
+        print(f"file size: {os.path.getsize(file_path) / 1024**2:.1f} [MiB]")
+
+        _, elapsed, peak = measure(lambda: load(file_path))
+        report("whole tree", elapsed, peak)
+
+        _, elapsed, peak = measure(lambda: load(file_path, parse_tables_only=True))
+        report("parse_tables_only", elapsed, peak)
+
+        _, elapsed, peak = measure(lambda: load(file_path, streaming=True))
+        report("streaming", elapsed, peak)
+
+
+if __name__ == "__main__":
+    main()
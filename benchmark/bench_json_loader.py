@@ -0,0 +1,83 @@
+"""
+Benchmark JSON/JSON Lines decoding with OrderedDict and plain dict objects.
+
+Usage:
+    python benchmark/bench_json_loader.py [NUM_RECORDS] [JSON_BACKEND]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import pytablereader as ptr
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "name": f"name_{i}",
+            "value": i * 0.5,
+            "flag": i % 2 == 0,
+            "note": None,
+        }
+        for i in range(num_records)
+    ]
+
+
+def measure(func):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start_time
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def report(name, elapsed, peak):
+    print(f"{name:<40s} {elapsed:8.3f} [sec] {peak / 1024**2:8.1f} [MiB]")
+
+
+def main():
+    num_records = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    if len(sys.argv) > 2:
+        ptr.set_json_backend(sys.argv[2])
+
+    records = make_records(num_records)
+    json_text = json.dumps(records)
+    jsonl_text = "\n".join(json.dumps(record) for record in records)
+    del records
+
+    print(f"records: {num_records}")
+
+    _, elapsed, peak = measure(lambda: json.loads(json_text, object_pairs_hook=OrderedDict))
+    report("json.loads (OrderedDict)", elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: json.loads(json_text))
+    report("json.loads (dict)", elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: ptr.JsonTableTextLoader(json_text).load_dict())
+    report("JsonTableTextLoader.load_dict", elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: ptr.JsonLinesTableTextLoader(jsonl_text).load_dict())
+    report("JsonLinesTableTextLoader.load_dict", elapsed, peak)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "bench.json")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(json_text)
+
+        _, elapsed, peak = measure(lambda: list(ptr.JsonTableFileLoader(file_path).load()))
+        report("JsonTableFileLoader.load", elapsed, peak)
+
+
+if __name__ == "__main__":
+    main()
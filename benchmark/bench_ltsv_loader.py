@@ -0,0 +1,83 @@
+"""
+Benchmark LTSV parsing throughput in lines per second.
+Compare the loader with a parser that splits items with ``str.split`` and
+validates the label of every item, as the loader did before caching validated labels.
+
+Usage:
+    python benchmark/bench_ltsv_loader.py [NUM_LINES]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+import time
+
+import pathvalidate as pv
+
+import pytablereader as ptr
+
+
+LABELS = ["time", "host", "forwardedfor", "req", "status", "size", "referer", "ua", "reqtime"]
+
+
+def make_ltsv_lines(num_lines):
+    return [
+        "\t".join(
+            [
+                f"time:[28/Feb/2013:12:00:{i % 60:02d} +0900]",
+                f"host:192.168.0.{i % 256}",
+                "forwardedfor:-",
+                f"req:GET /list?id={i} HTTP/1.1",
+                "status:200",
+                f"size:{i % 10000}",
+                "referer:-",
+                "ua:Mozilla/5.0",
+                f"reqtime:0.{i % 1000:03d}",
+            ]
+        )
+        for i in range(num_lines)
+    ]
+
+
+def parse_without_cache(lines):
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        ltsv_record = {}
+        for ltsv_item in line.split("\t"):
+            label, value = ltsv_item.split(":", 1)
+            label = label.strip('"')
+            pv.validate_ltsv_label(label)
+            ltsv_record[label] = value
+
+        yield ltsv_record
+
+
+def parse_with_loader(lines):
+    loader = ptr.LtsvTableTextLoader("\n".join(lines))
+
+    return loader.iter_rows()
+
+
+def measure(name, func, lines):
+    start_time = time.perf_counter()
+    for _row in func(lines):
+        pass
+    elapsed = time.perf_counter() - start_time
+
+    print(f"{name:<30s} {len(lines) / elapsed:12,.0f} [lines/sec]")
+
+
+def main():
+    num_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lines = make_ltsv_lines(num_lines)
+
+    print(f"lines: {num_lines}")
+    measure("validate every label", parse_without_cache, lines)
+    measure("LtsvTableTextLoader.iter_rows", parse_with_loader, lines)
+
+
+if __name__ == "__main__":
+    main()
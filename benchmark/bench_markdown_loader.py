@@ -0,0 +1,83 @@
+"""
+Benchmark Markdown table extraction/loading time with the native pipe-table
+scanner and the markdown package (rendering to HTML and parsing the HTML with
+BeautifulSoup). Loading time includes the conversion to TableData.
+
+Usage:
+    python benchmark/bench_markdown_loader.py [NUM_SECTIONS]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+import time
+
+import pytablereader as ptr
+from pytablereader.markdown.formatter import MarkdownPipeTableFormatter, MarkdownTableFormatter
+
+
+SECTION_TEMPLATE = """\
+# Section {id:d}
+
+Some *text* of the section {id:d} with a [link](https://example.com/{id:d}).
+
+```
+| not | a | table |
+|-----|---|-------|
+```
+
+| id | name | value |
+|---:|------|------:|
+{rows}
+"""
+
+
+def make_markdown(num_sections, num_rows=20):
+    return "\n".join(
+        SECTION_TEMPLATE.format(
+            id=i,
+            rows="\n".join(f"| {j:d} | name_{j:d} | {j * 0.5} |" for j in range(num_rows)),
+        )
+        for i in range(num_sections)
+    )
+
+
+def measure_extraction(name, text, formatter_class):
+    start_time = time.perf_counter()
+    formatter = formatter_class(text)
+    for _table_id, _caption, rows in formatter._iter_tables():
+        for _row in rows:
+            pass
+    elapsed = time.perf_counter() - start_time
+
+    print(f"{name:<20s} {elapsed:8.3f} [sec]")
+
+
+def measure(name, text, engine):
+    loader = ptr.MarkdownTableTextLoader(text)
+    loader.engine = engine
+
+    start_time = time.perf_counter()
+    num_tables = sum(1 for _table_data in loader.load())
+    elapsed = time.perf_counter() - start_time
+
+    print(f"{name:<20s} {elapsed:8.3f} [sec] ({num_tables} tables)")
+
+
+def main():
+    num_sections = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    text = make_markdown(num_sections)
+
+    print(f"sections: {num_sections}")
+
+    print("--- extract tables ---")
+    measure_extraction("markdown", text, MarkdownTableFormatter)
+    measure_extraction("native", text, MarkdownPipeTableFormatter)
+
+    print("--- load tables ---")
+    measure("markdown", text, "markdown")
+    measure("native", text, "native")
+
+
+if __name__ == "__main__":
+    main()
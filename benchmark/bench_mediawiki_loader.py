@@ -0,0 +1,97 @@
+"""
+Benchmark table extraction/loading of many small MediaWiki documents with
+the native parser and pandoc. Loading time includes the conversion to TableData.
+The pandoc engine is skipped if pypandoc or pandoc is not available.
+
+Usage:
+    python benchmark/bench_mediawiki_loader.py [NUM_DOCUMENTS]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+import time
+
+import pytablereader as ptr
+from pytablereader.mediawiki.formatter import (
+    MediaWikiNativeTableFormatter,
+    MediaWikiTableFormatter,
+)
+
+
+DOCUMENT_TEMPLATE = """\
+== Section {id:d} ==
+Some '''text''' with a [[Page|link]].
+
+{{| class="wikitable"
+|+ table {id:d}
+! id !! name !! value
+{rows}
+|}}
+"""
+
+
+def make_documents(num_documents, num_rows=10):
+    return [
+        DOCUMENT_TEMPLATE.format(
+            id=i,
+            rows="\n".join(f"|-\n| {j:d} || name_{j:d} || {j * 0.5}" for j in range(num_rows)),
+        )
+        for i in range(num_documents)
+    ]
+
+
+def extract_all(documents, formatter_class):
+    num_tables = 0
+    for document in documents:
+        for _table_id, _caption, rows in formatter_class(document)._iter_tables():
+            for _row in rows:
+                pass
+
+            num_tables += 1
+
+    return num_tables
+
+
+def load_all(documents, engine):
+    num_tables = 0
+    for document in documents:
+        loader = ptr.MediaWikiTableTextLoader(document)
+        loader.engine = engine
+        num_tables += sum(1 for _table_data in loader.load())
+
+    return num_tables
+
+
+def measure(name, func, documents, *args):
+    start_time = time.perf_counter()
+    try:
+        num_tables = func(documents, *args)
+    except (ptr.PypandocImportError, OSError) as e:
+        print(f"{name:<10s} skipped: {e}")
+        return
+    elapsed = time.perf_counter() - start_time
+
+    print(
+        f"{name:<10s} {elapsed:8.3f} [sec] "
+        f"{len(documents) / elapsed:10,.0f} [documents/sec] ({num_tables} tables)"
+    )
+
+
+def main():
+    num_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    documents = make_documents(num_documents)
+
+    print(f"documents: {num_documents}")
+
+    print("--- extract tables ---")
+    measure("native", extract_all, documents, MediaWikiNativeTableFormatter)
+    measure("pandoc", extract_all, documents, MediaWikiTableFormatter)
+
+    print("--- load tables ---")
+    measure("native", load_all, documents, "native")
+    measure("pandoc", load_all, documents, "pandoc")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark SQLite table loading time and peak memory usage with whole tables
+and chunked loading (``chunk_size``) of SqliteFileLoader.
+
+Usage:
+    python benchmark/bench_sqlite_loader.py [NUM_ROWS]
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pytablereader as ptr
+
+
+def write_database(file_path, num_rows):
+    con = sqlite3.connect(file_path)
+    con.execute("CREATE TABLE data (id INTEGER, name TEXT, value REAL, flag INTEGER)")
+    con.executemany(
+        "INSERT INTO data VALUES (?, ?, ?, ?)",
+        ((i, f"name_{i}", i * 0.5, i % 2) for i in range(num_rows)),
+    )
+    con.commit()
+    con.close()
+
+
+def measure(func):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start_time
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def report(name, elapsed, peak):
+    print(f"{name:<30s} {elapsed:8.3f} [sec] {peak / 1024**2:8.1f} [MiB]")
+
+
+def load(file_path, chunk_size=None):
+    loader = ptr.SqliteFileLoader(file_path)
+    loader.chunk_size = chunk_size
+
+    # consume the rows of each TableData as an application would do
+    return sum(len(table_data.rows) for table_data in loader.load())
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "bench.sqlite")
+        write_database(file_path, num_rows)
+
+        print(f"file size: {os.path.getsize(file_path) / 1024**2:.1f} [MiB]")
+
+        _, elapsed, peak = measure(lambda: load(file_path))
+        report("whole table", elapsed, peak)
+
+        for chunk_size in (10000, 1000):
+            _, elapsed, peak = measure(lambda: load(file_path, chunk_size))
+            report(f"chunk_size={chunk_size}", elapsed, peak)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,11 @@
 from tabledata import DataError, InvalidHeaderNameError, InvalidTableNameError
 
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
+from ._common import set_json_backend
 from ._constant import PatternMatch
+from ._encoding import EncodingDetector
 from ._logger import set_log_level, set_logger
+from ._selector import TableSelector
 from .csv.core import CsvTableFileLoader, CsvTableTextLoader
 from .error import (
     APIError,
@@ -2,14 +2,19 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import importlib
 import os.path
 import posixpath
+from itertools import islice
 from urllib.parse import urlparse
 
 import pathvalidate
 import typepy
 
 from ._constant import Default
+from ._encoding import EncodingDetector
+from ._logger import logger
+from ._mmap import open_mmap_text
 from .error import InvalidFilePathError
 
 
@@ -19,19 +24,135 @@ except ImportError:
     import json  # type: ignore # noqa
 
 
-def get_file_encoding(file_path, encoding):
-    from mbstrdecoder import detect_file_encoding
+_json_backend = json
+
+
+def set_json_backend(backend=None):
+    """
+    Set the JSON decoding backend that used by JSON/JSON Lines table loaders.
+    The backend is not used for the items of the JSON schema (1) and (4) in the
+    streaming mode of :py:class:`~pytablereader.JsonTableFileLoader`:
+    the items are decoded with the default backend, because ``loads`` functions
+    cannot decode a JSON value from the middle of a text.
+
+    :param backend:
+        A module name of the backend (e.g. ``"orjson"``, ``"ujson"``),
+        or an object that has ``loads`` function that decodes a JSON text to
+        Python objects.
+        Restore the default backend (``simplejson`` if installed,
+        otherwise ``json``) if the value is |None|.
+    :raises ImportError: If failed to import the backend module.
+    :raises TypeError: If the backend has no ``loads`` function.
+
+    :Example:
+        .. code:: python
+
+            import pytablereader as ptr
+
+            ptr.set_json_backend("orjson")
+    """
+
+    global _json_backend
+
+    if backend is None:
+        backend = json
+    elif isinstance(backend, str):
+        backend = importlib.import_module(backend)
+
+    if not callable(getattr(backend, "loads", None)):
+        raise TypeError(f"JSON backend must have loads function: {backend}")
+
+    _json_backend = backend
+
+
+def json_loads(text):
+    """
+    Decode a JSON text with the JSON decoding backend.
+    JSON objects are decoded to :py:class:`dict` instances.
+
+    :raises ValueError: If the text is an invalid JSON.
+    """
+
+    return _json_backend.loads(text)
+
+
+def get_file_encoding(file_path, encoding, detector=None):
+    """
+    :param str file_path: Path to the file.
+    :param str encoding:
+        Encoding of the file. Return the value as it is if specified.
+    :param EncodingDetector detector:
+        Detector to detect the encoding when ``encoding`` is not specified.
+        Use a detector with the default settings if |None|.
+    """
 
     if encoding:
         return encoding
 
-    encoding = detect_file_encoding(file_path)
+    if detector is None:
+        detector = EncodingDetector()
+
+    encoding = detector.detect(file_path)
+    logger.debug(f"detect encoding: file={file_path}, encoding={encoding}")
     if not encoding:
         return Default.ENCODING
 
     return encoding
 
 
+def open_text_file(file_path, encoding, use_mmap=False):
+    """
+    Open a file as a text stream.
+    If ``use_mmap`` is |True|, the stream reads the file through a memory-mapped
+    view of the file. Files that cannot be memory-mapped (e.g. FIFOs or empty
+    files) are opened in the normal way.
+    """
+
+    if use_mmap and os.path.isfile(file_path) and os.path.getsize(file_path) > 0:
+        return open_mmap_text(file_path, encoding)
+
+    return open(file_path, encoding=encoding)
+
+
+def iter_batches(iterable, batch_size):
+    if batch_size < 1:
+        raise ValueError(f"batch size must be greater than zero: actual={batch_size}")
+
+    return _iter_batches(iter(iterable), batch_size)
+
+
+def _iter_batches(iterator, batch_size):
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+
+        yield batch
+
+
+def extract_headers(records, sample_size=None):
+    """
+    Extract keys of records as headers in the order of first appearance.
+
+    :param records: Iterable of mappings.
+    :param int sample_size:
+        Maximum number of records to inspect from the beginning of ``records``.
+        Inspect all of the records if |None|.
+    :return: Headers.
+    :rtype: list
+    """
+
+    # a dict is used as an insertion-ordered set
+    headers = {}
+
+    for record in islice(records, sample_size):
+        for key in record:
+            if key not in headers:
+                headers[key] = None
+
+    return list(headers)
+
+
 def get_extension(file_path):
     if typepy.is_null_string(file_path):
         raise InvalidFilePathError("file path is empty")
@@ -7,6 +7,7 @@ import enum
 
 class Default:
     ENCODING = "utf-8"
+    ENCODING_SAMPLE_SIZE = 64 * 1024
 
 
 class SourceType:
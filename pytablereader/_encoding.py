@@ -0,0 +1,121 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import codecs
+import os.path
+from typing import Optional
+
+from ._constant import Default
+from ._validator import is_fifo
+
+
+# UTF-32 BOMs must be checked before UTF-16 BOMs: BOM_UTF32_LE starts with BOM_UTF16_LE
+_BOM_CODECS = (
+    (codecs.BOM_UTF32_BE, "utf_32"),
+    (codecs.BOM_UTF32_LE, "utf_32"),
+    (codecs.BOM_UTF8, "utf_8_sig"),
+    (codecs.BOM_UTF16_BE, "utf_16"),
+    (codecs.BOM_UTF16_LE, "utf_16"),
+)
+_BINARY_EXTENSIONS = frozenset(["sqlite", "sqlite3", "xls", "xlsx"])
+
+
+def detect_bom_encoding(binary: bytes) -> Optional[str]:
+    for bom, codec in _BOM_CODECS:
+        if binary.startswith(bom):
+            return codec
+
+    return None
+
+
+class EncodingDetector:
+    """
+    A class to detect the encoding of a file from bounded samples of the file,
+    instead of reading the whole file.
+
+    :param int sample_size:
+        Maximum number of bytes to read from the head of a file.
+        Defaults to 64KiB.
+    :param bool probe_middle:
+        If |True|, also feed ``sample_size`` bytes from the middle of the file.
+    :param bool probe_tail:
+        If |True|, also feed ``sample_size`` bytes from the tail of the file.
+
+    If a file starts with a byte order mark (BOM), the encoding is decided by
+    the BOM without running the detection.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = Default.ENCODING_SAMPLE_SIZE,
+        probe_middle: bool = False,
+        probe_tail: bool = False,
+    ) -> None:
+        if sample_size < 1:
+            raise ValueError(f"sample size must be greater than zero: actual={sample_size}")
+
+        self.sample_size = sample_size
+        self.probe_middle = probe_middle
+        self.probe_tail = probe_tail
+
+    def detect(self, file_path) -> Optional[str]:
+        """
+        :param str file_path: Path to the file.
+        :return:
+            Detected codec name. |None| if failed to detect the encoding,
+            or the file is not a regular text file.
+        :rtype: str
+        """
+
+        from chardet.universaldetector import UniversalDetector
+
+        if not os.path.isfile(file_path) or is_fifo(file_path):
+            return None
+
+        if os.path.splitext(file_path)[1].lstrip(".").lower() in _BINARY_EXTENSIONS:
+            return None
+
+        detector = UniversalDetector()
+
+        try:
+            with open(file_path, mode="rb") as f:
+                head = f.read(self.sample_size)
+                bom_encoding = detect_bom_encoding(head)
+                if bom_encoding:
+                    return bom_encoding
+
+                detector.feed(head)
+
+                for offset in self.__get_probe_offsets(os.fstat(f.fileno()).st_size):
+                    if detector.done:
+                        break
+
+                    f.seek(offset)
+                    detector.feed(f.read(self.sample_size))
+        except OSError:
+            return None
+        finally:
+            detector.close()
+
+        encoding = detector.result.get("encoding")
+        if not encoding:
+            return None
+
+        encoding = encoding.lower().replace("-", "_")
+        if encoding == "ascii":
+            # the rest of the file may include non-ascii characters
+            return Default.ENCODING
+
+        return encoding
+
+    def __get_probe_offsets(self, file_size):
+        offsets = []
+
+        if self.probe_middle:
+            offsets.append((file_size - self.sample_size) // 2)
+        if self.probe_tail:
+            offsets.append(file_size - self.sample_size)
+
+        # skip the probes that overlap with the already read head
+        return [offset for offset in offsets if offset >= self.sample_size]
@@ -0,0 +1,81 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+import mmap
+
+
+class MmapReader(io.RawIOBase):
+    """
+    A raw binary stream that reads a byte range of a file through
+    a memory-mapped view of the file.
+    Bytes are copied from the view only when they are read, so the OS page
+    cache can serve the data of the file.
+    """
+
+    def __init__(self, file_path, start=0, end=None):
+        super().__init__()
+
+        with open(file_path, "rb") as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # slices of a memoryview are copied to the buffer without creating bytes objects
+        self.__view = memoryview(self.__mmap)
+
+        if end is None:
+            end = len(self.__mmap)
+
+        self.__start = start
+        self.__end = min(end, len(self.__mmap))
+        self.__pos = start
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.__end - self.__pos)
+        if size <= 0:
+            return 0
+
+        buffer[:size] = self.__view[self.__pos : self.__pos + size]
+        self.__pos += size
+
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = self.__start + offset
+        elif whence == io.SEEK_CUR:
+            pos = self.__pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.__end + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+
+        self.__pos = max(self.__start, min(pos, self.__end))
+
+        return self.tell()
+
+    def tell(self):
+        return self.__pos - self.__start
+
+    def close(self):
+        if not self.closed:
+            # the mmap cannot be closed while the view is exported
+            self.__view.release()
+            self.__mmap.close()
+
+        super().close()
+
+
+def open_mmap_text(file_path, encoding, start=0, end=None):
+    """
+    Open a byte range of a file as a text stream that decodes the data lazily
+    from a memory-mapped view of the file.
+    """
+
+    return io.TextIOWrapper(io.BufferedReader(MmapReader(file_path, start, end)), encoding=encoding)
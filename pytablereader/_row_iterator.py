@@ -0,0 +1,56 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from ._common import iter_batches
+
+
+class RowIterator:
+    """
+    The base class of iterators to read data rows of a table one by one.
+    Headers and type hints are resolved when the instance is created,
+    data rows are read lazily while iterating.
+
+    .. py:attribute:: headers
+
+        Headers of the table.
+
+    .. py:attribute:: type_hints
+
+        Type hints for each column that resolved from the loader
+        ``type_hints``/``type_hint_rules``.
+
+    .. py:attribute:: batch_size
+
+        The number of rows to yield at once.
+        Yield a list of at most ``batch_size`` rows for each iteration
+        if the value is a positive integer, otherwise yield a row for each
+        iteration.
+    """
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def type_hints(self):
+        return self._type_hints
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+    def __init__(self, rows, batch_size=None):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch size must be greater than zero: actual={batch_size}")
+
+        self._rows = iter(rows)
+        self._headers = []
+        self._type_hints = []
+        self.__batch_size = batch_size
+
+    def __iter__(self):
+        if self.batch_size:
+            return iter_batches(self._rows, self.batch_size)
+
+        return self._rows
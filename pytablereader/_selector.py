@@ -0,0 +1,79 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import re
+
+
+class TableSelector:
+    """
+    A class to select tables to load from documents that include multiple
+    tables, such as HTML/Markdown/MediaWiki documents.
+    A table is selected if the table matches all of the specified conditions.
+    Tables that do not match are skipped without converting the rows of the tables.
+
+    :param int index:
+        Zero-based index of a table in the document.
+        All of the tables in the document are counted, including empty tables.
+    :param str table_id: ``id`` attribute of a table.
+    :param caption:
+        Regular expression pattern to search in the caption of a table.
+        Tables without captions do not match.
+    :type caption: str or re.Pattern
+    :param headers:
+        Header names that a table must include.
+    :type headers: list of str
+
+    :Examples:
+        .. code:: python
+
+            import pytablereader as ptr
+
+            loader = ptr.HtmlTableFileLoader("sample.html")
+            loader.table_selector = ptr.TableSelector(caption=r"^Population")
+
+            for table_data in loader.load():
+                print(table_data)
+    """
+
+    def __init__(self, index=None, table_id=None, caption=None, headers=None):
+        if index is not None and index < 0:
+            raise ValueError(f"index must be greater than or equal to zero: actual={index}")
+
+        self.index = index
+        self.table_id = table_id
+        self.caption = re.compile(caption) if isinstance(caption, str) else caption
+        self.headers = frozenset(headers) if headers is not None else None
+
+    def is_match_table(self, index, table_id, caption):
+        """
+        :param int index: Zero-based index of the table in the document.
+        :param str table_id: ``id`` of the table. |None| if not present.
+        :param str caption: Caption text of the table. |None| if not present.
+        :return: |True| if the table matches the conditions except for ``headers``.
+        :rtype: bool
+        """
+
+        if self.index is not None and index != self.index:
+            return False
+
+        if self.table_id is not None and table_id != self.table_id:
+            return False
+
+        if self.caption is not None:
+            if caption is None or self.caption.search(caption.strip()) is None:
+                return False
+
+        return True
+
+    def is_match_headers(self, headers):
+        """
+        :param list headers: Headers of the table.
+        :return: |True| if the headers include all of the ``headers`` condition.
+        :rtype: bool
+        """
+
+        if self.headers is None:
+            return True
+
+        return self.headers.issubset(headers)
@@ -0,0 +1,180 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import codecs
+import csv
+import io
+
+import typepy
+from mbstrdecoder import MultiByteStrDecoder
+
+from pytablereader import DataError
+
+from .._mmap import open_mmap_text
+
+
+MIN_RANGE_SIZE = 1024 * 1024
+_READ_SIZE = 1024 * 1024
+
+# encodings that never include ASCII bytes in multibyte sequences
+_ASCII_SAFE_CODEC_PREFIXES = ("ascii", "utf-8", "iso8859", "cp125", "koi8", "mac-", "euc_")
+
+# encodings that may include bytes greater than or equal to 0x40 as trailing bytes
+_LEAD_TRAIL_CODECS = ("big5", "cp932", "cp949", "cp950", "gb18030", "gbk", "shift_jis")
+
+
+def make_csv_reader(stream, delimiter, quotechar):
+    return csv.reader(
+        stream,
+        delimiter=delimiter,
+        quotechar=quotechar,
+        strict=True,
+        skipinitialspace=True,
+    )
+
+
+def to_unicode(data):
+    if isinstance(data, str):
+        # items are already decoded when read from a text stream
+        return data
+
+    return MultiByteStrDecoder(data).unicode_str
+
+
+def modify_item(data, type_hint):
+    if type_hint:
+        try:
+            return type_hint(data).convert()
+        except typepy.TypeConversionError:
+            pass
+
+    return to_unicode(data)
+
+
+def iter_data_rows(csv_reader, type_hints, has_header_row=False):
+    """
+    :param bool has_header_row:
+        If |True|, the first row is a header row: the row is yielded
+        without applying ``type_hints``.
+    """
+
+    # resolve type hints for each column index once instead of for each cell
+    col_type_hints = {col: type_hint for col, type_hint in enumerate(type_hints or []) if type_hint}
+
+    try:
+        for row in csv_reader:
+            if not row:
+                continue
+
+            if has_header_row or not col_type_hints:
+                has_header_row = False
+                yield [to_unicode(data) for data in row]
+                continue
+
+            yield [modify_item(data, col_type_hints.get(col)) for col, data in enumerate(row)]
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise DataError(e)
+
+
+def is_splittable(encoding, quotechar):
+    """
+    Return |True| if record boundaries of CSV data that encoded with the
+    ``encoding`` can be found by scanning bytes of newlines and ``quotechar``.
+    """
+
+    try:
+        codec_name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+
+    if ord(quotechar) >= 0x80:
+        return False
+
+    if codec_name.startswith(_ASCII_SAFE_CODEC_PREFIXES):
+        return True
+
+    if codec_name in _LEAD_TRAIL_CODECS:
+        return ord(quotechar) < 0x30
+
+    return False
+
+
+def split_byte_ranges(file_path, quotechar, range_size):
+    """
+    Split a CSV file into byte ranges. Each range starts at the beginning of
+    a record: newlines within quoted fields are not treated as boundaries.
+
+    :return: List of ``(start, end)`` byte offsets.
+    """
+
+    quote = quotechar.encode("ascii")
+    ranges = []
+    start = 0
+    split_at = range_size
+    offset = 0
+    in_quote = 0
+
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(_READ_SIZE)
+            if not block:
+                break
+
+            pos = 0
+            while split_at < offset + len(block):
+                search_from = max(split_at - offset, pos)
+                in_quote ^= block.count(quote, pos, search_from) & 1
+                pos = search_from
+
+                newline_idx = block.find(b"\n", pos)
+                while newline_idx != -1:
+                    in_quote ^= block.count(quote, pos, newline_idx) & 1
+                    pos = newline_idx + 1
+                    if not in_quote:
+                        break
+
+                    newline_idx = block.find(b"\n", pos)
+
+                if newline_idx == -1:
+                    # continue to search a boundary from the next block
+                    split_at = offset + len(block)
+                    break
+
+                ranges.append((start, offset + pos))
+                start = offset + pos
+                split_at = start + range_size
+
+            in_quote ^= block.count(quote, pos) & 1
+            offset += len(block)
+
+    if start < offset:
+        ranges.append((start, offset))
+
+    return ranges
+
+
+def parse_byte_range(
+    file_path,
+    encoding,
+    start,
+    end,
+    delimiter,
+    quotechar,
+    type_hints,
+    use_mmap=False,
+    has_header_row=False,
+):
+    if use_mmap:
+        stream = open_mmap_text(file_path, encoding, start, end)
+    else:
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            stream = io.TextIOWrapper(io.BytesIO(f.read(end - start)), encoding=encoding)
+
+    with stream:
+        return list(
+            iter_data_rows(
+                make_csv_reader(stream, delimiter, quotechar), type_hints, has_header_row
+            )
+        )
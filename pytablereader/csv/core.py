@@ -2,20 +2,31 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import csv
 import io
+import os.path
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import typepy
 from mbstrdecoder import MultiByteStrDecoder
 
 from pytablereader import DataError
 
-from .._common import get_file_encoding
+from .._common import get_file_encoding, open_text_file
 from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
+from .._row_iterator import RowIterator
 from .._validator import FileValidator, TextValidator
 from ..interface import AbstractTableReader
+from ._parser import (
+    MIN_RANGE_SIZE,
+    is_splittable,
+    iter_data_rows,
+    make_csv_reader,
+    parse_byte_range,
+    split_byte_ranges,
+)
 from .formatter import CsvTableFormatter
 
 
@@ -43,6 +54,14 @@ class CsvTableLoader(AbstractTableReader):
     .. py:attribute:: encoding
 
         Encoding of the CSV data.
+
+    .. py:attribute:: chunk_size
+
+        The maximum number of data rows for each |TableData|.
+        If the value is a positive integer, :py:meth:`load` splits the data
+        into multiple |TableData| instances that share the same headers
+        and type hints.
+        Defaults to |None| (load all of the rows into a |TableData|).
     """
 
     @property
@@ -86,25 +105,38 @@ class CsvTableLoader(AbstractTableReader):
         self.delimiter = ","
         self.quotechar = '"'
         self.encoding = None
+        self.chunk_size = None
+
+    def _make_csv_reader(self, stream):
+        return make_csv_reader(stream, self.delimiter, self.quotechar)
 
     def _to_data_matrix(self):
-        try:
-            return [
-                [self.__modify_item(data, col) for col, data in enumerate(row)]
-                for row in self._csv_reader
-                if typepy.is_not_empty_sequence(row)
-            ]
-        except (csv.Error, UnicodeDecodeError) as e:
-            raise DataError(e)
+        return list(self._iter_data_matrix(self.type_hints))
+
+    def _iter_data_matrix(self, type_hints):
+        return iter_data_rows(self._csv_reader, type_hints, self._has_header_row())
+
+    def _has_header_row(self):
+        return typepy.is_empty_sequence(self.headers)
+
+
+class CsvRowIterator(RowIterator):
+    """
+    An iterator class to read data rows of CSV data one by one.
+    :py:attr:`~.RowIterator.headers` are the ``headers`` of the loader if the
+    loader has headers, otherwise the first line of the CSV data.
+    Values of the rows are converted with :py:attr:`~.RowIterator.type_hints`.
+    """
+
+    def __init__(self, loader, rows, batch_size=None):
+        super().__init__(rows, batch_size)
 
-    def __modify_item(self, data, col: int):
-        if self.type_hints and (col in self.type_hints):
-            try:
-                return self.type_hints[col](data).convert()
-            except typepy.TypeConversionError:
-                pass
+        formatter = CsvTableFormatter(rows)
+        formatter.accept(loader)
 
-        return MultiByteStrDecoder(data).unicode_str
+        self._headers = formatter._to_headers(self._rows)
+        self._type_hints = formatter._extract_type_hints(self._headers)
+        self._rows = iter_data_rows(self._rows, self._type_hints)
 
 
 class CsvTableFileLoader(CsvTableLoader):
@@ -115,7 +147,27 @@ class CsvTableFileLoader(CsvTableLoader):
 
     .. py:attribute:: table_name
 
-        Table name string. Defaults to ``%(filename)s``.
+        Table name string. Defaults to ``%(filename)s``,
+        or ``%(filename)s_%(format_id)s`` if
+        :py:attr:`~.CsvTableLoader.chunk_size` is set.
+
+    .. py:attribute:: max_workers
+
+        Maximum number of processes to parse the CSV file in parallel.
+        If the value is greater than one, :py:meth:`load` splits the file
+        into byte ranges at record boundaries and parses the ranges
+        with a process pool.
+        The file is parsed sequentially if the file is not a regular file,
+        or the encoding of the file is not splittable by bytes (e.g. UTF-16).
+        If a byte range fails to parse, the rest of the file from the range
+        is parsed sequentially.
+        Defaults to |None| (parse sequentially).
+
+    .. py:attribute:: use_mmap
+
+        If |True|, read the CSV file through a memory-mapped view of the file
+        and decode the data lazily. Repeated loads of the same file are served
+        from the OS page cache. Defaults to |False|.
 
     :Examples:
         :ref:`example-csv-table-loader`
@@ -124,6 +176,9 @@ class CsvTableFileLoader(CsvTableLoader):
     def __init__(self, file_path, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
+        self.max_workers = None
+        self.use_mmap = False
+
         self._validator = FileValidator(file_path)
         self._logger = FileSourceLogger(self)
 
@@ -144,6 +199,12 @@ class CsvTableFileLoader(CsvTableLoader):
             ``%(format_id)s``    |format_id_desc|
             ``%(global_id)s``    |global_id|
             ===================  ========================================
+
+            If :py:attr:`~.CsvTableLoader.chunk_size` is set, the file is read
+            lazily and a |TableData| is created for each chunk of rows.
+            ``%(format_id)s``/``%(global_id)s`` are incremented for each chunk,
+            and the default table name is ``%(filename)s_%(format_id)s``
+            to make a distinct table name for each chunk.
         :rtype: |TableData| iterator
         :raises pytablereader.DataError:
             If the CSV data is invalid.
@@ -156,20 +217,121 @@ class CsvTableFileLoader(CsvTableLoader):
         self._logger.logging_load()
         self.encoding = get_file_encoding(self.source, self.encoding)
 
-        self._csv_reader = csv.reader(
-            open(self.source, encoding=self.encoding),
-            delimiter=self.delimiter,
-            quotechar=self.quotechar,
-            strict=True,
-            skipinitialspace=True,
-        )
-
-        formatter = CsvTableFormatter(self._to_data_matrix())
+        if self.__is_parallel():
+            formatter = CsvTableFormatter(self._iter_parallel_data_matrix())
+        elif self.chunk_size:
+            formatter = CsvTableFormatter(self._iter_file_data_matrix(self.type_hints))
+        else:
+            with open_text_file(self.source, self.encoding, self.use_mmap) as fp:
+                self._csv_reader = self._make_csv_reader(fp)
+                formatter = CsvTableFormatter(self._to_data_matrix())
         formatter.accept(self)
 
         return formatter.to_table_data()
 
+    def iter_rows(self, batch_size=None):
+        """
+        Read data rows from a CSV file lazily.
+        Unlike :py:meth:`.load`, the whole file is not loaded into memory:
+        rows are read from the file while iterating.
+
+        :param int batch_size:
+            The number of rows to yield at once.
+            Yield rows one by one if the value is |None|.
+        :return:
+            Row iterator that has the resolved ``headers`` and ``type_hints``.
+        :rtype: :py:class:`~pytablereader.csv.core.CsvRowIterator`
+        :raises pytablereader.DataError:
+            If the CSV data is invalid.
+        :raises ValueError:
+            If the ``batch_size`` is less than one.
+
+        :Example:
+            .. code:: python
+
+                loader = ptr.CsvTableFileLoader("large.csv")
+                row_iter = loader.iter_rows(batch_size=10000)
+
+                print(row_iter.headers)
+                for rows in row_iter:
+                    ...
+        """
+
+        self._validate()
+        self._logger.logging_load()
+        self.encoding = get_file_encoding(self.source, self.encoding)
+
+        # rows are converted by the iterator with the resolved type hints
+        return CsvRowIterator(self, self._iter_file_data_matrix(None), batch_size)
+
+    def _iter_file_data_matrix(self, type_hints):
+        with open_text_file(self.source, self.encoding, self.use_mmap) as fp:
+            self._csv_reader = self._make_csv_reader(fp)
+
+            yield from self._iter_data_matrix(type_hints)
+
+    def _iter_parallel_data_matrix(self):
+        range_size = max(os.path.getsize(self.source) // (self.max_workers * 4) + 1, MIN_RANGE_SIZE)
+        byte_ranges = split_byte_ranges(self.source, self.quotechar, range_size)
+
+        if len(byte_ranges) <= 1:
+            yield from self._iter_file_data_matrix(self.type_hints)
+            return
+
+        has_header_row = self._has_header_row()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            # executor.map returns the results in the order of the byte ranges
+            data_matrices = executor.map(
+                parse_byte_range,
+                repeat(self.source),
+                repeat(self.encoding),
+                [start for start, _end in byte_ranges],
+                [end for _start, end in byte_ranges],
+                repeat(self.delimiter),
+                repeat(self.quotechar),
+                repeat(self.type_hints),
+                repeat(self.use_mmap),
+                # only the first range includes the header row
+                [has_header_row] + [False] * (len(byte_ranges) - 1),
+            )
+
+            for range_idx, (start, _end) in enumerate(byte_ranges):
+                try:
+                    data_matrix = next(data_matrices)
+                except DataError:
+                    # a quote character within an unquoted field (e.g. 5" screen)
+                    # misleads the quote parity of split_byte_ranges.
+                    # the preceding ranges end at valid record boundaries:
+                    # parse the rest of the file sequentially.
+                    break
+
+                yield from data_matrix
+            else:
+                return
+
+        yield from parse_byte_range(
+            self.source,
+            self.encoding,
+            start,
+            os.path.getsize(self.source),
+            self.delimiter,
+            self.quotechar,
+            self.type_hints,
+            self.use_mmap,
+            has_header_row and range_idx == 0,
+        )
+
+    def __is_parallel(self):
+        if not self.max_workers or self.max_workers <= 1:
+            return False
+
+        return os.path.isfile(self.source) and is_splittable(self.encoding, self.quotechar)
+
     def _get_default_table_name_template(self):
+        if self.chunk_size:
+            return f"{tnt.FILENAME:s}_{tnt.FORMAT_ID:s}"
+
         return tnt.FILENAME
 
 
@@ -221,13 +383,7 @@ class CsvTableTextLoader(CsvTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        self._csv_reader = csv.reader(
-            io.StringIO(self.source.strip()),
-            delimiter=self.delimiter,
-            quotechar=self.quotechar,
-            strict=True,
-            skipinitialspace=True,
-        )
+        self._csv_reader = self._make_csv_reader(io.StringIO(self.source.strip()))
         formatter = CsvTableFormatter(self._to_data_matrix())
         formatter.accept(self)
 
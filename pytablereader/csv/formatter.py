@@ -7,35 +7,59 @@ from tabledata import TableData
 
 from pytablereader import DataError
 
+from .._common import iter_batches
 from ..formatter import TableFormatter
 
 
 class CsvTableFormatter(TableFormatter):
     def to_table_data(self):
-        if typepy.is_empty_sequence(self._loader.headers):
-            headers = self._source_data[0]
+        rows = iter(self._source_data)
+        headers = self._to_headers(rows)
+        type_hints = self._extract_type_hints(headers)
 
-            if any([typepy.is_null_string(header) for header in headers]):
-                raise DataError(
-                    "the first line includes empty string item."
-                    "all of the items should contain header name."
-                    "actual={}".format(headers)
-                )
-
-            data_matrix = self._source_data[1:]
+        if self._loader.chunk_size:
+            data_matrices = iter_batches(rows, self._loader.chunk_size)
         else:
-            headers = self._loader.headers
-            data_matrix = self._source_data
+            data_matrices = iter([list(rows)])
+
+        table_count = 0
+        for data_matrix in data_matrices:
+            if not data_matrix:
+                break
+
+            self._loader.inc_table_count()
+            table_count += 1
+
+            yield TableData(
+                self._loader.make_table_name(),
+                headers,
+                data_matrix,
+                dp_extractor=self._loader.dp_extractor,
+                type_hints=type_hints,
+            )
 
-        if not data_matrix:
+        if table_count == 0:
             raise DataError("data row must be greater or equal than one")
 
-        self._loader.inc_table_count()
+    def _to_headers(self, rows):
+        """
+        Return headers of the table. The first row will be consumed from
+        ``rows`` as headers if the loader has no headers.
+        """
+
+        if typepy.is_not_empty_sequence(self._loader.headers):
+            return self._loader.headers
+
+        try:
+            headers = next(rows)
+        except StopIteration:
+            raise DataError("source data is empty")
+
+        if any([typepy.is_null_string(header) for header in headers]):
+            raise DataError(
+                "the first line includes empty string item."
+                "all of the items should contain header name."
+                "actual={}".format(headers)
+            )
 
-        yield TableData(
-            self._loader.make_table_name(),
-            headers,
-            data_matrix,
-            dp_extractor=self._loader.dp_extractor,
-            type_hints=self._extract_type_hints(headers),
-        )
+        return headers
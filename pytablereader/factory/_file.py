@@ -2,9 +2,7 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from mbstrdecoder import detect_file_encoding
-
-from .._common import get_extension
+from .._common import get_extension, get_file_encoding
 from .._logger import logger
 from ..csv.core import CsvTableFileLoader
 from ..html.core import HtmlTableFileLoader
@@ -22,6 +20,14 @@ from ._base import BaseTableLoaderFactory
 class TableFileLoaderFactory(BaseTableLoaderFactory):
     """
     :param str file_path: Path to the loading file.
+    :param str encoding:
+        Encoding of the file.
+        If the value is |None|, the encoding is detected from the file.
+        The encoding is passed to the created loader, so that the file is
+        not scanned again by the loader.
+    :param pytablereader.EncodingDetector encoding_detector:
+        Detector used to detect the encoding of the file.
+        Use a detector with the default settings if |None|.
     :raises pytablereader.InvalidFilePathError:
         If the ``file_path`` is an empty path.
     """
@@ -35,10 +41,9 @@ class TableFileLoaderFactory(BaseTableLoaderFactory):
 
         return get_extension(self.source)
 
-    def __init__(self, source, encoding=None):
+    def __init__(self, source, encoding=None, encoding_detector=None):
         if not encoding and source:
-            encoding = detect_file_encoding(source)
-            logger.debug(f"detect encoding: file={source}, encoding={encoding}")
+            encoding = get_file_encoding(source, encoding, encoding_detector)
 
         super().__init__(source, encoding)
 
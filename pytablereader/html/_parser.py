@@ -0,0 +1,194 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from collections import deque
+from html.parser import HTMLParser
+
+
+class HtmlTableCell:
+    def __init__(self, tag):
+        self.tag = tag
+        self.texts = []
+
+    @property
+    def text(self):
+        return "".join(self.texts)
+
+
+class HtmlTable:
+    """
+    Table data that extracted from a ``<table>`` element.
+
+    :ivar str id: ``id`` attribute of the table tag. |None| if not present.
+    :ivar caption:
+        The first ``<caption>`` element of the descendants of the table.
+        |None| if not present.
+    :ivar list rows:
+        ``<tr>`` elements of the descendants of the table in document order.
+        Each row is a list of ``<td>``/``<th>`` cells of the descendants of the row.
+    """
+
+    def __init__(self, table_id):
+        self.id = table_id
+        self.caption = None
+        self.rows = []
+        self.is_closed = False
+
+
+class _TableContext:
+    def __init__(self, table):
+        self.table = table
+        self.row = None
+        self.cell = None
+        self.caption = None
+
+
+class HtmlTableParser(HTMLParser):
+    """
+    An event-driven parser that extracts tables from HTML documents.
+    Only text of table cells, captions and the title of the document are kept:
+    no document tree is built.
+    Tables can be extracted incrementally by feeding a document chunk by chunk
+    and calling :py:meth:`pop_tables`.
+
+    Descendant ``<tr>``/``<td>``/``<th>`` elements of nested tables belong to
+    the outer tables too, as ``find_all`` of BeautifulSoup does.
+    End tags of ``<tr>``/``<td>``/``<th>`` may be omitted.
+    """
+
+    @property
+    def title(self):
+        """
+        Text of the first ``<title>`` element of the document.
+        |None| until the element is closed.
+        """
+
+        return self.__title
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+
+        self.__title = None
+        self.__title_texts = None
+        self.__contexts = []
+
+        # tables in the order of the start tags
+        self.__tables = deque()
+
+    def pop_tables(self):
+        """
+        Return the closed tables in document order.
+        Tables that follow an unclosed table are kept until the table is closed.
+        """
+
+        tables = []
+        while self.__tables and self.__tables[0].is_closed:
+            tables.append(self.__tables.popleft())
+
+        return tables
+
+    def close(self):
+        super().close()
+
+        self.__end_title()
+
+        while self.__contexts:
+            self.__end_table()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            table = HtmlTable(self.__get_id(attrs))
+            self.__tables.append(table)
+            self.__contexts.append(_TableContext(table))
+        elif tag == "tr":
+            self.__start_row()
+        elif tag in ("td", "th"):
+            self.__start_cell(tag)
+        elif tag == "caption":
+            self.__start_caption()
+        elif tag == "title" and self.__title is None and self.__title_texts is None:
+            self.__title_texts = []
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self.__end_title()
+            return
+
+        if not self.__contexts:
+            return
+
+        if tag == "table":
+            self.__end_table()
+        elif tag == "tr":
+            self.__end_row()
+        elif tag in ("td", "th"):
+            self.__contexts[-1].cell = None
+        elif tag == "caption":
+            self.__contexts[-1].caption = None
+
+    def handle_data(self, data):
+        for context in self.__contexts:
+            if context.cell is not None:
+                context.cell.texts.append(data)
+            if context.caption is not None:
+                context.caption.texts.append(data)
+
+        if self.__title is None and self.__title_texts is not None:
+            self.__title_texts.append(data)
+
+    @staticmethod
+    def __get_id(attrs):
+        for name, value in attrs:
+            if name == "id":
+                return value or ""
+
+        return None
+
+    def __start_row(self):
+        if not self.__contexts:
+            return
+
+        # a row start closes the previous row of the innermost table
+        row = []
+        innermost_context = self.__contexts[-1]
+        innermost_context.cell = None
+        innermost_context.row = row
+
+        for context in self.__contexts:
+            context.table.rows.append(row)
+
+    def __start_cell(self, tag):
+        if not self.__contexts or self.__contexts[-1].row is None:
+            return
+
+        # a cell start closes the previous cell of the innermost table
+        cell = HtmlTableCell(tag)
+        self.__contexts[-1].cell = cell
+
+        for context in self.__contexts:
+            if context.row is not None:
+                context.row.append(cell)
+
+    def __start_caption(self):
+        if not self.__contexts:
+            return
+
+        caption = HtmlTableCell("caption")
+        self.__contexts[-1].caption = caption
+
+        for context in self.__contexts:
+            if context.table.caption is None:
+                context.table.caption = caption
+
+    def __end_row(self):
+        context = self.__contexts[-1]
+        context.cell = None
+        context.row = None
+
+    def __end_table(self):
+        self.__contexts.pop().table.is_closed = True
+
+    def __end_title(self):
+        if self.__title is None and self.__title_texts is not None:
+            self.__title = "".join(self.__title_texts)
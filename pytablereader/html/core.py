@@ -19,6 +19,13 @@ class HtmlTableLoader(AbstractTableReader):
     def format_name(self):
         return "html"
 
+    def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
+        super().__init__(source, quoting_flags, type_hints, type_hint_rules)
+
+        self.streaming = False
+        self.table_selector = None
+        self.parse_tables_only = False
+
     def _get_default_table_name_template(self):
         return f"{tnt.TITLE:s}_{tnt.KEY:s}"
 
@@ -33,9 +40,28 @@ class HtmlTableFileLoader(HtmlTableLoader):
 
         Table name string. Defaults to ``%(title)s_%(key)s``.
 
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
     .. py:attribute:: encoding
 
         HTML file encoding. Defaults to ``"utf-8"``.
+
+    .. py:attribute:: streaming
+
+        If |True|, read the file chunk by chunk and extract tables with
+        an event-driven parser instead of building a BeautifulSoup tree of
+        the whole document. Only text of tables and the title is kept in
+        the memory. Defaults to |False|.
+
+    .. py:attribute:: parse_tables_only
+
+        If |True|, build the BeautifulSoup tree only from ``<title>`` and
+        ``<table>`` elements and their descendants, and skip the other nodes
+        of the document. Ignored when ``streaming`` is |True|.
+        Defaults to |False|.
     """
 
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
@@ -83,12 +109,24 @@ class HtmlTableFileLoader(HtmlTableLoader):
         self._logger.logging_load()
         self.encoding = get_file_encoding(self.source, self.encoding)
 
+        if self.streaming:
+            return self.__load_stream()
+
         with open(self.source, encoding=self.encoding) as fp:
-            formatter = HtmlTableFormatter(fp.read(), self._logger)
+            formatter = HtmlTableFormatter(
+                fp.read(), self._logger, parse_tables_only=self.parse_tables_only
+            )
         formatter.accept(self)
 
         return formatter.to_table_data()
 
+    def __load_stream(self):
+        with open(self.source, encoding=self.encoding) as fp:
+            formatter = HtmlTableFormatter(fp, self._logger, streaming=True)
+            formatter.accept(self)
+
+            yield from formatter.to_table_data()
+
 
 class HtmlTableTextLoader(HtmlTableLoader):
     """
@@ -99,6 +137,24 @@ class HtmlTableTextLoader(HtmlTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(title)s_%(key)s``.
+
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
+    .. py:attribute:: streaming
+
+        If |True|, extract tables with an event-driven parser instead of
+        building a BeautifulSoup tree of the whole document.
+        Defaults to |False|.
+
+    .. py:attribute:: parse_tables_only
+
+        If |True|, build the BeautifulSoup tree only from ``<title>`` and
+        ``<table>`` elements and their descendants, and skip the other nodes
+        of the document. Ignored when ``streaming`` is |True|.
+        Defaults to |False|.
     """
 
     def __init__(self, text, quoting_flags=None, type_hints=None, type_hint_rules=None):
@@ -139,7 +195,12 @@ class HtmlTableTextLoader(HtmlTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        formatter = HtmlTableFormatter(self.source, self._logger)
+        formatter = HtmlTableFormatter(
+            self.source,
+            self._logger,
+            streaming=self.streaming,
+            parse_tables_only=self.parse_tables_only,
+        )
         formatter.accept(self)
 
         return formatter.to_table_data()
@@ -2,6 +2,7 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import abc
 import re
 
 import bs4
@@ -13,9 +14,19 @@ from pytablereader import DataError
 from .._constant import TableNameTemplate as tnt
 from .._logger import NullSourceLogger
 from ..formatter import TableFormatter
+from ._parser import HtmlTableParser
 
 
-class HtmlTableFormatter(TableFormatter):
+_READ_SIZE = 64 * 1024
+_STRAINED_TAGS = ("title", "table")
+
+
+class TableElementFormatter(TableFormatter):
+    """
+    The abstract class of formatters that convert table elements of documents,
+    such as ``<table>`` elements of HTML, to |TableData|.
+    """
+
     @property
     def table_id(self):
         return self.__table_id
@@ -29,19 +40,36 @@ class HtmlTableFormatter(TableFormatter):
             self.__logger = NullSourceLogger(None)
 
         self.__table_id = None
+        self._title = ""
 
         if typepy.is_null_string(source_data):
             raise DataError
 
-        try:
-            self.__soup = bs4.BeautifulSoup(self._source_data, "lxml")
-        except bs4.FeatureNotFound:
-            self.__soup = bs4.BeautifulSoup(self._source_data, "html.parser")
+    @abc.abstractmethod
+    def _iter_tables(self):  # pragma: no cover
+        """
+        :return:
+            Iterator of ``(id, caption, rows)`` tuples of tables in document order.
+            ``id``/``caption`` is |None| if not present.
+            Each row is a list of ``(tag, text)`` tuples of the cells,
+            where ``tag`` is ``"th"`` for header cells and ``"td"`` for data cells.
+        """
 
     def to_table_data(self):
-        for table in self.__soup.find_all("table"):
+        selector = self._loader.table_selector
+
+        for index, (table_id, caption, rows) in enumerate(self._iter_tables()):
+            if selector is not None:
+                if selector.index is not None and index > selector.index:
+                    break
+
+                if not selector.is_match_table(index, table_id, caption):
+                    continue
+
+            self.__table_id = self.__to_table_id(table_id, caption)
+
             try:
-                table_data = self.__parse_html(table)
+                table_data = self.__to_table_data(rows, selector)
             except ValueError:
                 continue
 
@@ -59,52 +87,48 @@ class HtmlTableFormatter(TableFormatter):
         if typepy.is_null_string(key):
             key = self._loader.get_format_key()
 
-        try:
-            title = self.__soup.title.text
-        except AttributeError:
-            title = ""
-
         kv_mapping = self._loader._get_basic_tablename_keyvalue_mapping()
-        kv_mapping.update(OrderedDict([(tnt.KEY, key), (tnt.TITLE, title)]))
+        kv_mapping.update(OrderedDict([(tnt.KEY, key), (tnt.TITLE, self._title)]))
 
         return self._loader._expand_table_name_format(kv_mapping)
 
-    def __parse_tag_id(self, table):
-        self.__table_id = table.get("id")
+    @staticmethod
+    def __to_table_id(table_id, caption):
+        if table_id is None and caption is not None:
+            caption = caption.strip()
+            if typepy.is_not_null_string(caption):
+                return caption
 
-        if self.__table_id is None:
-            caption = table.find("caption")
-            if caption is not None:
-                caption = caption.text.strip()
-                if typepy.is_not_null_string(caption):
-                    self.__table_id = caption
+        return table_id
 
-    def __parse_html(self, table):
+    def __to_table_data(self, rows, selector):
         headers = []
         data_matrix = []
 
-        self.__parse_tag_id(table)
-
-        rows = table.find_all("tr")
-        re_table_val = re.compile("td|th")
-        for row in rows:
-            td_list = row.find_all("td")
+        for cells in rows:
+            td_list = [text for tag, text in cells if tag == "td"]
             if typepy.is_empty_sequence(td_list):
                 if typepy.is_not_empty_sequence(headers):
                     continue
 
-                th_list = row.find_all("th")
+                th_list = [text for tag, text in cells if tag == "th"]
                 if typepy.is_empty_sequence(th_list):
                     continue
 
-                headers = [row.text.strip() for row in th_list]
+                headers = [text.strip() for text in th_list]
+                if selector is not None and not selector.is_match_headers(headers):
+                    raise ValueError("headers do not match the selector")
+
                 continue
 
-            data_matrix.append([value.get_text().strip() for value in row.find_all(re_table_val)])
+            data_matrix.append([text.strip() for _tag, text in cells])
 
         if typepy.is_empty_sequence(data_matrix):
             raise ValueError("data matrix is empty")
 
+        if selector is not None and not selector.is_match_headers(headers):
+            raise ValueError("headers do not match the selector")
+
         self._loader.inc_table_count()
 
         return TableData(
@@ -114,3 +138,92 @@ class HtmlTableFormatter(TableFormatter):
             dp_extractor=self._loader.dp_extractor,
             type_hints=self._extract_type_hints(headers),
         )
+
+
+class HtmlTableFormatter(TableElementFormatter):
+    """
+    :param source_data: HTML text, or a text stream when ``streaming`` is |True|.
+    :param bool streaming:
+        If |True|, extract tables with an event-driven parser that does not
+        build a document tree. Otherwise, parse the whole document with
+        BeautifulSoup.
+    :param bool parse_tables_only:
+        If |True|, build the BeautifulSoup tree only from ``<title>``/``<table>``
+        elements and their descendants. Ignored when ``streaming`` is |True|.
+    """
+
+    def __init__(self, source_data, logger=None, streaming=False, parse_tables_only=False):
+        super().__init__(source_data, logger=logger)
+
+        self.__streaming = streaming
+
+        if streaming:
+            return
+
+        parse_only = bs4.SoupStrainer(_STRAINED_TAGS) if parse_tables_only else None
+
+        try:
+            self.__soup = bs4.BeautifulSoup(self._source_data, "lxml", parse_only=parse_only)
+        except bs4.FeatureNotFound:
+            self.__soup = bs4.BeautifulSoup(self._source_data, "html.parser", parse_only=parse_only)
+
+        if self.__soup.title is not None:
+            self._title = self.__soup.title.text
+
+    def _iter_tables(self):
+        if self.__streaming:
+            return self.__iter_stream_tables()
+
+        return self.__iter_soup_tables()
+
+    def __iter_soup_tables(self):
+        re_table_val = re.compile("td|th")
+
+        for table in self.__soup.find_all("table"):
+            caption = table.find("caption")
+
+            yield (
+                table.get("id"),
+                caption.text if caption else None,
+                (
+                    [(cell.name, cell.get_text()) for cell in row.find_all(re_table_val)]
+                    for row in table.find_all("tr")
+                ),
+            )
+
+    def __iter_stream_tables(self):
+        parser = HtmlTableParser()
+
+        if isinstance(self._source_data, str):
+            chunks = (
+                self._source_data[i : i + _READ_SIZE]
+                for i in range(0, len(self._source_data), _READ_SIZE)
+            )
+        else:
+            chunks = iter(lambda: self._source_data.read(_READ_SIZE), "")
+
+        is_empty = True
+        for chunk in chunks:
+            is_empty = is_empty and typepy.is_null_string(chunk.strip())
+            parser.feed(chunk)
+
+            # tables are named with the title: wait until the title is found
+            if parser.title is not None:
+                self._title = parser.title
+                yield from self.__to_table_rows(parser.pop_tables())
+
+        parser.close()
+        if is_empty:
+            raise DataError
+
+        self._title = parser.title or ""
+
+        yield from self.__to_table_rows(parser.pop_tables())
+
+    def __to_table_rows(self, tables):
+        for table in tables:
+            yield (
+                table.id,
+                table.caption.text if table.caption else None,
+                ([(cell.tag, cell.text) for cell in row] for row in table.rows),
+            )
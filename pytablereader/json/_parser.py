@@ -0,0 +1,213 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import enum
+import re
+
+from .._common import json, json_loads
+from ..error import ValidationError
+
+
+_READ_SIZE = 64 * 1024
+_RE_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@enum.unique
+class JsonLayout(enum.Enum):
+    #: top-level array of records: the JSON schema (1)
+    RECORDS = 1
+
+    #: top-level object of arrays of records: the JSON schema (4)
+    TABLES = 2
+
+    #: the other layouts that require the whole document to convert
+    OTHER = 3
+
+
+class JsonStreamParser:
+    """
+    An incremental parser that walks the top-level array/object of
+    a JSON document from a text stream. Only a single item of the
+    top-level container is held in the memory at once.
+    """
+
+    def __init__(self, stream):
+        self.__stream = stream
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__is_eof = False
+
+        # consumed text is kept until iterations start to allow load_all
+        self.__is_discard = False
+
+    def detect_layout(self):
+        """
+        Detect the layout of the JSON document from the beginning of the
+        document without consuming the stream.
+        """
+
+        pos = self.__pos
+
+        try:
+            return self.__detect_layout()
+        finally:
+            self.__pos = pos
+
+    def iter_records(self):
+        """
+        Yield items of the top-level array.
+        """
+
+        self.__is_discard = True
+
+        yield from self.__iter_array()
+        self.__validate_end()
+
+    def iter_tables(self):
+        """
+        Yield pairs of a key and an iterator of items of the array value,
+        for each member of the top-level object.
+        The item iterator of a member is exhausted when the next member is read.
+        """
+
+        self.__is_discard = True
+
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.__pos += 1
+            self.__validate_end()
+            return
+
+        while True:
+            key = self.__decode_value()
+            if not isinstance(key, str):
+                raise ValidationError(f"invalid object key: {key}")
+
+            self.__expect(":")
+            if self.__peek() != "[":
+                raise ValidationError(f"the value of '{key}' is not an array")
+
+            items = self.__iter_array()
+            yield key, items
+
+            for _item in items:
+                pass
+
+            char = self.__next_char()
+            if char == "}":
+                break
+            if char != ",":
+                raise ValidationError(f"expected ',' or '}}': actual='{char}'")
+
+        self.__validate_end()
+
+    def load_all(self):
+        """
+        Load the whole JSON document.
+        Only available before iterations start.
+        """
+
+        while self.__fill():
+            pass
+
+        try:
+            return json_loads(self.__buffer)
+        except ValueError as e:
+            raise ValidationError(e)
+
+    def __detect_layout(self):
+        char = self.__next_char()
+        if char == "[":
+            return JsonLayout.RECORDS
+        if char != "{" or self.__peek() != '"':
+            return JsonLayout.OTHER
+
+        self.__decode_value()
+        if self.__next_char() != ":" or self.__next_char() != "[":
+            return JsonLayout.OTHER
+
+        if self.__peek() == "{":
+            return JsonLayout.TABLES
+
+        return JsonLayout.OTHER
+
+    def __iter_array(self):
+        self.__expect("[")
+        if self.__peek() == "]":
+            self.__pos += 1
+            return
+
+        while True:
+            yield self.__decode_value()
+
+            char = self.__next_char()
+            if char == "]":
+                return
+            if char != ",":
+                raise ValidationError(f"expected ',' or ']': actual='{char}'")
+
+    def __decode_value(self):
+        self.__peek()
+
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+            except ValueError as e:
+                if self.__fill():
+                    continue
+
+                raise ValidationError(e)
+
+            # a number at the end of the buffer may continue in the next read
+            if end == len(self.__buffer) and self.__fill():
+                continue
+
+            self.__pos = end
+
+            return value
+
+    def __peek(self):
+        while True:
+            self.__pos = _RE_WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+
+            if not self.__fill():
+                return ""
+
+    def __next_char(self):
+        char = self.__peek()
+        if char:
+            self.__pos += 1
+
+        return char
+
+    def __expect(self, expected):
+        char = self.__next_char()
+        if char != expected:
+            raise ValidationError(f"expected '{expected}': actual='{char}'")
+
+    def __validate_end(self):
+        char = self.__peek()
+        if char:
+            raise ValidationError(f"extra data after the JSON document: '{char}'")
+
+    def __fill(self):
+        if self.__is_eof:
+            return False
+
+        # read at least the size of the pending text to keep decoding retries linear
+        data = self.__stream.read(max(_READ_SIZE, len(self.__buffer) - self.__pos))
+        if not data:
+            self.__is_eof = True
+            return False
+
+        if self.__is_discard:
+            self.__buffer = self.__buffer[self.__pos :] + data
+            self.__pos = 0
+        else:
+            self.__buffer += data
+
+        return True
@@ -3,27 +3,41 @@
 """
 
 import abc
-from collections import OrderedDict
 
-from .._common import get_file_encoding, json
+from pytablereader import DataError
+
+from .._common import get_file_encoding, iter_batches, json_loads, open_text_file
 from .._constant import SourceType
 from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
 from .._validator import FileValidator, NullValidator, TextValidator
 from ..error import ValidationError
 from ..interface import AbstractTableReader
-from .formatter import JsonTableFormatter
+from ._parser import JsonLayout, JsonStreamParser
+from .formatter import JsonTableFormatter, MultipleJsonTableConverterA, SingleJsonTableConverterA
 
 
 class JsonTableLoader(AbstractTableReader, metaclass=abc.ABCMeta):
     """
     An abstract class of JSON table loaders.
+
+    .. py:attribute:: skip_validation
+
+        If |True|, skip the validation of the value types for each item of
+        the JSON data: only the structure of the data is validated to
+        detect the layout of tables. Use for trusted data sources.
+        Defaults to |False|.
     """
 
     @property
     def format_name(self):
         return "json"
 
+    def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
+        super().__init__(source, quoting_flags, type_hints, type_hint_rules)
+
+        self.skip_validation = False
+
     @abc.abstractmethod
     def load_dict(self):  # pragma: no cover
         pass
@@ -38,12 +52,42 @@ class JsonTableFileLoader(JsonTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(filename)s_%(key)s``.
+
+    .. py:attribute:: streaming
+
+        If |True|, :py:meth:`load` parses the JSON file incrementally:
+        records of the JSON schema (1) and (4) are read item by item from
+        the file, and the memory usage is bounded by a table
+        (or a chunk if :py:attr:`chunk_size` is set)
+        instead of the whole document.
+        The other JSON schemas are loaded as a whole even if the value is |True|.
+        The schema is detected from the first item of the document: if the first
+        member of an object is the JSON schema (4), all of the members must be
+        the JSON schema (4), otherwise ValidationError is raised
+        (load such data with |False|).
+        Tables that have no records are skipped in the streaming mode.
+        Items of the JSON schema (1) and (4) are decoded with the default
+        JSON backend in the streaming mode: :py:func:`~pytablereader.set_json_backend`
+        has no effect on them.
+        Defaults to |False|.
+
+    .. py:attribute:: chunk_size
+
+        The maximum number of records for each |TableData| when
+        :py:attr:`streaming` is |True|.
+        Headers of each |TableData| are extracted from the records of the chunk.
+        ``%(format_id)s``/``%(global_id)s`` are incremented for each chunk,
+        and the default table name of each chunk includes ``_%(format_id)s``
+        to make a distinct table name for each chunk.
+        Defaults to |None| (load all of the records of a table into a |TableData|).
     """
 
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
         self.encoding = None
+        self.streaming = False
+        self.chunk_size = None
 
         self._validator = FileValidator(file_path)
         self._logger = FileSourceLogger(self)
@@ -417,6 +461,13 @@ class JsonTableFileLoader(JsonTableLoader):
             If the data is not acceptable JSON format.
         """
 
+        if self.streaming:
+            self._validate()
+            self._logger.logging_load()
+            self.encoding = get_file_encoding(self.source, self.encoding)
+
+            return self.__load_stream()
+
         formatter = JsonTableFormatter(self.load_dict())
         formatter.accept(self)
 
@@ -429,10 +480,63 @@ class JsonTableFileLoader(JsonTableLoader):
 
         with open(self.source, encoding=self.encoding) as fp:
             try:
-                return json.load(fp, object_pairs_hook=OrderedDict)
+                return json_loads(fp.read())
             except ValueError as e:
                 raise ValidationError(e)
 
+    def __load_stream(self):
+        with open_text_file(self.source, self.encoding) as fp:
+            parser = JsonStreamParser(fp)
+            layout = parser.detect_layout()
+
+            if layout == JsonLayout.RECORDS:
+                table_count = 0
+                for chunk in self.__iter_chunks(parser.iter_records()):
+                    table_count += 1
+
+                    yield from self.__to_table_data(
+                        SingleJsonTableConverterA(chunk, is_chunk=bool(self.chunk_size))
+                    )
+
+                if table_count == 0:
+                    raise DataError("source data is empty")
+            elif layout == JsonLayout.TABLES:
+                yield from self.__load_stream_tables(parser)
+            else:
+                yield from self.__to_table_data(JsonTableFormatter(parser.load_all()))
+
+    def __load_stream_tables(self, parser):
+        # the layout is detected from the first member of the object:
+        # the other members are required to be the JSON schema (4) too
+        try:
+            for table_key, json_records in parser.iter_tables():
+                for chunk in self.__iter_chunks(json_records):
+                    yield from self.__to_table_data(
+                        MultipleJsonTableConverterA(
+                            {table_key: chunk}, is_chunk=bool(self.chunk_size)
+                        )
+                    )
+        except ValidationError as e:
+            raise ValidationError(
+                f"{e}: all of the tables must be the JSON schema (4) in the streaming mode. "
+                "load the file with streaming=False for the other schemas"
+            )
+
+    def __iter_chunks(self, json_records):
+        if self.chunk_size:
+            return iter_batches(json_records, self.chunk_size)
+
+        json_records = list(json_records)
+        if not json_records:
+            return iter([])
+
+        return iter([json_records])
+
+    def __to_table_data(self, formatter):
+        formatter.accept(self)
+
+        return formatter.to_table_data()
+
     def _get_default_table_name_template(self):
         return f"{tnt.FILENAME:s}_{tnt.KEY:s}"
 
@@ -496,7 +600,10 @@ class JsonTableTextLoader(JsonTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        return json.loads(self.source, object_pairs_hook=OrderedDict)
+        try:
+            return json_loads(self.source)
+        except ValueError as e:
+            raise ValidationError(e)
 
     def _get_default_table_name_template(self):
         return f"{tnt.KEY:s}"
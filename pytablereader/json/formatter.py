@@ -3,16 +3,86 @@
 """
 
 import abc
+import math
+import numbers
+from collections.abc import Sequence
 
 import jsonschema
+from jsonschema.validators import validator_for
 from tabledata import TableData
+from typepy import Bool, Integer, RealNumber
 
+from .._common import extract_headers
 from .._constant import SourceType
 from .._constant import TableNameTemplate as tnt
 from ..error import ValidationError
 from ..formatter import TableFormatter
 
 
+class ColumnarRows(Sequence):
+    """
+    A read-only sequence of rows that made from column-oriented data.
+    Each row is created from the columns only when it is accessed.
+    The number of rows is the length of the shortest column.
+    """
+
+    def __init__(self, columns):
+        self.__columns = columns
+        self.__num_rows = min((len(column) for column in columns), default=0)
+
+    def __len__(self):
+        return self.__num_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.__num_rows))]
+
+        if index < 0:
+            index += self.__num_rows
+        if not 0 <= index < self.__num_rows:
+            raise IndexError("row index out of range")
+
+        return tuple(column[index] for column in self.__columns)
+
+    def __iter__(self):
+        return zip(*self.__columns)
+
+
+def detect_column_type_hint(column):
+    """
+    Detect a type hint of a column from the Python types of the decoded JSON values.
+
+    :return:
+        A type hint if all of the non-null values of the column are
+        booleans, integers, or finite numbers. |None| otherwise.
+    """
+
+    value_types = set()
+    for value in column:
+        if value is None:
+            continue
+
+        value_type = type(value)
+        if value_type is float and not math.isfinite(value):
+            return None
+
+        value_types.add(value_type)
+
+    if not value_types:
+        return None
+
+    if value_types == {bool}:
+        return Bool
+
+    if value_types == {int}:
+        return Integer
+
+    if value_types <= {int, float}:
+        return RealNumber
+
+    return None
+
+
 class JsonConverter(TableFormatter):
     """
     The abstract class of JSON data converter.
@@ -28,23 +98,133 @@ class JsonConverter(TableFormatter):
         ]
     }
 
-    def __init__(self, json_buffer):
+    # Python types that correspond to the JSON types of _VALUE_TYPE_SCHEMA
+    _VALUE_TYPES = (str, numbers.Number, type(None), dict)
+
+    # schema validators that compiled for each (converter class, skip validation) pair
+    __validator_cache = {}
+
+    def __init__(self, json_buffer, is_chunk=False):
+        """
+        :param bool is_chunk:
+            |True| if the data is a chunk of a table:
+            the default table name includes ``%(format_id)s`` to make
+            a distinct table name for each chunk.
+        """
+
         self._buffer = json_buffer
+        self._is_chunk = is_chunk
 
     @abc.abstractproperty
     def _schema(self):  # pragma: no cover
         pass
 
+    @property
+    def _skip_validation(self):
+        # loaders of non-JSON formats that use JSON converters do not have the attribute
+        return getattr(self._loader, "skip_validation", False)
+
+    @property
+    def _value_type_schema(self):
+        if self._skip_validation:
+            return {}
+
+        return self._VALUE_TYPE_SCHEMA
+
+    @abc.abstractmethod
+    def _is_valid_data(self, data):  # pragma: no cover
+        # a fast check that equivalent to the validation with the _schema
+        pass
+
     def _validate_source_data(self):
         """
         :raises ValidationError:
         """
 
+        self._validate_data(self._buffer)
+
+    def _validate_data(self, data):
+        if self._is_valid_data(data):
+            return
+
+        # the schema validator is used to detect the cause of the invalid data
         try:
-            jsonschema.validate(self._buffer, self._schema)
+            self.__get_validator().validate(data)
         except jsonschema.ValidationError as e:
             raise ValidationError(e)
 
+    def _is_record(self, data):
+        if not isinstance(data, dict):
+            return False
+
+        if self._skip_validation:
+            return True
+
+        value_types = self._VALUE_TYPES
+
+        return all(isinstance(value, value_types) for value in data.values())
+
+    def _is_record_table(self, data):
+        return isinstance(data, list) and all(self._is_record(record) for record in data)
+
+    def _is_column_table(self, data):
+        if not isinstance(data, dict):
+            return False
+
+        if self._skip_validation:
+            return all(isinstance(column, list) for column in data.values())
+
+        value_types = self._VALUE_TYPES
+
+        return all(
+            isinstance(column, list) and all(isinstance(value, value_types) for value in column)
+            for column in data.values()
+        )
+
+    def _to_columnar_table_data(self, table_name, columns_mapping):
+        headers = sorted(columns_mapping.keys())
+        columns = [columns_mapping[header] for header in headers]
+
+        return TableData(
+            table_name,
+            headers,
+            ColumnarRows(columns),
+            dp_extractor=self._loader.dp_extractor,
+            type_hints=self._extract_column_type_hints(headers, columns),
+        )
+
+    def _extract_column_type_hints(self, headers, columns):
+        """
+        Extract type hints from the loader, and detect type hints from the
+        values of each column for the columns that have no type hint.
+        """
+
+        if self._loader.type_hints:
+            return self._loader.type_hints
+
+        type_hints = self._extract_type_hints(headers) or [None] * len(headers)
+
+        return [
+            type_hint or detect_column_type_hint(column)
+            for type_hint, column in zip(type_hints, columns)
+        ]
+
+    def __get_validator(self):
+        key = (self.__class__, self._skip_validation)
+
+        try:
+            return self.__validator_cache[key]
+        except KeyError:
+            pass
+
+        schema = self._schema
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        self.__validator_cache[key] = validator
+
+        return validator
+
 
 class SingleJsonTableConverterBase(JsonConverter):
     def _make_table_name(self):
@@ -52,7 +232,10 @@ class SingleJsonTableConverterBase(JsonConverter):
         kv_mapping[tnt.KEY] = self._loader.get_format_key()
 
         if self._loader.source_type == SourceType.FILE:
-            kv_mapping[tnt.DEFAULT] = tnt.FILENAME
+            if self._is_chunk:
+                kv_mapping[tnt.DEFAULT] = f"{tnt.FILENAME:s}_{tnt.FORMAT_ID:s}"
+            else:
+                kv_mapping[tnt.DEFAULT] = tnt.FILENAME
         elif self._loader.source_type == SourceType.TEXT:
             kv_mapping[tnt.DEFAULT] = tnt.KEY
 
@@ -68,9 +251,12 @@ class SingleJsonTableConverterA(SingleJsonTableConverterBase):
     def _schema(self):
         return {
             "type": "array",
-            "items": {"type": "object", "additionalProperties": self._VALUE_TYPE_SCHEMA},
+            "items": {"type": "object", "additionalProperties": self._value_type_schema},
         }
 
+    def _is_valid_data(self, data):
+        return self._is_record_table(data)
+
     def to_table_data(self):
         """
         :raises ValueError:
@@ -79,10 +265,7 @@ class SingleJsonTableConverterA(SingleJsonTableConverterBase):
 
         self._validate_source_data()
 
-        attr_name_set = set()
-        for json_record in self._buffer:
-            attr_name_set = attr_name_set.union(json_record.keys())
-        headers = sorted(attr_name_set)
+        headers = sorted(extract_headers(self._buffer))
 
         self._loader.inc_table_count()
 
@@ -104,9 +287,12 @@ class SingleJsonTableConverterB(SingleJsonTableConverterBase):
     def _schema(self):
         return {
             "type": "object",
-            "additionalProperties": {"type": "array", "items": self._VALUE_TYPE_SCHEMA},
+            "additionalProperties": {"type": "array", "items": self._value_type_schema},
         }
 
+    def _is_valid_data(self, data):
+        return self._is_column_table(data)
+
     def to_table_data(self):
         """
         :raises ValueError:
@@ -116,15 +302,7 @@ class SingleJsonTableConverterB(SingleJsonTableConverterBase):
         self._validate_source_data()
         self._loader.inc_table_count()
 
-        headers = sorted(self._buffer.keys())
-
-        yield TableData(
-            self._make_table_name(),
-            headers,
-            zip(*(self._buffer.get(header) for header in headers)),
-            dp_extractor=self._loader.dp_extractor,
-            type_hints=self._extract_type_hints(),
-        )
+        yield self._to_columnar_table_data(self._make_table_name(), self._buffer)
 
 
 class SingleJsonTableConverterC(SingleJsonTableConverterBase):
@@ -134,7 +312,10 @@ class SingleJsonTableConverterC(SingleJsonTableConverterBase):
 
     @property
     def _schema(self):
-        return {"type": "object", "additionalProperties": self._VALUE_TYPE_SCHEMA}
+        return {"type": "object", "additionalProperties": self._value_type_schema}
+
+    def _is_valid_data(self, data):
+        return self._is_record(data)
 
     def to_table_data(self):
         """
@@ -155,14 +336,17 @@ class SingleJsonTableConverterC(SingleJsonTableConverterBase):
 
 
 class MultipleJsonTableConverterBase(JsonConverter):
-    def __init__(self, json_buffer):
-        super().__init__(json_buffer)
+    def __init__(self, json_buffer, is_chunk=False):
+        super().__init__(json_buffer, is_chunk)
 
         self._table_key = None
 
     def _make_table_name(self):
         kv_mapping = self._loader._get_basic_tablename_keyvalue_mapping()
-        kv_mapping[tnt.DEFAULT] = tnt.KEY
+        if self._is_chunk:
+            kv_mapping[tnt.DEFAULT] = f"{tnt.KEY:s}_{tnt.FORMAT_ID:s}"
+        else:
+            kv_mapping[tnt.DEFAULT] = tnt.KEY
         kv_mapping[tnt.KEY] = self._table_key
 
         return self._loader._expand_table_name_format(kv_mapping)
@@ -179,10 +363,13 @@ class MultipleJsonTableConverterA(MultipleJsonTableConverterBase):
             "type": "object",
             "additionalProperties": {
                 "type": "array",
-                "items": {"type": "object", "additionalProperties": self._VALUE_TYPE_SCHEMA},
+                "items": {"type": "object", "additionalProperties": self._value_type_schema},
             },
         }
 
+    def _is_valid_data(self, data):
+        return isinstance(data, dict) and all(map(self._is_record_table, data.values()))
+
     def to_table_data(self):
         """
         :raises ValueError:
@@ -192,10 +379,7 @@ class MultipleJsonTableConverterA(MultipleJsonTableConverterBase):
         self._validate_source_data()
 
         for table_key, json_records in self._buffer.items():
-            attr_name_set = set()
-            for json_record in json_records:
-                attr_name_set = attr_name_set.union(json_record.keys())
-            headers = sorted(attr_name_set)
+            headers = sorted(extract_headers(json_records))
 
             self._loader.inc_table_count()
             self._table_key = table_key
@@ -220,10 +404,13 @@ class MultipleJsonTableConverterB(MultipleJsonTableConverterBase):
             "type": "object",
             "additionalProperties": {
                 "type": "object",
-                "additionalProperties": {"type": "array", "items": self._VALUE_TYPE_SCHEMA},
+                "additionalProperties": {"type": "array", "items": self._value_type_schema},
             },
         }
 
+    def _is_valid_data(self, data):
+        return isinstance(data, dict) and all(map(self._is_column_table, data.values()))
+
     def to_table_data(self):
         """
         :raises ValueError:
@@ -232,19 +419,11 @@ class MultipleJsonTableConverterB(MultipleJsonTableConverterBase):
 
         self._validate_source_data()
 
-        for table_key, json_records in self._buffer.items():
-            headers = sorted(json_records.keys())
-
+        for table_key, json_columns in self._buffer.items():
             self._loader.inc_table_count()
             self._table_key = table_key
 
-            yield TableData(
-                self._make_table_name(),
-                headers,
-                zip(*(json_records.get(header) for header in headers)),
-                dp_extractor=self._loader.dp_extractor,
-                type_hints=self._extract_type_hints(headers),
-            )
+            yield self._to_columnar_table_data(self._make_table_name(), json_columns)
 
 
 class MultipleJsonTableConverterC(MultipleJsonTableConverterBase):
@@ -258,10 +437,13 @@ class MultipleJsonTableConverterC(MultipleJsonTableConverterBase):
             "type": "object",
             "additionalProperties": {
                 "type": "object",
-                "additionalProperties": self._VALUE_TYPE_SCHEMA,
+                "additionalProperties": self._value_type_schema,
             },
         }
 
+    def _is_valid_data(self, data):
+        return isinstance(data, dict) and all(map(self._is_record, data.values()))
+
     def to_table_data(self):
         """
         :raises ValueError:
@@ -284,42 +466,78 @@ class MultipleJsonTableConverterC(MultipleJsonTableConverterBase):
 
 
 class JsonTableFormatter(TableFormatter):
+    _CONVERTER_CLASSES = (
+        MultipleJsonTableConverterA,
+        MultipleJsonTableConverterB,
+        MultipleJsonTableConverterC,
+        SingleJsonTableConverterA,
+        SingleJsonTableConverterB,
+        SingleJsonTableConverterC,
+    )
+
     def to_table_data(self):
-        converter_class_list = [
-            MultipleJsonTableConverterA,
-            MultipleJsonTableConverterB,
-            MultipleJsonTableConverterC,
-            SingleJsonTableConverterA,
-            SingleJsonTableConverterB,
-            SingleJsonTableConverterC,
+        yield from self._create_converter().to_table_data()
+
+    def _create_converter(self):
+        """
+        Create a converter of the detected class if the converter accepts the JSON data.
+        Otherwise, the other converters are tried in order.
+        If no converter accepts the data, the converter of the detected class is returned
+        to raise ValidationError with the cause.
+        """
+
+        detected_class = self._detect_converter_class(self._source_data)
+        converter_classes = [detected_class] + [
+            converter_class
+            for converter_class in self._CONVERTER_CLASSES
+            if converter_class is not detected_class
         ]
+        converters = []
 
-        for converter_class in converter_class_list:
+        for converter_class in converter_classes:
             converter = converter_class(self._source_data)
             converter.accept(self._loader)
-            try:
-                yield from converter.to_table_data()
-                return
-            except ValidationError:
-                pass
-            else:
-                break
-
-            """
-            if not isinstance(self._source_data, (list, type)):
-                continue
-
-            for source in self._source_data:
-                #print("!!", type(source), type(converter))
-                converter = converter_class(source)
-                converter.accept(self._loader)
-                try:
-                    yield from converter.to_table_data()
-                    return
-                except ValidationError:
-                    pass
-                else:
-                    break
-            """
-
-        raise ValidationError(f"inconvertible JSON schema: json={self._source_data}")
+
+            if converter._is_valid_data(self._source_data):
+                return converter
+
+            converters.append(converter)
+
+        return converters[0]
+
+    @staticmethod
+    def _detect_converter_class(json_data):
+        """
+        Detect a converter class from the structure of containers in the JSON data.
+        Values of the tables are not inspected: they are validated by the detected converter.
+
+        :raises pytablereader.error.ValidationError:
+            If the JSON data is not convertible to tables.
+        """
+
+        if isinstance(json_data, list):
+            return SingleJsonTableConverterA
+
+        if not isinstance(json_data, dict):
+            raise ValidationError(f"inconvertible JSON schema: json={json_data}")
+
+        values = json_data.values()
+
+        if all(isinstance(value, list) for value in values):
+            if all(isinstance(item, dict) for value in values for item in value):
+                return MultipleJsonTableConverterA
+
+            return SingleJsonTableConverterB
+
+        if all(isinstance(value, dict) for value in values):
+            if all(
+                isinstance(inner_value, list) for value in values for inner_value in value.values()
+            ):
+                return MultipleJsonTableConverterB
+
+            if not any(
+                isinstance(inner_value, list) for value in values for inner_value in value.values()
+            ):
+                return MultipleJsonTableConverterC
+
+        return SingleJsonTableConverterC
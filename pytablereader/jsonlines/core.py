@@ -3,31 +3,147 @@
 """
 
 import abc
-from collections import OrderedDict
+from itertools import chain, islice
 
-from .._common import get_file_encoding, json
+from pytablereader import DataError
+
+from .._common import get_file_encoding, json_loads, open_text_file
 from .._constant import SourceType
 from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
+from .._row_iterator import RowIterator
 from .._validator import FileValidator, TextValidator
 from ..error import ValidationError
 from ..interface import AbstractTableReader
-from .formatter import JsonLinesTableFormatter
+from .formatter import FlatJsonTableConverter, JsonLinesTableFormatter
 
 
 class JsonLinesTableLoader(AbstractTableReader, metaclass=abc.ABCMeta):
     """
     An abstract class of JSON table loaders.
+
+    .. py:attribute:: headers
+
+        Attribute names of the table.
+        Use the keys of the loaded records as attribute names if
+        ``headers`` is empty.
+
+    .. py:attribute:: header_sample_size
+
+        The number of records from the beginning of the data that used to
+        infer the headers for :py:meth:`iter_rows` when ``headers`` is empty.
+        Defaults to ``1000``.
+
+    .. py:attribute:: skip_validation
+
+        If |True|, skip the validation of the value types for each record:
+        only checks whether each record is a JSON object.
+        Use for trusted data sources.
+        Defaults to |False|.
     """
 
     @property
     def format_name(self):
         return "json_lines"
 
+    def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
+        super().__init__(source, quoting_flags, type_hints, type_hint_rules)
+
+        self.headers = ()
+        self.header_sample_size = 1000
+        self.skip_validation = False
+
     @abc.abstractmethod
     def load_dict(self):  # pragma: no cover
         pass
 
+    def iter_rows(self, batch_size=None):
+        """
+        Read data rows from Line-delimited JSON data lazily.
+        Each record is validated when it is read.
+
+        :param int batch_size:
+            The number of rows to yield at once.
+            Yield rows one by one if the value is |None|.
+        :return:
+            Row iterator that has the resolved ``headers`` and ``type_hints``.
+        :rtype: :py:class:`~pytablereader.jsonlines.core.JsonLinesRowIterator`
+        :raises pytablereader.DataError:
+            If the headers are empty.
+        :raises pytablereader.error.ValidationError:
+            If the data is not acceptable Line-delimited JSON format.
+        :raises ValueError:
+            If the ``batch_size`` is less than one.
+        """
+
+        self._validate()
+        self._logger.logging_load()
+
+        return JsonLinesRowIterator(self, self._iter_json_records(), batch_size)
+
+    @abc.abstractmethod
+    def _iter_json_records(self):  # pragma: no cover
+        pass
+
+    @staticmethod
+    def _parse_json_lines(lines):
+        for line_idx, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                yield json_loads(line)
+            except ValueError as e:
+                raise ValidationError(
+                    "line {line_idx}: {msg}: {value}".format(
+                        line_idx=line_idx + 1, msg=e, value=line
+                    )
+                )
+
+
+class JsonLinesRowIterator(RowIterator):
+    """
+    An iterator class to read data rows of Line-delimited JSON data one by one.
+    :py:attr:`~.RowIterator.headers` are the ``headers`` of the loader if the
+    loader has headers, otherwise the keys of the first ``header_sample_size``
+    records of the data.
+    Each row is a list of values ordered by the headers: keys that not included
+    in the headers are ignored, and missing keys are filled with |None|.
+    """
+
+    def __init__(self, loader, json_records, batch_size=None):
+        super().__init__(json_records, batch_size)
+
+        converter = FlatJsonTableConverter(json_records)
+        converter.accept(loader)
+
+        json_records = self.__validate_records(converter, self._rows)
+        if loader.headers:
+            sample_records = []
+        else:
+            sample_records = list(islice(json_records, loader.header_sample_size))
+
+        self._headers = converter._to_headers(sample_records)
+        if not self._headers:
+            raise DataError("source data is empty")
+
+        self._type_hints = converter._extract_type_hints(self._headers)
+        self._rows = self.__to_rows(chain(sample_records, json_records))
+
+    @staticmethod
+    def __validate_records(converter, json_records):
+        for json_record in json_records:
+            converter._validate_data(json_record)
+
+            yield json_record
+
+    def __to_rows(self, json_records):
+        headers = self._headers
+
+        for json_record in json_records:
+            yield [json_record.get(header) for header in headers]
+
 
 class JsonLinesTableFileLoader(JsonLinesTableLoader):
     """
@@ -38,12 +154,18 @@ class JsonLinesTableFileLoader(JsonLinesTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(filename)s_%(key)s``.
+
+    .. py:attribute:: use_mmap
+
+        If |True|, read lines from a memory-mapped view of the file
+        instead of a regular file object. Defaults to |False|.
     """
 
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
         self.encoding = None
+        self.use_mmap = False
 
         self._validator = FileValidator(file_path)
         self._logger = FileSourceLogger(self)
@@ -72,25 +194,14 @@ class JsonLinesTableFileLoader(JsonLinesTableLoader):
     def load_dict(self):
         self._validate()
         self._logger.logging_load()
-        self.encoding = get_file_encoding(self.source, self.encoding)
 
-        buffer = []
-        with open(self.source, encoding=self.encoding) as fp:
-            for line_idx, line in enumerate(fp):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    buffer.append(json.loads(line, object_pairs_hook=OrderedDict))
-                except json.JSONDecodeError as e:
-                    raise ValidationError(
-                        "line {line_idx}: {msg}: {value}".format(
-                            line_idx=line_idx + 1, msg=e, value=line
-                        )
-                    )
+        return list(self._iter_json_records())
 
-        return buffer
+    def _iter_json_records(self):
+        self.encoding = get_file_encoding(self.source, self.encoding)
+
+        with open_text_file(self.source, self.encoding, self.use_mmap) as fp:
+            yield from self._parse_json_lines(fp)
 
     def _get_default_table_name_template(self):
         return f"{tnt.FILENAME:s}_{tnt.KEY:s}"
@@ -142,22 +253,10 @@ class JsonLinesTableTextLoader(JsonLinesTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        buffer = []
-        for line_idx, line in enumerate(self.source.splitlines()):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                buffer.append(json.loads(line, object_pairs_hook=OrderedDict))
-            except json.JSONDecodeError as e:
-                raise ValidationError(
-                    "line {line_idx}: {msg}: {value}".format(
-                        line_idx=line_idx + 1, msg=e, value=line
-                    )
-                )
+        return list(self._iter_json_records())
 
-        return buffer
+    def _iter_json_records(self):
+        return self._parse_json_lines(self.source.splitlines())
 
     def _get_default_table_name_template(self):
         return f"{tnt.KEY:s}"
@@ -2,10 +2,9 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import jsonschema
 from tabledata import TableData
 
-from ..error import ValidationError
+from .._common import extract_headers
 from ..formatter import TableFormatter
 from ..json.formatter import SingleJsonTableConverterBase
 
@@ -17,14 +16,20 @@ class FlatJsonTableConverter(SingleJsonTableConverterBase):
 
     @property
     def _schema(self):
-        return {"type": "object", "additionalProperties": self._VALUE_TYPE_SCHEMA}
+        return {"type": "object", "additionalProperties": self._value_type_schema}
+
+    def _is_valid_data(self, data):
+        return self._is_record(data)
 
     def _validate_source_data(self):
         for json_record in self._buffer:
-            try:
-                jsonschema.validate(json_record, self._schema)
-            except jsonschema.ValidationError as e:
-                raise ValidationError(e)
+            self._validate_data(json_record)
+
+    def _to_headers(self, json_records):
+        if self._loader.headers:
+            return list(self._loader.headers)
+
+        return extract_headers(json_records)
 
     def to_table_data(self):
         """
@@ -34,11 +39,7 @@ class FlatJsonTableConverter(SingleJsonTableConverterBase):
 
         self._validate_source_data()
 
-        header_list = []
-        for json_record in self._buffer:
-            for key in json_record:
-                if key not in header_list:
-                    header_list.append(key)
+        header_list = self._to_headers(self._buffer)
 
         self._loader.inc_table_count()
 
@@ -21,6 +21,11 @@ class TableFileLoader(TableLoaderManager):
         ``"markdown"``, ``"mediawiki"``, ``"sqlite"``, ``"ssv"``, ``"tsv"``.
         If the value is |None|, automatically detect file format from
         the ``file_path``.
+    :param str encoding:
+        Encoding of the file.
+        If the value is |None|, automatically detect the encoding of the file.
+    :param pytablereader.EncodingDetector encoding_detector:
+        Detector used to detect the encoding of the file.
     :raise pytablereader.InvalidFilePathError:
         If ``file_path`` is an invalid file path.
     :raises pytablereader.LoaderNotFoundError:
@@ -39,8 +44,17 @@ class TableFileLoader(TableLoaderManager):
             * :py:meth:`pytablereader.factory.TableFileLoaderFactory.create_from_path`
     """
 
-    def __init__(self, file_path, format_name=None, encoding=None, type_hint_rules=None):
-        loader_factory = TableFileLoaderFactory(file_path, encoding=encoding)
+    def __init__(
+        self,
+        file_path,
+        format_name=None,
+        encoding=None,
+        type_hint_rules=None,
+        encoding_detector=None,
+    ):
+        loader_factory = TableFileLoaderFactory(
+            file_path, encoding=encoding, encoding_detector=encoding_detector
+        )
 
         if typepy.is_not_null_string(format_name):
             loader = loader_factory.create_from_format_name(format_name)
@@ -2,20 +2,24 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import abc
+from itertools import chain, islice
+
 import pathvalidate as pv
 import typepy
 
 from pytablereader import DataError, InvalidHeaderNameError
 
-from .._common import get_file_encoding
+from .._common import extract_headers, get_file_encoding, iter_batches, open_text_file
 from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
+from .._row_iterator import RowIterator
 from .._validator import FileValidator, TextValidator
 from ..interface import AbstractTableReader
 from ..json.formatter import SingleJsonTableConverterA
 
 
-class LtsvTableLoader(AbstractTableReader):
+class LtsvTableLoader(AbstractTableReader, metaclass=abc.ABCMeta):
     """
     Abstract class of
     `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__
@@ -24,6 +28,25 @@ class LtsvTableLoader(AbstractTableReader):
     .. py:attribute:: encoding
 
         Encoding of the LTSV data.
+
+    .. py:attribute:: chunk_size
+
+        The maximum number of records for each |TableData|.
+        If the value is a positive integer, :py:meth:`load` reads the data
+        lazily and splits the data into multiple |TableData| instances.
+        Headers of each |TableData| are extracted from the records of the chunk.
+        Defaults to |None| (load all of the records into a |TableData|).
+
+    .. py:attribute:: headers
+
+        Labels of the records that used as headers for :py:meth:`iter_rows`.
+        Use the labels of the loaded records as headers if ``headers`` is empty.
+
+    .. py:attribute:: header_sample_size
+
+        The number of records from the beginning of the data that used to
+        extract the headers for :py:meth:`iter_rows` when ``headers`` is empty.
+        Defaults to ``1000``.
     """
 
     @property
@@ -33,45 +56,147 @@ class LtsvTableLoader(AbstractTableReader):
     def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
         super().__init__(source, quoting_flags, type_hints, type_hint_rules)
 
-        self._ltsv_input_stream = None
+        self.chunk_size = None
+        self.headers = ()
+        self.header_sample_size = 1000
 
-    def _to_data_matrix(self):
-        from collections import OrderedDict
+        # mapping of raw labels in the data to the validated labels
+        self.__label_cache = {}
+
+    def iter_rows(self, batch_size=None):
+        """
+        Read data rows from LTSV data lazily.
+
+        :param int batch_size:
+            The number of rows to yield at once.
+            Yield rows one by one if the value is |None|.
+        :return:
+            Row iterator that has the resolved ``headers`` and ``type_hints``.
+        :rtype: :py:class:`~pytablereader.ltsv.core.LtsvRowIterator`
+        :raises pytablereader.InvalidHeaderNameError:
+            If an invalid label name is included in the LTSV data.
+        :raises pytablereader.DataError:
+            If the LTSV data is invalid.
+        :raises ValueError:
+            If the ``batch_size`` is less than one.
 
-        data_matrix = []
+        :Example:
+            .. code:: python
 
-        for row_idx, row in enumerate(self._ltsv_input_stream):
+                loader = ptr.LtsvTableFileLoader("access_log.ltsv")
+                loader.headers = ["time", "host", "status"]
+                for rows in loader.iter_rows(batch_size=10000):
+                    ...
+        """
+
+        self._validate()
+        self._logger.logging_load()
+
+        return LtsvRowIterator(self, self._iter_ltsv_records(self._iter_lines()), batch_size)
+
+    @abc.abstractmethod
+    def _iter_lines(self):  # pragma: no cover
+        pass
+
+    def _iter_ltsv_records(self, lines):
+        label_cache = self.__label_cache
+
+        for row_idx, row in enumerate(lines):
+            row = row.strip()
             if typepy.is_empty_sequence(row):
                 continue
 
-            ltsv_record = OrderedDict()
-            for col_idx, ltsv_item in enumerate(row.strip().split("\t")):
-                try:
-                    label, value = ltsv_item.split(":")
-                except ValueError:
+            ltsv_record = {}
+            for col_idx, ltsv_item in enumerate(row.split("\t")):
+                raw_label, separator, value = ltsv_item.partition(":")
+                if not separator:
                     raise DataError(
                         "invalid ltsv item found: line={}, col={}, item='{}'".format(
                             row_idx, col_idx, ltsv_item
                         )
                     )
 
-                label = label.strip('"')
-
-                try:
-                    pv.validate_ltsv_label(label)
-                except pv.ValidationError:
-                    raise InvalidHeaderNameError(
-                        "invalid label found (acceptable chars are [0-9A-Za-z_.-]): "
-                        "line={}, col={}, label='{}'".format(row_idx, col_idx, label)
-                    )
+                label = label_cache.get(raw_label)
+                if label is None:
+                    label = self.__to_label(raw_label, row_idx, col_idx)
+                    label_cache[raw_label] = label
 
                 ltsv_record[label] = value
 
-            data_matrix.append(ltsv_record)
+            yield ltsv_record
+
+    @staticmethod
+    def __to_label(raw_label, row_idx, col_idx):
+        label = raw_label.strip('"')
+
+        try:
+            pv.validate_ltsv_label(label)
+        except pv.ValidationError:
+            raise InvalidHeaderNameError(
+                "invalid label found (acceptable chars are [0-9A-Za-z_.-]): "
+                "line={}, col={}, label='{}'".format(row_idx, col_idx, label)
+            )
+
+        return label
 
-        # using generator to prepare for future enhancement to support
-        # iterative load.
-        yield data_matrix
+    def _to_data_matrix(self, lines):
+        ltsv_records = self._iter_ltsv_records(lines)
+
+        if self.chunk_size:
+            yield from iter_batches(ltsv_records, self.chunk_size)
+        else:
+            yield list(ltsv_records)
+
+    def _to_table_data(self):
+        data_matrices = self._to_data_matrix(self._iter_lines())
+        if not self.chunk_size:
+            # read the whole data before the iteration to raise errors at the load
+            data_matrices = list(data_matrices)
+
+        return self.__to_table_data(data_matrices)
+
+    def __to_table_data(self, data_matrices):
+        for data_matrix in data_matrices:
+            formatter = SingleJsonTableConverterA(data_matrix, is_chunk=bool(self.chunk_size))
+            formatter.accept(self)
+
+            yield from formatter.to_table_data()
+
+
+class LtsvRowIterator(RowIterator):
+    """
+    An iterator class to read data rows of LTSV data one by one.
+    :py:attr:`~.RowIterator.headers` are the ``headers`` of the loader if the
+    loader has headers, otherwise the sorted labels of the first
+    ``header_sample_size`` records of the data.
+    Each row is a list of values ordered by the headers: labels that not included
+    in the headers are ignored, and missing labels are filled with |None|.
+    """
+
+    def __init__(self, loader, ltsv_records, batch_size=None):
+        super().__init__(ltsv_records, batch_size)
+
+        if loader.headers:
+            sample_records = []
+            self._headers = list(loader.headers)
+        else:
+            sample_records = list(islice(self._rows, loader.header_sample_size))
+            self._headers = sorted(extract_headers(sample_records))
+
+        if not self._headers:
+            raise DataError("source data is empty")
+
+        formatter = SingleJsonTableConverterA(sample_records)
+        formatter.accept(loader)
+
+        self._type_hints = formatter._extract_type_hints(self._headers)
+        self._rows = self.__to_rows(chain(sample_records, self._rows))
+
+    def __to_rows(self, ltsv_records):
+        headers = self._headers
+
+        for ltsv_record in ltsv_records:
+            yield [ltsv_record.get(header) for header in headers]
 
 
 class LtsvTableFileLoader(LtsvTableLoader):
@@ -83,13 +208,21 @@ class LtsvTableFileLoader(LtsvTableLoader):
 
     .. py:attribute:: table_name
 
-        Table name string. Defaults to ``%(filename)s``.
+        Table name string. Defaults to ``%(filename)s``,
+        or ``%(filename)s_%(format_id)s`` if
+        :py:attr:`~.LtsvTableLoader.chunk_size` is set.
+
+    .. py:attribute:: use_mmap
+
+        If |True|, read the LTSV file through a memory-mapped view of the file.
+        Defaults to |False|.
     """
 
     def __init__(self, file_path, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
         self.encoding = None
+        self.use_mmap = False
 
         self._validator = FileValidator(file_path)
         self._logger = FileSourceLogger(self)
@@ -113,6 +246,12 @@ class LtsvTableFileLoader(LtsvTableLoader):
             ``%(format_id)s``    |format_id_desc|
             ``%(global_id)s``    |global_id|
             ===================  ========================================
+
+            If :py:attr:`~.LtsvTableLoader.chunk_size` is set, the file is read
+            lazily and a |TableData| is created for each chunk of records.
+            ``%(format_id)s``/``%(global_id)s`` are incremented for each chunk,
+            and the default table name is ``%(filename)s_%(format_id)s``
+            to make a distinct table name for each chunk.
         :rtype: |TableData| iterator
         :raises pytablereader.InvalidHeaderNameError:
             If an invalid label name is included in the LTSV file.
@@ -122,17 +261,19 @@ class LtsvTableFileLoader(LtsvTableLoader):
 
         self._validate()
         self._logger.logging_load()
-        self.encoding = get_file_encoding(self.source, self.encoding)
 
-        self._ltsv_input_stream = open(self.source, encoding=self.encoding)
+        return self._to_table_data()
 
-        for data_matrix in self._to_data_matrix():
-            formatter = SingleJsonTableConverterA(data_matrix)
-            formatter.accept(self)
+    def _iter_lines(self):
+        self.encoding = get_file_encoding(self.source, self.encoding)
 
-            return formatter.to_table_data()
+        with open_text_file(self.source, self.encoding, self.use_mmap) as fp:
+            yield from fp
 
     def _get_default_table_name_template(self):
+        if self.chunk_size:
+            return f"{tnt.FILENAME:s}_{tnt.FORMAT_ID:s}"
+
         return tnt.FILENAME
 
 
@@ -171,6 +312,9 @@ class LtsvTableTextLoader(LtsvTableLoader):
             ``%(format_id)s``    |format_id_desc|
             ``%(global_id)s``    |global_id|
             ===================  ========================================
+
+            If :py:attr:`~.LtsvTableLoader.chunk_size` is set,
+            a |TableData| is created for each chunk of records.
         :rtype: |TableData| iterator
         :raises pytablereader.InvalidHeaderNameError:
             If an invalid label name is included in the LTSV file.
@@ -181,13 +325,10 @@ class LtsvTableTextLoader(LtsvTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        self._ltsv_input_stream = self.source.splitlines()
-
-        for data_matrix in self._to_data_matrix():
-            formatter = SingleJsonTableConverterA(data_matrix)
-            formatter.accept(self)
+        return self._to_table_data()
 
-            return formatter.to_table_data()
+    def _iter_lines(self):
+        return iter(self.source.splitlines())
 
     def _get_default_table_name_template(self):
         return f"{tnt.FORMAT_NAME:s}{tnt.FORMAT_ID:s}"
@@ -0,0 +1,98 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import re
+
+
+_RE_FENCE_START = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_RE_DELIMITER_ROW = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_RE_BLOCK_START = re.compile(r"^ {0,3}(#{1,6}(\s|$)|>)")
+_RE_UNESCAPED_PIPE = re.compile(r"(?<!\\)\|")
+
+
+def split_row(line):
+    """
+    Split a pipe-table row into cell texts.
+    Leading/trailing pipes are optional, and ``\\|`` is a pipe character
+    within a cell.
+    """
+
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+
+    if "\\|" not in line:
+        return [cell.strip() for cell in line.split("|")]
+
+    return [cell.strip().replace("\\|", "|") for cell in _RE_UNESCAPED_PIPE.split(line)]
+
+
+def _is_row_candidate(line):
+    # lines indented with four or more spaces are code blocks
+    return "|" in line and not line.startswith(("    ", "\t"))
+
+
+def _is_block_end(line):
+    return not line.strip() or _RE_FENCE_START.match(line) or _RE_BLOCK_START.match(line)
+
+
+def iter_pipe_tables(lines):
+    """
+    Scan lines of a Markdown document and yield GitHub Flavored Markdown
+    pipe tables. Lines in fenced code blocks are excluded.
+
+    A table consists of a header row, a delimiter row that has the same
+    number of cells as the header row, and the following rows until a blank
+    line or the beginning of another block. Rows are padded with empty cells
+    or truncated to the number of the header cells.
+
+    :param list lines: Lines of a Markdown document.
+    :return: Pairs of the header cells and the rows of the tables.
+    """
+
+    fence_end = None
+    header_line = None
+    num_lines = len(lines)
+    i = 0
+
+    while i < num_lines:
+        line = lines[i]
+        i += 1
+
+        if fence_end is not None:
+            if fence_end.match(line):
+                fence_end = None
+            continue
+
+        match = _RE_FENCE_START.match(line)
+        if match:
+            marker = match.group(1)
+            fence_end = re.compile(
+                r"^ {{0,3}}{}{{{:d},}}\s*$".format(re.escape(marker[0]), len(marker))
+            )
+            header_line = None
+            continue
+
+        if header_line is not None and "|" in line and _RE_DELIMITER_ROW.match(line):
+            headers = split_row(header_line)
+            num_cols = len(headers)
+
+            if len(split_row(line)) == num_cols:
+                rows = []
+                while i < num_lines and not _is_block_end(lines[i]):
+                    cells = split_row(lines[i])
+                    i += 1
+
+                    if len(cells) < num_cols:
+                        cells.extend([""] * (num_cols - len(cells)))
+                    rows.append(cells[:num_cols])
+
+                yield headers, rows
+
+                header_line = None
+                continue
+
+        header_line = line if _is_row_candidate(line) else None
@@ -8,7 +8,7 @@ from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
 from .._validator import FileValidator, TextValidator
 from ..interface import AbstractTableReader
-from .formatter import MarkdownTableFormatter
+from .formatter import MarkdownPipeTableFormatter, MarkdownTableFormatter
 
 
 class MarkdownTableLoader(AbstractTableReader):
@@ -20,6 +20,21 @@ class MarkdownTableLoader(AbstractTableReader):
     def format_name(self):
         return "markdown"
 
+    def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
+        super().__init__(source, quoting_flags, type_hints, type_hint_rules)
+
+        self.table_selector = None
+        self.engine = "markdown"
+
+    def _create_formatter(self, source_data):
+        if self.engine == "native":
+            return MarkdownPipeTableFormatter(source_data, self._logger)
+
+        if self.engine == "markdown":
+            return MarkdownTableFormatter(source_data, self._logger)
+
+        raise ValueError(f"unknown engine: expected='native' or 'markdown', actual={self.engine}")
+
 
 class MarkdownTableFileLoader(MarkdownTableLoader):
     """
@@ -30,6 +45,26 @@ class MarkdownTableFileLoader(MarkdownTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(filename)s_%(key)s``.
+
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
+    .. py:attribute:: engine
+
+        Markdown parsing engine:
+
+        - ``"markdown"``: render the document to HTML with the ``markdown``
+          package and extract ``<table>`` elements from the HTML.
+          Requires the ``markdown`` package.
+        - ``"native"``: scan pipe tables of GitHub Flavored Markdown from
+          lines of the document. Faster than ``"markdown"``, but
+          inline markups and HTML entities of cells remain as written.
+          Tables in fenced code blocks are excluded,
+          and ``\\|`` is a pipe character in a cell.
+
+        Defaults to ``"markdown"``.
     """
 
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
@@ -68,7 +103,7 @@ class MarkdownTableFileLoader(MarkdownTableLoader):
         self.encoding = get_file_encoding(self.source, self.encoding)
 
         with open(self.source, encoding=self.encoding) as fp:
-            formatter = MarkdownTableFormatter(fp.read(), self._logger)
+            formatter = self._create_formatter(fp.read())
         formatter.accept(self)
 
         return formatter.to_table_data()
@@ -86,6 +121,26 @@ class MarkdownTableTextLoader(MarkdownTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(key)s``.
+
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
+    .. py:attribute:: engine
+
+        Markdown parsing engine:
+
+        - ``"markdown"``: render the document to HTML with the ``markdown``
+          package and extract ``<table>`` elements from the HTML.
+          Requires the ``markdown`` package.
+        - ``"native"``: scan pipe tables of GitHub Flavored Markdown from
+          lines of the document. Faster than ``"markdown"``, but
+          inline markups and HTML entities of cells remain as written.
+          Tables in fenced code blocks are excluded,
+          and ``\\|`` is a pipe character in a cell.
+
+        Defaults to ``"markdown"``.
     """
 
     @property
@@ -125,7 +180,7 @@ class MarkdownTableTextLoader(MarkdownTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        formatter = MarkdownTableFormatter(self.source, self._logger)
+        formatter = self._create_formatter(self.source)
         formatter.accept(self)
 
         return formatter.to_table_data()
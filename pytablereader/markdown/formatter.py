@@ -6,7 +6,8 @@ import typepy
 
 from pytablereader import DataError
 
-from ..html.formatter import HtmlTableFormatter
+from ..html.formatter import HtmlTableFormatter, TableElementFormatter
+from ._parser import iter_pipe_tables
 
 
 class MarkdownTableFormatter(HtmlTableFormatter):
@@ -19,3 +20,20 @@ class MarkdownTableFormatter(HtmlTableFormatter):
         super().__init__(
             markdown.markdown(source_data, extensions=["markdown.extensions.tables"]), logger=logger
         )
+
+
+class MarkdownPipeTableFormatter(TableElementFormatter):
+    """
+    A formatter that extracts GitHub Flavored Markdown pipe tables by scanning
+    lines of a Markdown document, without rendering the document to HTML.
+    Cell texts are not rendered: inline markups remain as written.
+    """
+
+    def _iter_tables(self):
+        for headers, rows in iter_pipe_tables(self._source_data.splitlines()):
+            yield (
+                None,
+                None,
+                [[("th", header) for header in headers]]
+                + [[("td", value) for value in row] for row in rows],
+            )
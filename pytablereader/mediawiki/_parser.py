@@ -0,0 +1,147 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import html
+import re
+
+
+_RE_BOLD_ITALIC = re.compile(r"'{2,}")
+_RE_INTERNAL_LINK = re.compile(r"\[\[(?:[^\]|]*\|)?([^\]]*)\]\]")
+_RE_EXTERNAL_LINK = re.compile(r"\[(?:https?|ftp)://[^\s\]]+\s+([^\]]*)\]")
+_RE_TAG = re.compile(r"<[^>]+>")
+
+
+class WikiTable:
+    """
+    Table data that extracted from a wikitable (``{|`` ... ``|}``) markup.
+
+    :ivar str caption: Caption of the table (``|+``). |None| if not present.
+    :ivar list rows:
+        Rows of the table. Each row is a list of ``(tag, text)`` tuples of
+        the cells, where ``tag`` is ``"th"`` for header cells (``!``) and
+        ``"td"`` for data cells (``|``).
+    """
+
+    def __init__(self):
+        self.caption = None
+        self.rows = []
+        self.__row = None
+        self.__texts = None
+
+    def add_line(self, line):
+        """
+        Add a stripped line within the table: a caption, a row separator,
+        header/data cells or a continuation of the last cell.
+        """
+
+        if line.startswith("|+"):
+            self.set_caption(line[2:])
+        elif line.startswith("|-"):
+            self.start_row()
+        elif line.startswith("!"):
+            self.add_cells("th", re.split(r"!!|\|\|", line[1:]))
+        elif line.startswith("|"):
+            self.add_cells("td", line[1:].split("||"))
+        else:
+            self.add_text(line)
+
+    def start_row(self):
+        self.__row = None
+        self.__texts = None
+
+    def add_cells(self, tag, cells):
+        if self.__row is None:
+            self.__row = []
+            self.rows.append(self.__row)
+
+        for cell in cells:
+            self.__texts = [_strip_attrs(cell)]
+            self.__row.append((tag, self.__texts))
+
+    def set_caption(self, caption):
+        self.__texts = [_strip_attrs(caption)]
+        self.caption = self.__texts
+
+    def add_text(self, text):
+        # lines that do not start with table markups continue the last cell
+        if self.__texts is not None:
+            self.__texts.append(text)
+
+    def close(self):
+        if self.caption is not None:
+            self.caption = to_text(self.caption)
+
+        self.rows = [[(tag, to_text(texts)) for tag, texts in row] for row in self.rows]
+
+
+def _strip_attrs(cell):
+    # attributes of a cell are separated from the content by a single pipe:
+    # e.g. | style="text-align:right" | 1
+    pos = cell.find("|")
+    if pos < 0:
+        return cell
+
+    attrs = cell[:pos]
+    if "[[" in attrs or "{{" in attrs:
+        return cell
+
+    return cell[pos + 1 :]
+
+
+def to_text(texts):
+    """
+    Convert lines of a cell to plain text: bold/italic quotes, links,
+    HTML tags and character references are resolved.
+    """
+
+    text = "\n".join(texts).strip()
+    if not any(mark in text for mark in ("''", "[", "<", "&")):
+        return text
+
+    text = _RE_BOLD_ITALIC.sub("", text)
+    text = _RE_INTERNAL_LINK.sub(r"\1", text)
+    text = _RE_EXTERNAL_LINK.sub(r"\1", text)
+    text = _RE_TAG.sub("", text)
+
+    return html.unescape(text).strip()
+
+
+def iter_wiki_tables(lines):
+    """
+    Scan lines of a MediaWiki document and yield wikitables in the order of
+    the table starts. Nested tables are yielded as separate tables.
+
+    :param list lines: Lines of a MediaWiki document.
+    :return: :py:class:`WikiTable` iterator.
+    """
+
+    tables = []
+    stack = []
+
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith("{|"):
+            table = WikiTable()
+            tables.append(table)
+            stack.append(table)
+            continue
+
+        if not stack:
+            continue
+
+        if line.startswith("|}"):
+            stack.pop().close()
+
+            if not stack:
+                yield from tables
+                tables = []
+        else:
+            stack[-1].add_line(line)
+
+    # tables that are not closed until the end of the document
+    while stack:
+        stack.pop().close()
+
+    yield from tables
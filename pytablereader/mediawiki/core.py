@@ -8,7 +8,7 @@ from .._constant import TableNameTemplate as tnt
 from .._logger import FileSourceLogger, TextSourceLogger
 from .._validator import FileValidator, TextValidator
 from ..interface import AbstractTableReader
-from .formatter import MediaWikiTableFormatter
+from .formatter import MediaWikiNativeTableFormatter, MediaWikiTableFormatter
 
 
 class MediaWikiTableLoader(AbstractTableReader):
@@ -20,6 +20,21 @@ class MediaWikiTableLoader(AbstractTableReader):
     def format_name(self):
         return "mediawiki"
 
+    def __init__(self, source, quoting_flags, type_hints, type_hint_rules=None):
+        super().__init__(source, quoting_flags, type_hints, type_hint_rules)
+
+        self.table_selector = None
+        self.engine = "native"
+
+    def _create_formatter(self, source_data):
+        if self.engine == "native":
+            return MediaWikiNativeTableFormatter(source_data, self._logger)
+
+        if self.engine == "pandoc":
+            return MediaWikiTableFormatter(source_data)
+
+        raise ValueError(f"unknown engine: expected='native' or 'pandoc', actual={self.engine}")
+
 
 class MediaWikiTableFileLoader(MediaWikiTableLoader):
     """
@@ -30,6 +45,25 @@ class MediaWikiTableFileLoader(MediaWikiTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(filename)s_%(key)s``.
+
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
+    .. py:attribute:: engine
+
+        MediaWiki parsing engine:
+
+        - ``"native"``: parse the wikitable markups of the document in Python.
+          Bold/italic quotes, links and HTML tags in cells are converted to
+          plain text.
+        - ``"pandoc"``: convert the document to HTML with pandoc and extract
+          ``<table>`` elements from the HTML. Use this engine for markups that
+          the native engine does not support, such as templates.
+          Requires the ``pypandoc`` package and pandoc.
+
+        Defaults to ``"native"``.
     """
 
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
@@ -72,7 +106,7 @@ class MediaWikiTableFileLoader(MediaWikiTableLoader):
         self.encoding = get_file_encoding(self.source, self.encoding)
 
         with open(self.source, encoding=self.encoding) as fp:
-            formatter = MediaWikiTableFormatter(fp.read())
+            formatter = self._create_formatter(fp.read())
         formatter.accept(self)
 
         return formatter.to_table_data()
@@ -90,6 +124,25 @@ class MediaWikiTableTextLoader(MediaWikiTableLoader):
     .. py:attribute:: table_name
 
         Table name string. Defaults to ``%(key)s``.
+
+    .. py:attribute:: table_selector
+
+        :py:class:`~pytablereader.TableSelector` instance to select tables to load.
+        Load all of the tables if |None|. Defaults to |None|.
+
+    .. py:attribute:: engine
+
+        MediaWiki parsing engine:
+
+        - ``"native"``: parse the wikitable markups of the document in Python.
+          Bold/italic quotes, links and HTML tags in cells are converted to
+          plain text.
+        - ``"pandoc"``: convert the document to HTML with pandoc and extract
+          ``<table>`` elements from the HTML. Use this engine for markups that
+          the native engine does not support, such as templates.
+          Requires the ``pypandoc`` package and pandoc.
+
+        Defaults to ``"native"``.
     """
 
     @property
@@ -133,7 +186,7 @@ class MediaWikiTableTextLoader(MediaWikiTableLoader):
         self._validate()
         self._logger.logging_load()
 
-        formatter = MediaWikiTableFormatter(self.source)
+        formatter = self._create_formatter(self.source)
         formatter.accept(self)
 
         return formatter.to_table_data()
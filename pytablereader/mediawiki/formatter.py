@@ -3,7 +3,8 @@
 """
 
 from ..error import PypandocImportError
-from ..html.formatter import HtmlTableFormatter
+from ..html.formatter import HtmlTableFormatter, TableElementFormatter
+from ._parser import iter_wiki_tables
 
 
 class MediaWikiTableFormatter(HtmlTableFormatter):
@@ -16,3 +17,15 @@ class MediaWikiTableFormatter(HtmlTableFormatter):
             raise PypandocImportError(e)
 
         super().__init__(pypandoc.convert_text(source_data, "html", format="mediawiki"))
+
+
+class MediaWikiNativeTableFormatter(TableElementFormatter):
+    """
+    A formatter that extracts tables by parsing the wikitable markups
+    (``{|``, ``|+``, ``|-``, ``!``, ``|`` and ``|}``) of a MediaWiki document,
+    without converting the document to HTML with pandoc.
+    """
+
+    def _iter_tables(self):
+        for table in iter_wiki_tables(self._source_data.splitlines()):
+            yield (None, table.caption, table.rows)
@@ -0,0 +1,80 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+
+class SheetProfile:
+    """
+    Bounds of the data in a sheet.
+
+    :ivar int start_col_idx: Index of the first non-empty column.
+    :ivar int end_col_idx: Index of the last non-empty column.
+    :ivar int header_row_idx:
+        Index of the header row: the first row that has no empty cells between
+        ``start_col_idx`` and ``end_col_idx``. |None| if not found.
+    :ivar int last_row_idx: Index of the last non-empty row.
+
+    Column/row indices are |None| if the sheet is empty.
+    """
+
+    def __init__(self, start_col_idx, end_col_idx, header_row_idx, last_row_idx):
+        self.start_col_idx = start_col_idx
+        self.end_col_idx = end_col_idx
+        self.header_row_idx = header_row_idx
+        self.last_row_idx = last_row_idx
+
+    @property
+    def is_empty(self):
+        return self.last_row_idx is None
+
+
+def profile_sheet(rows, start_row=0, empty_value=None):
+    """
+    Find the bounds of the data in a sheet with a single pass over the rows.
+
+    :param rows: Iterator of the rows of a sheet.
+    :param int start_row: The first row to search the header row.
+    :param empty_value: Value of empty cells in ``rows``.
+    :rtype: SheetProfile
+    """
+
+    start_col_idx = None
+    end_col_idx = None
+    header_row_idx = None
+    last_row_idx = None
+
+    for row_idx, row in enumerate(rows):
+        num_cols = len(row)
+
+        row_start_col_idx = 0
+        while row_start_col_idx < num_cols and row[row_start_col_idx] == empty_value:
+            row_start_col_idx += 1
+        if row_start_col_idx == num_cols:
+            continue
+
+        row_end_col_idx = num_cols - 1
+        while row[row_end_col_idx] == empty_value:
+            row_end_col_idx -= 1
+
+        last_row_idx = row_idx
+
+        if start_col_idx is None:
+            start_col_idx = row_start_col_idx
+            end_col_idx = row_end_col_idx
+        elif row_start_col_idx < start_col_idx or row_end_col_idx > end_col_idx:
+            start_col_idx = min(start_col_idx, row_start_col_idx)
+            end_col_idx = max(end_col_idx, row_end_col_idx)
+
+            # the preceding rows are narrower than the widened bounds
+            header_row_idx = None
+
+        if (
+            header_row_idx is None
+            and row_idx >= start_row
+            and row_start_col_idx == start_col_idx
+            and row_end_col_idx == end_col_idx
+            and empty_value not in row[row_start_col_idx:row_end_col_idx]
+        ):
+            header_row_idx = row_idx
+
+    return SheetProfile(start_col_idx, end_col_idx, header_row_idx, last_row_idx)
@@ -2,6 +2,10 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import os.path
+import zipfile
+from collections import deque
+
 from tabledata import TableData
 
 from pytablereader import DataError
@@ -9,9 +13,16 @@ from pytablereader import DataError
 from .._logger import FileSourceLogger
 from .._validator import FileValidator
 from ..error import OpenError
+from ._profile import profile_sheet
 from .core import SpreadSheetLoader
 
 
+def _iter_buffered(rows, buffer):
+    for row in rows:
+        buffer.append(row)
+        yield row
+
+
 class ExcelTableFileLoader(SpreadSheetLoader):
     """
     A file loader class to extract tabular data from Microsoft Excel |TM|
@@ -26,6 +37,35 @@ class ExcelTableFileLoader(SpreadSheetLoader):
     .. py:attribute:: start_row
 
         The first row to search header row.
+
+    .. py:attribute:: engine
+
+        Library to read workbooks:
+
+        - ``"xlrd"``: load the whole workbook into memory with
+          ``excelrd``/``xlrd``.
+        - ``"openpyxl"``: read ``.xlsx`` workbooks row by row with the
+          read-only mode of ``openpyxl``: cell objects of the whole workbook
+          are not created, and only the selected sheets are parsed.
+          The values of a sheet are still held in memory to create
+          a |TableData|. Values of cells are the types of ``openpyxl``,
+          e.g. integer numbers are loaded as :py:class:`int`.
+
+        Defaults to ``"xlrd"``.
+
+    .. py:attribute:: sheets
+
+        Sheets to load. A sheet is specified by one of the following values,
+        or a list of the values:
+
+        - :py:class:`int`: zero-based index of a sheet in the workbook
+        - :py:class:`str`: name of a sheet
+        - compiled regular expression: pattern to search in the names of sheets
+
+        Sheets that are not selected are not loaded from the workbook
+        (``.xls`` workbooks with ``"xlrd"`` engine and ``.xlsx`` workbooks
+        with ``"openpyxl"`` engine).
+        Load all of the sheets if |None|. Defaults to |None|.
     """
 
     @property
@@ -34,7 +74,11 @@ class ExcelTableFileLoader(SpreadSheetLoader):
 
     @property
     def _sheet_name(self):
-        return self._worksheet.name
+        try:
+            return self._worksheet.name
+        except AttributeError:
+            # worksheets of openpyxl
+            return self._worksheet.title
 
     @property
     def _row_count(self):
@@ -47,6 +91,11 @@ class ExcelTableFileLoader(SpreadSheetLoader):
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
+        self.engine = "xlrd"
+        self.sheets = None
+
+        self.__sheet_profiles = {}
+
         self._validator = FileValidator(file_path)
         self._logger = FileSourceLogger(self)
 
@@ -76,6 +125,15 @@ class ExcelTableFileLoader(SpreadSheetLoader):
             If failed to open the source file.
         """
 
+        if self.engine == "openpyxl":
+            return self.__load_openpyxl()
+
+        if self.engine == "xlrd":
+            return self.__load_xlrd()
+
+        raise ValueError(f"unknown engine: expected='xlrd' or 'openpyxl', actual={self.engine}")
+
+    def __load_xlrd(self):
         try:
             import excelrd as xlrd
         except ImportError:
@@ -83,40 +141,150 @@ class ExcelTableFileLoader(SpreadSheetLoader):
 
         self._validate()
         self._logger.logging_load()
+        self.__sheet_profiles.clear()
+
+        # sheets of workbooks are loaded on demand only for the .xls format:
+        # xlrd loads all of the sheets of the other formats
+        on_demand = os.path.splitext(self.source)[1].lower() == ".xls"
 
         try:
-            workbook = xlrd.open_workbook(self.source)
+            workbook = xlrd.open_workbook(self.source, on_demand=on_demand)
         except xlrd.biffh.XLRDError as e:
             raise OpenError(e)
 
-        for worksheet in workbook.sheets():
-            self._worksheet = worksheet
+        try:
+            for sheet_idx, sheet_name in enumerate(workbook.sheet_names()):
+                if not self._is_target_sheet(sheet_idx, sheet_name):
+                    continue
 
-            if self._is_empty_sheet():
-                continue
+                self._worksheet = workbook.sheet_by_index(sheet_idx)
 
-            self.__extract_not_empty_col_idx()
+                try:
+                    table_data = self.__to_table_data_xlrd()
+                finally:
+                    self._worksheet = None
+                    if on_demand:
+                        workbook.unload_sheet(sheet_idx)
 
-            try:
-                start_row_idx = self._get_start_row_idx()
-            except DataError:
-                continue
+                if table_data is not None:
+                    yield table_data
+        finally:
+            workbook.release_resources()
 
-            rows = [
-                self.__get_row_values(row_idx)
-                for row_idx in range(start_row_idx + 1, self._row_count)
-            ]
+    def __to_table_data_xlrd(self):
+        if self._is_empty_sheet():
+            return None
 
-            self.inc_table_count()
-            headers = self.__get_row_values(start_row_idx)
+        profile = self.__get_sheet_profile()
+        if profile.is_empty:
+            return None
 
-            yield TableData(
-                self._make_table_name(),
-                headers,
-                rows,
-                dp_extractor=self.dp_extractor,
-                type_hints=self._extract_type_hints(headers),
-            )
+        self._start_col_idx = profile.start_col_idx
+        self._end_col_idx = profile.end_col_idx
+
+        try:
+            start_row_idx = self._get_start_row_idx()
+        except DataError:
+            return None
+
+        rows = [
+            self.__get_row_values(row_idx) for row_idx in range(start_row_idx + 1, self._row_count)
+        ]
+
+        self.inc_table_count()
+        headers = self.__get_row_values(start_row_idx)
+
+        return TableData(
+            self._make_table_name(),
+            headers,
+            rows,
+            dp_extractor=self.dp_extractor,
+            type_hints=self._extract_type_hints(headers),
+        )
+
+    def __load_openpyxl(self):
+        import openpyxl
+        from openpyxl.utils.exceptions import InvalidFileException
+
+        self._validate()
+        self._logger.logging_load()
+
+        try:
+            workbook = openpyxl.load_workbook(self.source, read_only=True, data_only=True)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile, InvalidFileException) as e:
+            raise OpenError(e)
+
+        try:
+            for sheet_idx, worksheet in enumerate(workbook.worksheets):
+                if not self._is_target_sheet(sheet_idx, worksheet.title):
+                    continue
+
+                self._worksheet = worksheet
+
+                # the dimension of a sheet recorded in the file may be wrong
+                worksheet.reset_dimensions()
+
+                # rows are read only once: the profile of the sheet is found while
+                # the rows are buffered
+                buffer = deque()
+                profile = profile_sheet(
+                    _iter_buffered(worksheet.iter_rows(values_only=True), buffer),
+                    start_row=self.start_row,
+                )
+                if profile.is_empty or profile.last_row_idx == 0:
+                    continue
+
+                if profile.header_row_idx is None:
+                    continue
+
+                self._start_col_idx = profile.start_col_idx
+                self._end_col_idx = profile.end_col_idx
+
+                for _ in range(profile.header_row_idx):
+                    buffer.popleft()
+
+                headers = self.__to_row_values(buffer.popleft())
+                rows = [
+                    self.__to_row_values(buffer.popleft())
+                    for _ in range(profile.last_row_idx - profile.header_row_idx)
+                ]
+                del buffer
+
+                self.inc_table_count()
+
+                yield TableData(
+                    self._make_table_name(),
+                    headers,
+                    rows,
+                    dp_extractor=self.dp_extractor,
+                    type_hints=self._extract_type_hints(headers),
+                )
+        finally:
+            workbook.close()
+
+    def _is_target_sheet(self, sheet_idx, sheet_name):
+        if self.sheets is None:
+            return True
+
+        if isinstance(self.sheets, (list, tuple)):
+            conditions = self.sheets
+        else:
+            conditions = [self.sheets]
+
+        for condition in conditions:
+            if isinstance(condition, bool):
+                continue
+
+            if isinstance(condition, int):
+                if condition == sheet_idx:
+                    return True
+            elif isinstance(condition, str):
+                if condition == sheet_name:
+                    return True
+            elif condition.search(sheet_name) is not None:
+                return True
+
+        return False
 
     def _is_empty_sheet(self):
         return any(
@@ -128,42 +296,42 @@ class ExcelTableFileLoader(SpreadSheetLoader):
         )
 
     def _get_start_row_idx(self):
-        for row_idx in range(self.start_row, self._row_count):
-            if self.__is_header_row(row_idx):
-                break
-        else:
+        header_row_idx = self.__get_sheet_profile().header_row_idx
+        if header_row_idx is None:
             raise DataError("header row not found")
 
-        return row_idx
+        return header_row_idx
 
-    def __is_header_row(self, row_idx):
+    def __get_sheet_profile(self):
         try:
             from excelrd import XL_CELL_EMPTY
         except ImportError:
             from xlrd import XL_CELL_EMPTY
 
-        return XL_CELL_EMPTY not in self._worksheet.row_types(
-            row_idx, self._start_col_idx, self._end_col_idx + 1
-        )
-
-    @staticmethod
-    def __is_empty_cell_types(cell_types):
-        try:
-            from excelrd import XL_CELL_EMPTY
-        except ImportError:
-            from xlrd import XL_CELL_EMPTY
+        sheet_name = self._sheet_name
+        if sheet_name not in self.__sheet_profiles:
+            # cell types of each row are read only once to find both of
+            # the column bounds and the header row
+            self.__sheet_profiles[sheet_name] = profile_sheet(
+                (self._worksheet.row_types(row_idx) for row_idx in range(self._row_count)),
+                start_row=self.start_row,
+                empty_value=XL_CELL_EMPTY,
+            )
 
-        return all([cell_type == XL_CELL_EMPTY for cell_type in cell_types])
+        return self.__sheet_profiles[sheet_name]
 
-    def __extract_not_empty_col_idx(self):
-        col_idx_list = [
-            col_idx
-            for col_idx in range(self._col_count)
-            if not self.__is_empty_cell_types(self._worksheet.col_types(col_idx))
+    def __to_row_values(self, row):
+        values = [
+            "" if value is None else value
+            for value in row[self._start_col_idx : self._end_col_idx + 1]
         ]
 
-        self._start_col_idx = min(col_idx_list)
-        self._end_col_idx = max(col_idx_list)
+        # rows of read-only worksheets may not include trailing empty cells
+        num_missing = self._end_col_idx - self._start_col_idx + 1 - len(values)
+        if num_missing > 0:
+            values.extend([""] * num_missing)
+
+        return values
 
     def __get_row_values(self, row_idx):
         return self._worksheet.row_values(row_idx, self._start_col_idx, self._end_col_idx + 1)
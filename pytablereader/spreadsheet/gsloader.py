@@ -11,6 +11,10 @@ from ..error import APIError, OpenError
 from .core import SpreadSheetLoader
 
 
+# number of the sheets that fetched by a values batch-get request
+_BATCH_SIZE = 10
+
+
 class GoogleSheetsTableLoader(SpreadSheetLoader):
     """
     Concrete class of Google Spreadsheet loader.
@@ -23,7 +27,6 @@ class GoogleSheetsTableLoader(SpreadSheetLoader):
 
     :Dependency Packages:
         - `gspread <https://github.com/burnash/gspread>`_
-        - `SimpleSQLite <https://github.com/thombashi/SimpleSQLite>`_
         - `oauth2client <https://pypi.org/project/oauth2client>`_
         - `pyOpenSSL <https://pypi.org/project/pyOpenSSL>`_
 
@@ -76,48 +79,38 @@ class GoogleSheetsTableLoader(SpreadSheetLoader):
         """
 
         import gspread
-        from oauth2client.service_account import ServiceAccountCredentials
 
         self._validate_table_name()
         self._validate_title()
 
-        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-        credentials = ServiceAccountCredentials.from_json_keyfile_name(self.source, scope)
-
-        gc = gspread.authorize(credentials)
+        gc = self._create_client()
         try:
-            for worksheet in gc.open(self.title).worksheets():
-                self._worksheet = worksheet
-                self.__all_values = [row for row in worksheet.get_all_values()]
-
-                if self._is_empty_sheet():
-                    continue
-
-                try:
-                    self.__strip_empty_col()
-                except ValueError:
-                    continue
-
-                value_matrix = self.__all_values[self._get_start_row_idx() :]
-                try:
-                    headers = value_matrix[0]
-                    rows = value_matrix[1:]
-                except IndexError:
-                    continue
-
-                self.inc_table_count()
-
-                yield TableData(
-                    self.make_table_name(),
-                    headers,
-                    rows,
-                    dp_extractor=self.dp_extractor,
-                    type_hints=self._extract_type_hints(headers),
-                )
+            spreadsheet = gc.open(self.title)
+            worksheets = spreadsheet.worksheets()
+
+            for batch_start in range(0, len(worksheets), _BATCH_SIZE):
+                batch_worksheets = worksheets[batch_start : batch_start + _BATCH_SIZE]
+                value_ranges = self.__batch_get_values(spreadsheet, batch_worksheets)
+
+                for worksheet, values in zip(batch_worksheets, value_ranges):
+                    table_data = self.__to_table_data(worksheet, values)
+                    if table_data is not None:
+                        yield table_data
         except gspread.exceptions.SpreadsheetNotFound:
             raise OpenError(f"spreadsheet '{self.title}' not found")
         except gspread.exceptions.APIError as e:
             raise APIError(e)
+        finally:
+            self.__all_values = None
+
+    def _create_client(self):
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+
+        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+        credentials = ServiceAccountCredentials.from_json_keyfile_name(self.source, scope)
+
+        return gspread.authorize(credentials)
 
     def _is_empty_sheet(self):
         return len(self.__all_values) <= 1
@@ -148,23 +141,64 @@ class GoogleSheetsTableLoader(SpreadSheetLoader):
 
         return self._expand_table_name_format(kv_mapping)
 
-    def __strip_empty_col(self):
-        from simplesqlite import connect_memdb
-        from simplesqlite.query import Attr, AttrList
+    def __to_table_data(self, worksheet, values):
+        """
+        :return: |TableData| of the worksheet. |None| if the sheet has no table.
+        """
 
-        con = connect_memdb()
+        self._worksheet = worksheet
+        self.__all_values = values
 
-        tmp_table_name = "tmp"
-        headers = [f"a{i:d}" for i in range(len(self.__all_values[0]))]
-        con.create_table_from_data_matrix(tmp_table_name, headers, self.__all_values)
-        for col_idx, header in enumerate(headers):
-            result = con.select(select=Attr(header), table_name=tmp_table_name)
-            if any([typepy.is_not_null_string(record[0]) for record in result.fetchall()]):
-                break
+        if self._is_empty_sheet():
+            return None
 
-        strip_headers = headers[col_idx:]
-        if typepy.is_empty_sequence(strip_headers):
+        try:
+            self.__strip_empty_col()
+        except ValueError:
+            return None
+
+        value_matrix = self.__all_values[self._get_start_row_idx() :]
+        try:
+            headers = value_matrix[0]
+            rows = value_matrix[1:]
+        except IndexError:
+            return None
+
+        self.inc_table_count()
+
+        return TableData(
+            self.make_table_name(),
+            headers,
+            rows,
+            dp_extractor=self.dp_extractor,
+            type_hints=self._extract_type_hints(headers),
+        )
+
+    @staticmethod
+    def __batch_get_values(spreadsheet, worksheets):
+        # a range that consists only of a quoted sheet name is the whole sheet
+        response = spreadsheet.values_batch_get(
+            ["'{}'".format(worksheet.title.replace("'", "''")) for worksheet in worksheets]
+        )
+
+        value_ranges = []
+        for value_range in response.get("valueRanges", []):
+            rows = value_range.get("values", [])
+
+            # trailing empty cells of rows are omitted from the response
+            num_cols = max([len(row) for row in rows], default=0)
+            value_ranges.append([row + [""] * (num_cols - len(row)) for row in rows])
+
+        return value_ranges
+
+    def __strip_empty_col(self):
+        num_cols = len(self.__all_values[0])
+
+        for col_idx in range(num_cols):
+            if any([typepy.is_not_null_string(row[col_idx]) for row in self.__all_values]):
+                break
+        else:
             raise ValueError()
 
-        result = con.select(select=AttrList(strip_headers), table_name=tmp_table_name)
-        self.__all_values = result.fetchall()
+        if col_idx > 0:
+            self.__all_values = [row[col_idx:] for row in self.__all_values]
@@ -18,6 +18,14 @@ class SqliteFileLoader(AbstractTableReader):
 
         Table name string. Defaults to ``%(filename)s_%(key)s``.
 
+    .. py:attribute:: chunk_size
+
+        Maximum number of rows of a |TableData|.
+        If a positive integer, rows of each table are read from the database
+        ``chunk_size`` rows at a time, and a table is loaded as
+        multiple |TableData| instances that have the same table name.
+        Load each table as a |TableData| if |None|. Defaults to |None|.
+
     :Dependency Packages:
         - `SimpleSQLite <https://github.com/thombashi/SimpleSQLite>`__
     """
@@ -29,6 +37,8 @@ class SqliteFileLoader(AbstractTableReader):
     def __init__(self, file_path=None, quoting_flags=None, type_hints=None, type_hint_rules=None):
         super().__init__(file_path, quoting_flags, type_hints, type_hint_rules)
 
+        self.chunk_size = None
+
         self._validator = FileValidator(file_path)
 
     def load(self):
@@ -36,6 +46,9 @@ class SqliteFileLoader(AbstractTableReader):
         Extract tabular data as |TableData| instances from a SQLite database
         file. |load_source_desc_file|
 
+        Declared types of the columns are used as the type hints of the
+        columns that have no type hints.
+
         :return:
             Loaded table data iterator.
             |load_table_name_desc|
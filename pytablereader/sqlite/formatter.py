@@ -11,6 +11,30 @@ from .._constant import TableNameTemplate as tnt
 from ..formatter import TableFormatter
 
 
+def _to_type_hint(declared_type):
+    # type affinity rules of SQLite columns: https://www.sqlite.org/datatype3.html
+    declared_type = declared_type.upper()
+
+    if "INT" in declared_type:
+        return typepy.Integer
+
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+        return typepy.RealNumber
+
+    # TEXT affinity columns are left to type inference: a String hint converts
+    # NULL values to 'None' strings.
+    # BLOB/NUMERIC affinity columns may include values of any types.
+    return None
+
+
+# storage classes of the values that each declared type hint is applicable to
+_STORAGE_CLASSES = {typepy.Integer: "integer", typepy.RealNumber: "real"}
+
+
+def _quote_identifier(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
 class SqliteTableFormatter(TableFormatter):
     def __init__(self, source_data):
         super().__init__(source_data)
@@ -25,22 +49,99 @@ class SqliteTableFormatter(TableFormatter):
         from simplesqlite.query import AttrList
 
         con = SimpleSQLite(self._source_data, "r")
+        chunk_size = self._loader.chunk_size
 
         for table in con.fetch_table_names():
             self.__table_name = table
 
             attr_names = con.fetch_attr_names(table)
-            data_matrix = con.select(select=AttrList(attr_names), table_name=table).fetchall()
-
-            yield TableData(
-                table,
-                attr_names,
-                data_matrix,
-                dp_extractor=self._loader.dp_extractor,
-                type_hints=self._extract_type_hints(attr_names),
-            )
+            type_hints = self.__extract_declared_type_hints(con, table, attr_names)
+            cursor = con.select(select=AttrList(attr_names), table_name=table)
+
+            if not chunk_size:
+                yield self.__to_table_data(table, attr_names, cursor.fetchall(), type_hints)
+                continue
+
+            rows = cursor.fetchmany(chunk_size)
+            while True:
+                yield self.__to_table_data(table, attr_names, rows, type_hints)
+
+                if len(rows) < chunk_size:
+                    break
+
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
 
     def _make_table_name(self):
         return self._loader._expand_table_name_format(
             self._loader._get_basic_tablename_keyvalue_mapping() + [(tnt.KEY, self.__table_name)]
         )
+
+    def __to_table_data(self, table, attr_names, rows, type_hints):
+        return TableData(
+            table, attr_names, rows, dp_extractor=self._loader.dp_extractor, type_hints=type_hints
+        )
+
+    def __extract_declared_type_hints(self, con, table, attr_names):
+        type_hints = self._extract_type_hints(attr_names)
+        if self._loader.type_hints:
+            return type_hints
+
+        # columns: cid, name, type, notnull, dflt_value, pk
+        result = con.execute_query(f"PRAGMA table_info({_quote_identifier(table)})")
+        declared_type_map = {row[1]: row[2] for row in result.fetchall()}
+        declared_type_hints = [
+            _to_type_hint(declared_type_map.get(attr_name) or "") for attr_name in attr_names
+        ]
+        declared_type_hints = self.__drop_mismatched_type_hints(
+            con, table, attr_names, declared_type_hints
+        )
+
+        if not type_hints:
+            return declared_type_hints
+
+        # type hints from the type hint rules take precedence over the declared types
+        return [
+            type_hint if type_hint is not None else declared_type_hint
+            for type_hint, declared_type_hint in zip(type_hints, declared_type_hints)
+        ]
+
+    @staticmethod
+    def __drop_mismatched_type_hints(con, table, attr_names, declared_type_hints):
+        """
+        Declared types of SQLite columns are only affinities: a column may include
+        values of other storage classes (e.g. 1.5 in an INTEGER column).
+        Drop the type hints of such columns to avoid lossy conversions.
+        """
+
+        hinted_columns = [
+            (attr_name, type_hint)
+            for attr_name, type_hint in zip(attr_names, declared_type_hints)
+            if type_hint is not None
+        ]
+        if not hinted_columns:
+            return declared_type_hints
+
+        # find the mismatched columns with a single scan of the table
+        result = con.execute_query(
+            "SELECT {} FROM {}".format(
+                ", ".join(
+                    "max(typeof({}) NOT IN ('null', '{}'))".format(
+                        _quote_identifier(attr_name), _STORAGE_CLASSES[type_hint]
+                    )
+                    for attr_name, type_hint in hinted_columns
+                ),
+                _quote_identifier(table),
+            )
+        )
+        mismatched_attr_names = {
+            attr_name
+            for (attr_name, _type_hint), is_mismatched in zip(hinted_columns, result.fetchone())
+            if is_mismatched
+        }
+
+        return [
+            None if attr_name in mismatched_attr_names else type_hint
+            for attr_name, type_hint in zip(attr_names, declared_type_hints)
+        ]
@@ -14,7 +14,9 @@ class TsvTableFileLoader(CsvTableFileLoader):
 
     .. py:attribute:: table_name
 
-        Table name string. Defaults to ``%(filename)s``.
+        Table name string. Defaults to ``%(filename)s``,
+        or ``%(filename)s_%(format_id)s`` if
+        :py:attr:`~.CsvTableLoader.chunk_size` is set.
     """
 
     @property
@@ -40,12 +40,12 @@ with open(os.path.join(REQUIREMENT_DIR, "test_requirements.txt")) as f:
     tests_requires = [line.strip() for line in f if line.strip()]
 
 setuptools_require = ["setuptools>=38.3.0"]
-excel_requires = ["excelrd>=2.0.2"]
+excel_requires = ["excelrd>=2.0.2", "openpyxl>=2.6"]
 
 markdown_requires = ["Markdown>=2.6.6,<4"]
 mediawiki_requires = ["pypandoc"]
 sqlite_requires = ["SimpleSQLite>=1.3.2,<2"]
-gs_requires = ["gspread", "oauth2client", "pyOpenSSL"] + sqlite_requires
+gs_requires = ["gspread", "oauth2client", "pyOpenSSL"]
 logging_requires = ["loguru>=0.4.1,<1"]
 url_requires = ["retryrequests>=0.1,<1"]
 optional_requires = ["simplejson>=3.8.1,<4"]
@@ -8,6 +8,27 @@ import pytablereader as ptr
 
 
 class Test_TableFileLoaderFactory:
+    def test_normal_encoding(self, tmpdir, monkeypatch):
+        detect = ptr.EncodingDetector.detect
+        detected_paths = []
+
+        def detect_wrapper(self, file_path):
+            detected_paths.append(file_path)
+            return detect(self, file_path)
+
+        monkeypatch.setattr(ptr.EncodingDetector, "detect", detect_wrapper)
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-16") as f:
+            f.write("a,b\n1,2\n")
+
+        loader = ptr.factory.TableFileLoaderFactory(file_path).create_from_path()
+        for tabledata in loader.load():
+            assert tabledata.value_matrix == [[1, 2]]
+
+        assert loader.encoding == "utf_16"
+        assert detected_paths == [file_path]
+
     @pytest.mark.parametrize(["value", "expected"], [[None, ValueError]])
     def test_exception(self, value, expected):
         with pytest.raises(expected):
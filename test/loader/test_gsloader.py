@@ -3,8 +3,72 @@
 """
 
 import pytest
+from tabledata import TableData
 
 from pytablereader import GoogleSheetsTableLoader
+from pytablereader.error import OpenError
+from pytablereader.interface import AbstractTableReader
+
+
+class FakeWorksheet:
+    def __init__(self, title, values):
+        self.title = title
+        self.values = values
+
+    @property
+    def row_count(self):
+        return len(self.values)
+
+    @property
+    def col_count(self):
+        return max([len(row) for row in self.values], default=0)
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheets):
+        self.__worksheets = worksheets
+        self.batch_get_ranges = []
+
+    def worksheets(self):
+        return self.__worksheets
+
+    def values_batch_get(self, ranges):
+        self.batch_get_ranges.append(ranges)
+        worksheet_map = {
+            "'{}'".format(worksheet.title.replace("'", "''")): worksheet
+            for worksheet in self.__worksheets
+        }
+
+        value_ranges = []
+        for range_name in ranges:
+            value_range = {"range": range_name, "majorDimension": "ROWS"}
+
+            # same as the Sheets API: trailing empty cells/rows are omitted
+            rows = [list(row) for row in worksheet_map[range_name].values]
+            for row in rows:
+                while row and row[-1] == "":
+                    row.pop()
+            while rows and not rows[-1]:
+                rows.pop()
+            if rows:
+                value_range["values"] = rows
+
+            value_ranges.append(value_range)
+
+        return {"valueRanges": value_ranges}
+
+
+class FakeClient:
+    def __init__(self, spreadsheets):
+        self.spreadsheets = spreadsheets
+
+    def open(self, title):
+        import gspread
+
+        try:
+            return self.spreadsheets[title]
+        except KeyError:
+            raise gspread.exceptions.SpreadsheetNotFound()
 
 
 class Test_GoogleSheetsTableLoader_make_table_name:
@@ -47,3 +111,79 @@ class Test_GoogleSheetsTableLoader_make_table_name:
 
         with pytest.raises(expected):
             loader.make_table_name()
+
+
+class Test_GoogleSheetsTableLoader_load:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    def __make_loader(self, monkeypatch, spreadsheet):
+        pytest.importorskip("gspread")
+
+        loader = GoogleSheetsTableLoader("dummy")
+        loader.title = "testbook"
+        monkeypatch.setattr(loader, "_create_client", lambda: FakeClient({"testbook": spreadsheet}))
+
+        return loader
+
+    def test_normal(self, monkeypatch):
+        spreadsheet = FakeSpreadsheet(
+            [
+                FakeWorksheet(
+                    "testsheet1",
+                    [["a", "b", "c"], ["1", "1.1", "x"], ["2", "", "y"], ["3", "3.3", ""]],
+                ),
+                FakeWorksheet(
+                    "test'sheet2",
+                    [
+                        ["", "", "", ""],
+                        ["", "", "", ""],
+                        ["", "a2", "b2", ""],
+                        ["", "1", "", ""],
+                        ["", "2", "c", ""],
+                    ],
+                ),
+                FakeWorksheet("emptysheet", []),
+                FakeWorksheet("headeronly", [["a", "b"]]),
+            ]
+        )
+        loader = self.__make_loader(monkeypatch, spreadsheet)
+
+        expected_list = [
+            TableData(
+                "testsheet1",
+                ["a", "b", "c"],
+                [["1", "1.1", "x"], ["2", "", "y"], ["3", "3.3", ""]],
+            ),
+            TableData("test'sheet2", ["a2", "b2"], [["1", ""], ["2", "c"]]),
+        ]
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected_list)
+        for table_data, expected in zip(actual, expected_list):
+            assert table_data.table_name == expected.table_name
+            assert list(table_data.headers) == list(expected.headers)
+            assert table_data.rows == expected.rows
+
+        assert spreadsheet.batch_get_ranges == [
+            ["'testsheet1'", "'test''sheet2'", "'emptysheet'", "'headeronly'"]
+        ]
+
+    def test_normal_batch(self, monkeypatch):
+        spreadsheet = FakeSpreadsheet(
+            [FakeWorksheet(f"sheet{i:d}", [["a"], [str(i)]]) for i in range(25)]
+        )
+        loader = self.__make_loader(monkeypatch, spreadsheet)
+
+        assert [table_data.table_name for table_data in loader.load()] == [
+            f"sheet{i:d}" for i in range(25)
+        ]
+        assert [len(ranges) for ranges in spreadsheet.batch_get_ranges] == [10, 10, 5]
+
+    def test_exception_not_found(self, monkeypatch):
+        loader = self.__make_loader(monkeypatch, FakeSpreadsheet([]))
+        loader.title = "not_exist"
+
+        with pytest.raises(OpenError):
+            list(loader.load())
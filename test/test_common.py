@@ -4,8 +4,18 @@
 
 import pytest
 
-from pytablereader import InvalidFilePathError
-from pytablereader._common import get_extension, make_temp_file_path_from_url
+import pytablereader as ptr
+from pytablereader import EncodingDetector, InvalidFilePathError
+from pytablereader._common import (
+    extract_headers,
+    get_extension,
+    get_file_encoding,
+    json_loads,
+    make_temp_file_path_from_url,
+    open_text_file,
+    set_json_backend,
+)
+from pytablereader._mmap import open_mmap_text
 
 
 class Test_get_extension:
@@ -53,3 +63,136 @@ class Test_make_temp_file_path_from_url:
     def test_null_table_name(self, temp_dir_path, value, expected):
         with pytest.raises(expected):
             make_temp_file_path_from_url(temp_dir_path, value)
+
+
+class Test_EncodingDetector_detect:
+    @pytest.mark.parametrize(
+        ["text", "encoding", "expected"],
+        [
+            ["a,b\n1,2\n", "utf-8-sig", "utf_8_sig"],
+            ["a,b\n1,2\n", "utf-16", "utf_16"],
+            ["a,b\n1,2\n", "utf-32", "utf_32"],
+            ["a,b\n1,2\n", "ascii", "utf-8"],
+            ["a,b\n1,2\n" + "あいうえお,かきくけこ\n" * 10, "utf-8", "utf_8"],
+        ],
+    )
+    def test_normal(self, tmpdir, text, encoding, expected):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding=encoding) as f:
+            f.write(text)
+
+        assert EncodingDetector().detect(file_path) == expected
+
+    def test_normal_probe(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n" * 100 + "あいうえお,かきくけこ\n" * 10)
+
+        assert EncodingDetector(sample_size=16).detect(file_path) == "utf-8"
+        assert EncodingDetector(sample_size=64, probe_tail=True).detect(file_path) == "utf_8"
+
+    @pytest.mark.parametrize(["filename"], [["tmp.xlsx"], ["tmp.sqlite"]])
+    def test_normal_binary(self, tmpdir, filename):
+        file_path = str(tmpdir.join(filename))
+        with open(file_path, "wb") as f:
+            f.write(b"\x00\x01\x02")
+
+        assert EncodingDetector().detect(file_path) is None
+
+    def test_normal_not_exist(self, tmpdir):
+        assert EncodingDetector().detect(str(tmpdir.join("not_exist.csv"))) is None
+
+    @pytest.mark.parametrize(["value", "expected"], [[0, ValueError], [-1, ValueError]])
+    def test_exception(self, value, expected):
+        with pytest.raises(expected):
+            EncodingDetector(sample_size=value)
+
+
+class Test_extract_headers:
+    @pytest.mark.parametrize(
+        ["records", "sample_size", "expected"],
+        [
+            [[], None, []],
+            [[{"b": 1, "a": 2}, {"c": 3, "a": 4}, {"d": 5}], None, ["b", "a", "c", "d"]],
+            [[{"b": 1, "a": 2}, {"c": 3, "a": 4}, {"d": 5}], 2, ["b", "a", "c"]],
+            [iter([{"b": 1}, {"a": 2}]), 0, []],
+        ],
+    )
+    def test_normal(self, records, sample_size, expected):
+        assert extract_headers(records, sample_size) == expected
+
+
+class Test_get_file_encoding:
+    def test_normal(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-16") as f:
+            f.write("a,b\n1,2\n")
+
+        assert get_file_encoding(file_path, None) == "utf_16"
+        assert get_file_encoding(file_path, "cp932") == "cp932"
+        assert get_file_encoding(str(tmpdir.join("not_exist.csv")), None) == "utf-8"
+
+
+class Test_open_text_file:
+    @pytest.mark.parametrize(
+        ["text", "encoding"],
+        [["a,b\n1,2\n", "utf-8"], ["姓,名\r\n山田,太郎\r\n", "utf-16"], ["", "utf-8"]],
+    )
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
+    def test_normal(self, tmpdir, text, encoding, use_mmap):
+        file_path = str(tmpdir.join("tmp.txt"))
+        with open(file_path, "w", encoding=encoding) as f:
+            f.write(text)
+
+        with open(file_path, encoding=encoding) as f:
+            expected = f.readlines()
+
+        with open_text_file(file_path, encoding, use_mmap) as f:
+            assert f.readlines() == expected
+
+
+class Test_open_mmap_text:
+    def test_normal_range(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.txt"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n1,2\n3,4\n")
+
+        with open_mmap_text(file_path, "utf-8", 4, 8) as f:
+            assert f.read() == "1,2\n"
+            f.seek(0)
+            assert f.readline() == "1,2\n"
+
+
+class Test_set_json_backend:
+    def teardown_method(self, method):
+        set_json_backend(None)
+
+    def test_normal(self):
+        class Backend:
+            @staticmethod
+            def loads(text):
+                return [{"backend": text}]
+
+        set_json_backend(Backend)
+        assert json_loads("[]") == [{"backend": "[]"}]
+
+        loader = ptr.JsonTableTextLoader("[]")
+        assert loader.load_dict() == [{"backend": "[]"}]
+
+        set_json_backend("json")
+        assert json_loads('{"a": 1}') == {"a": 1}
+        assert type(json_loads('{"a": 1}')) is dict
+
+        set_json_backend(None)
+        assert json_loads('{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize(
+        ["backend", "expected"],
+        [
+            ["not_existing_json_module", ImportError],
+            [object(), TypeError],
+        ],
+    )
+    def test_exception(self, backend, expected):
+        with pytest.raises(expected):
+            set_json_backend(backend)
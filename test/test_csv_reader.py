@@ -246,7 +246,10 @@ class Test_CsvTableFileLoader_load:
             [6, test_data_06.value, "tmp.csv", [], [], test_data_06.expected],
         ],
     )
-    def test_normal(self, tmpdir, test_id, table_text, filename, headers, type_hints, expected):
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
+    def test_normal(
+        self, tmpdir, test_id, table_text, filename, headers, type_hints, use_mmap, expected
+    ):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
 
@@ -255,6 +258,7 @@ class Test_CsvTableFileLoader_load:
 
         loader = ptr.CsvTableFileLoader(file_path, type_hints=type_hints)
         loader.headers = headers
+        loader.use_mmap = use_mmap
 
         for tabledata in loader.load():
             print(f"test-id={test_id}")
@@ -275,8 +279,9 @@ class Test_CsvTableFileLoader_load:
             ]
         ],
     )
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
     def test_normal_multibyte(
-        self, tmpdir, test_id, table_text, filename, encoding, headers, expected
+        self, tmpdir, test_id, table_text, filename, encoding, headers, use_mmap, expected
     ):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
@@ -286,6 +291,7 @@ class Test_CsvTableFileLoader_load:
 
         loader = ptr.CsvTableFileLoader(file_path)
         loader.headers = headers
+        loader.use_mmap = use_mmap
 
         for tabledata in loader.load():
             print(f"test-id={test_id}")
@@ -293,6 +299,50 @@ class Test_CsvTableFileLoader_load:
 
             assert tabledata.in_tabledata_list(expected)
 
+    @pytest.mark.parametrize(
+        ["chunk_size", "expected"],
+        [
+            [
+                2,
+                [
+                    TableData(
+                        "tmp_1",
+                        ["attr_a", "attr_b", "attr_c"],
+                        [[1, 4, "a"], [2, Decimal("2.1"), "bb"]],
+                    ),
+                    TableData(
+                        "tmp_2", ["attr_a", "attr_b", "attr_c"], [[3, Decimal("120.9"), "ccc"]]
+                    ),
+                ],
+            ],
+            [
+                10,
+                [
+                    TableData(
+                        "tmp_1",
+                        ["attr_a", "attr_b", "attr_c"],
+                        [[1, 4, "a"], [2, Decimal("2.1"), "bb"], [3, Decimal("120.9"), "ccc"]],
+                    )
+                ],
+            ],
+        ],
+    )
+    def test_normal_chunk(self, tmpdir, chunk_size, expected):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(test_data_00.value)
+
+        loader = ptr.CsvTableFileLoader(file_path)
+        loader.chunk_size = chunk_size
+
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == len(expected)
+        for tabledata, expected_tabledata in zip(tabledata_list, expected):
+            print(dumps_tabledata(tabledata))
+
+            assert tabledata.equals(expected_tabledata)
+
     @pytest.mark.skipif(platform.system() == "Windows", reason="platform dependent tests")
     @pytest.mark.parametrize(
         ["table_text", "fifo_name", "expected"],
@@ -321,7 +371,8 @@ class Test_CsvTableFileLoader_load:
             ["\n".join([]), "hoge.csv", ["attr_a", "attr_b", "attr_c"], ptr.DataError],
         ],
     )
-    def test_exception(self, tmpdir, table_text, filename, headers, expected):
+    @pytest.mark.parametrize(["chunk_size"], [[None], [2]])
+    def test_exception(self, tmpdir, table_text, filename, headers, chunk_size, expected):
         p_csv = tmpdir.join(filename)
 
         with open(str(p_csv), "w", encoding="utf8") as f:
@@ -329,6 +380,7 @@ class Test_CsvTableFileLoader_load:
 
         loader = ptr.CsvTableFileLoader(str(p_csv))
         loader.headers = headers
+        loader.chunk_size = chunk_size
 
         with pytest.raises(expected):
             for _tabletuple in loader.load():
@@ -347,6 +399,194 @@ class Test_CsvTableFileLoader_load:
                 pass
 
 
+class Test_CsvTableFileLoader_load_parallel:
+    TABLE_TEXT = "\n".join(
+        ['"attr_a","attr_b","attr_c"']
+        + [
+            f'{i},{i}.5,"multi\nline ""{i}"""' if i % 3 == 0 else f'{i},{i}.5,"a{i}"'
+            for i in range(50)
+        ]
+    )
+
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(["range_size"], [[1], [7], [64], [1024]])
+    def test_normal_split_byte_ranges(self, tmpdir, range_size):
+        from pytablereader.csv._parser import parse_byte_range, split_byte_ranges
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            f.write(self.TABLE_TEXT)
+
+        byte_ranges = split_byte_ranges(file_path, '"', range_size)
+
+        assert byte_ranges[0][0] == 0
+        assert byte_ranges[-1][1] == os.path.getsize(file_path)
+        for (_start, end), (next_start, _end) in zip(byte_ranges, byte_ranges[1:]):
+            assert end == next_start
+
+        rows = []
+        for start, end in byte_ranges:
+            rows.extend(parse_byte_range(file_path, "utf-8", start, end, ",", '"', None))
+
+        loader = ptr.CsvTableFileLoader(file_path)
+        assert [loader.iter_rows().headers] + list(loader.iter_rows()) == rows
+
+    @pytest.mark.parametrize(["encoding"], [["utf-8"], ["utf-8-sig"], ["utf-16"]])
+    @pytest.mark.parametrize(["chunk_size"], [[None], [20]])
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
+    def test_normal(self, tmpdir, monkeypatch, encoding, chunk_size, use_mmap):
+        monkeypatch.setattr("pytablereader.csv.core.MIN_RANGE_SIZE", 64)
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding=encoding) as f:
+            f.write(self.TABLE_TEXT)
+
+        expected_loader = ptr.CsvTableFileLoader(file_path)
+        expected_loader.chunk_size = chunk_size
+        expected = list(expected_loader.load())
+
+        loader = ptr.CsvTableFileLoader(file_path, type_hints=[Integer, RealNumber, String])
+        loader.chunk_size = chunk_size
+        loader.max_workers = 2
+        loader.use_mmap = use_mmap
+
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == len(expected)
+        for tabledata, expected_tabledata in zip(tabledata_list, expected):
+            assert tabledata.value_matrix == expected_tabledata.value_matrix
+
+    def test_normal_numeric_headers(self, tmpdir, monkeypatch):
+        monkeypatch.setattr("pytablereader.csv.core.MIN_RANGE_SIZE", 64)
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(["1,2"] + [f"{i},{i * 2}" for i in range(50)]))
+
+        loader = ptr.CsvTableFileLoader(file_path, type_hints=[Integer, Integer])
+        loader.max_workers = 2
+
+        for tabledata in loader.load():
+            assert tabledata.headers == ["1", "2"]
+            assert tabledata.value_matrix == [[i, i * 2] for i in range(50)]
+
+    def test_normal_bare_quote(self, tmpdir, monkeypatch):
+        monkeypatch.setattr("pytablereader.csv.core.MIN_RANGE_SIZE", 64)
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            # a bare quote within an unquoted field is valid for the csv module
+            f.write(self.TABLE_TEXT.replace("\n", '\n5" screen,1,"a"\n', 1))
+
+        expected = list(ptr.CsvTableFileLoader(file_path).load())
+
+        loader = ptr.CsvTableFileLoader(file_path)
+        loader.max_workers = 2
+
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == len(expected) == 1
+        assert tabledata_list[0].value_matrix == expected[0].value_matrix
+        assert tabledata_list[0].value_matrix[0] == ['5" screen', 1, "a"]
+
+    def test_exception(self, tmpdir, monkeypatch):
+        monkeypatch.setattr("pytablereader.csv.core.MIN_RANGE_SIZE", 16)
+
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(self.TABLE_TEXT + '\n1,2,"invalid"x\n')
+
+        loader = ptr.CsvTableFileLoader(file_path)
+        loader.max_workers = 2
+
+        with pytest.raises(ptr.DataError):
+            for _tabledata in loader.load():
+                pass
+
+
+class Test_CsvTableFileLoader_iter_rows:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["table_text", "headers", "batch_size", "expected_headers", "expected"],
+        [
+            [
+                test_data_00.value,
+                [],
+                None,
+                ["attr_a", "attr_b", "attr_c"],
+                [["1", "4", "a"], ["2", "2.1", "bb"], ["3", "120.9", "ccc"]],
+            ],
+            [
+                test_data_00.value,
+                [],
+                2,
+                ["attr_a", "attr_b", "attr_c"],
+                [[["1", "4", "a"], ["2", "2.1", "bb"]], [["3", "120.9", "ccc"]]],
+            ],
+            [
+                test_data_02.value,
+                ["a", "b", "c"],
+                5,
+                ["a", "b", "c"],
+                [[["3", "120.9", "ccc"]]],
+            ],
+        ],
+    )
+    def test_normal(self, tmpdir, table_text, headers, batch_size, expected_headers, expected):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(table_text)
+
+        loader = ptr.CsvTableFileLoader(file_path)
+        loader.headers = headers
+        row_iter = loader.iter_rows(batch_size=batch_size)
+
+        assert row_iter.headers == expected_headers
+        assert list(row_iter) == expected
+
+    def test_normal_type_hints(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(test_data_00.value)
+
+        loader = ptr.CsvTableFileLoader(file_path, type_hints=[Integer, None, String])
+
+        assert list(loader.iter_rows()) == [[1, "4", "a"], [2, "2.1", "bb"], [3, "120.9", "ccc"]]
+
+    def test_normal_type_hint_rules(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write('"a text","b integer","c real"\n01,"01","1.1"\n')
+
+        loader = ptr.CsvTableFileLoader(file_path, type_hint_rules=TYPE_HINT_RULES)
+        row_iter = loader.iter_rows()
+
+        assert row_iter.type_hints == [String, Integer, RealNumber]
+        assert list(row_iter) == [["01", 1, Decimal("1.1")]]
+
+    @pytest.mark.parametrize(
+        ["table_text", "batch_size", "expected"],
+        [
+            ["", None, ptr.DataError],
+            [",b\n1,2\n", None, ptr.DataError],
+            [test_data_00.value, 0, ValueError],
+        ],
+    )
+    def test_exception(self, tmpdir, table_text, batch_size, expected):
+        file_path = str(tmpdir.join("tmp.csv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(table_text)
+
+        loader = ptr.CsvTableFileLoader(file_path)
+
+        with pytest.raises(expected):
+            list(loader.iter_rows(batch_size=batch_size))
+
+
 class Test_CsvTableTextLoader_make_table_name:
     def setup_method(self, method):
         AbstractTableReader.clear_table_count()
@@ -432,6 +672,13 @@ class Test_CsvTableTextLoader_load:
                 ["030", 30, Decimal("1.3")],
             ]
 
+    def test_normal_numeric_headers(self):
+        loader = ptr.CsvTableTextLoader("1,2\n3,4\n5,6", type_hints=[Integer, Integer])
+
+        for tbldata in loader.load():
+            assert tbldata.headers == ["1", "2"]
+            assert tbldata.value_matrix == [[3, 4], [5, 6]]
+
     @pytest.mark.parametrize(
         ["table_text", "table_name", "headers", "expected"],
         [
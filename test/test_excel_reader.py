@@ -2,6 +2,8 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import re
+
 import pytest
 import xlsxwriter
 from pytablewriter import dumps_tabledata
@@ -9,6 +11,7 @@ from tabledata import TableData
 
 import pytablereader as ptr
 from pytablereader.interface import AbstractTableReader
+from pytablereader.spreadsheet._profile import profile_sheet
 
 
 def write_worksheet(worksheet, table):
@@ -224,3 +227,158 @@ class Test_ExcelTableFileLoader_load:
         with pytest.raises(expected):
             for _tabletuple in loader.load():
                 pass
+
+
+class Test_ExcelTableFileLoader_load_openpyxl:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["table_name", "start_row", "expected_list"],
+        [
+            [
+                "%(sheet)s",
+                0,
+                [
+                    TableData(
+                        "boolsheet",
+                        ["true", "false", "tf", "lost"],
+                        [
+                            [True, False, True, True],
+                            [True, False, False, ""],
+                            [True, False, False, False],
+                        ],
+                    ),
+                    TableData(
+                        "testsheet1",
+                        ["a1", "b1", "c1"],
+                        [["aa1", "ab1", "ac1"], [1, 1.1, "a"], [2, 2.2, "bb"], [3, 3.3, "cc"]],
+                    ),
+                    TableData(
+                        "testsheet3",
+                        ["a3", "b3", "c3"],
+                        [["aa3", "ab3", "ac3"], [4, 1.1, "a"], [5, "", "bb"], [6, 3.3, ""]],
+                    ),
+                ],
+            ],
+            [
+                "%(filename)s_%(sheet)s",
+                2,
+                [
+                    TableData("tmp_boolsheet", ["TRUE", "FALSE", "False", "False"], []),
+                    TableData(
+                        "tmp_testsheet1",
+                        ["aa1", "ab1", "ac1"],
+                        [[1, 1.1, "a"], [2, 2.2, "bb"], [3, 3.3, "cc"]],
+                    ),
+                    TableData(
+                        "tmp_testsheet3",
+                        ["a3", "b3", "c3"],
+                        [["aa3", "ab3", "ac3"], [4, 1.1, "a"], [5, "", "bb"], [6, 3.3, ""]],
+                    ),
+                ],
+            ],
+        ],
+    )
+    def test_normal(self, valid_excel_file_path, table_name, start_row, expected_list):
+        pytest.importorskip("openpyxl")
+
+        loader = ptr.ExcelTableFileLoader(valid_excel_file_path)
+        loader.table_name = table_name
+        loader.start_row = start_row
+        loader.engine = "openpyxl"
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected_list)
+        for table_data in actual:
+            print(f"[actual]\n{dumps_tabledata(table_data)}")
+            assert table_data.in_tabledata_list(expected_list)
+
+    def test_abnormal(self, invalid_excel_file_path):
+        pytest.importorskip("openpyxl")
+
+        loader = ptr.ExcelTableFileLoader(invalid_excel_file_path)
+        loader.engine = "openpyxl"
+
+        assert list(loader.load()) == []
+
+    @pytest.mark.parametrize(["filename"], [["tmp.xls"], ["tmp.csv"]])
+    def test_exception_invalid_file(self, tmpdir, filename):
+        pytest.importorskip("openpyxl")
+
+        file_path = str(tmpdir.join(filename))
+        with open(file_path, "w") as f:
+            f.write("a,b\n1,2\n")
+
+        loader = ptr.ExcelTableFileLoader(file_path)
+        loader.engine = "openpyxl"
+
+        with pytest.raises(ptr.OpenError):
+            for _tabledata in loader.load():
+                pass
+
+    def test_exception_engine(self, valid_excel_file_path):
+        loader = ptr.ExcelTableFileLoader(valid_excel_file_path)
+        loader.engine = "unknown"
+
+        with pytest.raises(ValueError):
+            loader.load()
+
+
+class Test_ExcelTableFileLoader_load_sheets:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["sheets", "expected"],
+        [
+            [None, ["boolsheet", "testsheet1", "testsheet3"]],
+            ["testsheet1", ["testsheet1"]],
+            [0, ["boolsheet"]],
+            [[0, "testsheet3"], ["boolsheet", "testsheet3"]],
+            [re.compile("^testsheet"), ["testsheet1", "testsheet3"]],
+            [2, []],
+            ["not_exist", []],
+            [[], []],
+        ],
+    )
+    @pytest.mark.parametrize(["engine"], [["xlrd"], ["openpyxl"]])
+    def test_normal(self, valid_excel_file_path, engine, sheets, expected):
+        if engine == "openpyxl":
+            pytest.importorskip("openpyxl")
+
+        loader = ptr.ExcelTableFileLoader(valid_excel_file_path)
+        loader.engine = engine
+        loader.sheets = sheets
+
+        assert [table_data.table_name for table_data in loader.load()] == expected
+
+
+class Test_profile_sheet:
+    @pytest.mark.parametrize(
+        ["rows", "start_row", "expected"],
+        [
+            [[], 0, (None, None, None, None)],
+            [[[None, None], [None]], 0, (None, None, None, None)],
+            [[[None, "a", "b"], [None, 1, 2]], 0, (1, 2, 0, 1)],
+            # the header row is searched from start_row
+            [[["a", "b"], [1, 2], [3, 4]], 1, (0, 1, 1, 2)],
+            # rows that have empty cells between the bounds are not the header
+            [[["a", None, "c"], [1, 2, 3]], 0, (0, 2, 1, 1)],
+            # a row after the header widens the bounds
+            [[["a", "b"], [1, 2], [1, 2, 3], [4, 5, 6]], 0, (0, 2, 2, 3)],
+            # a row before the header widens the bounds
+            [[[None, None, "x"], ["a", "b", "c"], [1, None, None]], 1, (0, 2, 1, 2)],
+            [[["a", None], [None, "b"]], 0, (0, 1, None, 1)],
+        ],
+    )
+    def test_normal(self, rows, start_row, expected):
+        profile = profile_sheet(rows, start_row=start_row)
+
+        assert (
+            profile.start_col_idx,
+            profile.end_col_idx,
+            profile.header_row_idx,
+            profile.last_row_idx,
+        ) == expected
@@ -462,8 +462,9 @@ class Test_HtmlTableFileLoader_load:
             [7, test_data_07.value, "tmp7.html", test_data_07.table_name, test_data_07.expected],
         ],
     )
+    @pytest.mark.parametrize("streaming", [False, True])
     def test_normal(
-        self, tmpdir, test_id, table_text, filename, table_name, expected_tabledata_list
+        self, tmpdir, test_id, table_text, filename, table_name, expected_tabledata_list, streaming
     ):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
@@ -473,6 +474,7 @@ class Test_HtmlTableFileLoader_load:
 
         loader = ptr.HtmlTableFileLoader(file_path)
         loader.table_name = table_name
+        loader.streaming = streaming
 
         for table_data in loader.load():
             print(f"--- test {test_id} ---")
@@ -483,13 +485,15 @@ class Test_HtmlTableFileLoader_load:
     @pytest.mark.parametrize(
         ["table_text", "filename", "expected"], [["", "tmp.html", ptr.DataError]]
     )
-    def test_exception_invalid_data(self, tmpdir, table_text, filename, expected):
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_exception_invalid_data(self, tmpdir, table_text, filename, expected, streaming):
         p_file_path = tmpdir.join(filename)
 
         with open(str(p_file_path), "w") as f:
             f.write(table_text)
 
         loader = ptr.HtmlTableFileLoader(str(p_file_path))
+        loader.streaming = streaming
 
         with pytest.raises(expected):
             for _tabletuple in loader.load():
@@ -520,9 +524,15 @@ class Test_HtmlTableTextLoader_load:
             [test_data_03.value, test_data_03.table_name, test_data_03.expected],
         ],
     )
-    def test_normal(self, table_text, table_name, expected_tabletuple_list):
+    @pytest.mark.parametrize("streaming", [False, True])
+    @pytest.mark.parametrize("parse_tables_only", [False, True])
+    def test_normal(
+        self, table_text, table_name, expected_tabletuple_list, streaming, parse_tables_only
+    ):
         loader = self.LOADER_CLASS(table_text)
         loader.table_name = table_name
+        loader.streaming = streaming
+        loader.parse_tables_only = parse_tables_only
 
         for table_data in loader.load():
             print(f"[actual]\n{dumps_tabledata(table_data)}")
@@ -573,10 +583,176 @@ class Test_HtmlTableTextLoader_load:
     @pytest.mark.parametrize(
         ["table_text", "expected"], [["", ptr.DataError], [None, ptr.DataError]]
     )
-    def test_exception_null(self, table_text, expected):
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_exception_null(self, table_text, expected, streaming):
         loader = ptr.HtmlTableTextLoader(table_text)
         loader.table_name = "dummy"
+        loader.streaming = streaming
 
         with pytest.raises(expected):
             for _tabletuple in loader.load():
                 pass
+
+
+class Test_HtmlTableTextLoader_load_streaming:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["table_text", "expected"],
+        [
+            [
+                # end tags of rows and cells are omitted
+                dedent(
+                    """\
+                    <title>omit</title>
+                    <table id="omit">
+                        <tr><th>a<th>b
+                        <tr><td>1<td>x
+                        <tr><td>2<td>y
+                    </table>
+                    """
+                ),
+                [TableData("omit_omit", ["a", "b"], [[1, "x"], [2, "y"]])],
+            ],
+            [
+                # the title follows the table
+                dedent(
+                    """\
+                    <table>
+                        <caption> cap </caption>
+                        <tr><th>a</th></tr>
+                        <tr><td>1</td></tr>
+                    </table>
+                    <title>late</title>
+                    """
+                ),
+                [TableData("late_cap", ["a"], [[1]])],
+            ],
+            [
+                # no title
+                dedent(
+                    """\
+                    <table id="t">
+                        <tr><th>a</th></tr>
+                        <tr><td>&lt;1&gt;</td></tr>
+                    </table>
+                    """
+                ),
+                [TableData("t", ["a"], [["<1>"]])],
+            ],
+        ],
+    )
+    def test_normal(self, table_text, expected):
+        loader = ptr.HtmlTableTextLoader(table_text)
+        loader.streaming = True
+
+        for table_data in loader.load():
+            assert table_data.in_tabledata_list(expected)
+
+    @pytest.mark.parametrize(
+        ["table_text"],
+        [
+            [
+                dedent(
+                    """\
+                    <title>nested</title>
+                    <table id="outer">
+                        <tr><th>a</th><th>b</th></tr>
+                        <tr>
+                            <td>1</td>
+                            <td><table id="inner"><tr><th>x</th></tr><tr><td>10</td></tr></table></td>
+                        </tr>
+                    </table>
+                    <table><tr><td>no header</td></tr></table>
+                    """
+                )
+            ],
+            [test_data_02.value],
+            [test_data_03.value],
+        ],
+    )
+    def test_normal_same_as_tree(self, table_text):
+        tree_loader = ptr.HtmlTableTextLoader(table_text)
+        expected = list(tree_loader.load())
+
+        AbstractTableReader.clear_table_count()
+        loader = ptr.HtmlTableTextLoader(table_text)
+        loader.streaming = True
+
+        assert list(loader.load()) == expected
+
+
+class Test_HtmlTableTextLoader_load_table_selector:
+    TABLE_TEXT = dedent(
+        """\
+        <title>selector</title>
+        <table id="first">
+            <caption>Population 2020</caption>
+            <tr><th>city</th><th>population</th></tr>
+            <tr><td>a</td><td>1</td></tr>
+        </table>
+        <table>
+            <caption>Area</caption>
+            <tr><th>city</th><th>area</th></tr>
+            <tr><td>b</td><td>2</td></tr>
+        </table>
+        <table>
+            <tr><th>name</th><th>value</th></tr>
+            <tr><td>c</td><td>3</td></tr>
+        </table>
+        """
+    )
+
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["selector", "expected"],
+        [
+            [
+                ptr.TableSelector(index=1),
+                [TableData("selector_Area", ["city", "area"], [["b", 2]])],
+            ],
+            [
+                ptr.TableSelector(table_id="first"),
+                [TableData("selector_first", ["city", "population"], [["a", 1]])],
+            ],
+            [
+                ptr.TableSelector(caption=r"^Pop"),
+                [TableData("selector_first", ["city", "population"], [["a", 1]])],
+            ],
+            [
+                ptr.TableSelector(headers=["city"]),
+                [
+                    TableData("selector_first", ["city", "population"], [["a", 1]]),
+                    TableData("selector_Area", ["city", "area"], [["b", 2]]),
+                ],
+            ],
+            [
+                ptr.TableSelector(headers=["value", "name"]),
+                [TableData("selector_html1", ["name", "value"], [["c", 3]])],
+            ],
+            [ptr.TableSelector(index=0, caption="Area"), []],
+            [ptr.TableSelector(index=3), []],
+            [ptr.TableSelector(headers=["city", "value"]), []],
+        ],
+    )
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_normal(self, selector, expected, streaming):
+        loader = ptr.HtmlTableTextLoader(self.TABLE_TEXT)
+        loader.table_selector = selector
+        loader.streaming = streaming
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected)
+        for table_data in actual:
+            print(f"[actual]\n{dumps_tabledata(table_data)}")
+
+            assert table_data.in_tabledata_list(expected)
+
+    @pytest.mark.parametrize(["index", "expected"], [[-1, ValueError]])
+    def test_exception(self, index, expected):
+        with pytest.raises(expected):
+            ptr.TableSelector(index=index)
@@ -8,6 +8,7 @@ import pytest
 from pytablewriter import dumps_tabledata
 
 import pytablereader as ptr
+from pytablereader.interface import AbstractTableReader
 
 
 class Test_HtmlTableTextLoader_load:
@@ -27,3 +28,29 @@ class Test_HtmlTableTextLoader_load:
             success_count += 1
 
         assert success_count > 0
+
+    @pytest.mark.parametrize(["filename"], [["python - Wiktionary.html"]])
+    def test_streaming(self, filename):
+        test_data_file_path = os.path.join(os.path.dirname(__file__), "data", filename)
+
+        AbstractTableReader.clear_table_count()
+        expected = list(ptr.HtmlTableFileLoader(test_data_file_path).load())
+
+        AbstractTableReader.clear_table_count()
+        loader = ptr.HtmlTableFileLoader(test_data_file_path)
+        loader.streaming = True
+
+        assert list(loader.load()) == expected
+
+    @pytest.mark.parametrize(["filename"], [["python - Wiktionary.html"]])
+    def test_parse_tables_only(self, filename):
+        test_data_file_path = os.path.join(os.path.dirname(__file__), "data", filename)
+
+        AbstractTableReader.clear_table_count()
+        expected = list(ptr.HtmlTableFileLoader(test_data_file_path).load())
+
+        AbstractTableReader.clear_table_count()
+        loader = ptr.HtmlTableFileLoader(test_data_file_path)
+        loader.parse_tables_only = True
+
+        assert list(loader.load()) == expected
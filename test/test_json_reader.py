@@ -15,6 +15,8 @@ import pytablereader as ptr
 from pytablereader import InvalidTableNameError
 from pytablereader.interface import AbstractTableReader
 
+from ._common import TYPE_HINT_RULES
+
 
 Data = collections.namedtuple("Data", "value expected")
 
@@ -310,7 +312,10 @@ class Test_JsonTableFileLoader_load:
             [test_data_multi_20.value, "tmp.json", "%(key)s", test_data_multi_20.expected],
         ],
     )
-    def test_normal(self, tmpdir, table_text, filename, table_name, expected_tabletuple_list):
+    @pytest.mark.parametrize(["streaming"], [[False], [True]])
+    def test_normal(
+        self, tmpdir, table_text, filename, table_name, streaming, expected_tabletuple_list
+    ):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
 
@@ -318,6 +323,7 @@ class Test_JsonTableFileLoader_load:
             f.write(table_text)
 
         loader = ptr.JsonTableFileLoader(file_path)
+        loader.streaming = streaming
         load = False
         for tabledata in loader.load():
             print(f"[actual]\n{dumps_tabledata(tabledata)}")
@@ -349,19 +355,109 @@ class Test_JsonTableFileLoader_load:
         for _tabletuple in loader.load():
             pass
 
+    @pytest.mark.parametrize(
+        ["chunk_size", "read_size", "expected"],
+        [
+            [
+                None,
+                64 * 1024,
+                [
+                    ["table_a", ["attr_a", "attr_b"], [[1, 4], [2, 5], [3, 6]]],
+                    ["table_b", ["a", "b"], [[1, 4], [2, None]]],
+                ],
+            ],
+            [
+                2,
+                1,
+                [
+                    ["table_a", ["attr_a", "attr_b"], [[1, 4], [2, 5]]],
+                    ["table_a", ["attr_a", "attr_b"], [[3, 6]]],
+                    ["table_b", ["a", "b"], [[1, 4], [2, None]]],
+                ],
+            ],
+        ],
+    )
+    def test_normal_streaming(self, tmpdir, monkeypatch, chunk_size, read_size, expected):
+        p_file_path = tmpdir.join("tmp.json")
+        with open(str(p_file_path), "w") as f:
+            f.write(
+                dedent(
+                    """\
+                    {
+                        "table_a" : [
+                            {"attr_b": 4, "attr_a": 1},
+                            {"attr_b": 5, "attr_a": 2},
+                            {"attr_b": 6, "attr_a": 3}
+                        ],
+                        "table_empty": [],
+                        "table_b" : [{"a": 1, "b": 4}, {"a": 2}]
+                    }
+                    """
+                )
+            )
+        monkeypatch.setattr("pytablereader.json._parser._READ_SIZE", read_size)
+
+        loader = ptr.JsonTableFileLoader(str(p_file_path))
+        loader.table_name = "%(key)s"
+        loader.streaming = True
+        loader.chunk_size = chunk_size
+
+        assert [
+            [tabledata.table_name, tabledata.headers, tabledata.value_matrix]
+            for tabledata in loader.load()
+        ] == expected
+
+    @pytest.mark.parametrize(
+        ["table_text", "expected"],
+        [
+            ['[{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4}, {"a": 5}]', ["r_1", "r_2", "r_3"]],
+            ['{"t1": [{"a": 1}, {"a": 2}, {"a": 3}], "t2": [{"a": 4}]}', ["t1_1", "t1_2", "t2_3"]],
+        ],
+    )
+    def test_normal_streaming_chunk_table_name(self, tmpdir, table_text, expected):
+        p_file_path = tmpdir.join("r.json")
+        with open(str(p_file_path), "w") as f:
+            f.write(table_text)
+
+        loader = ptr.JsonTableFileLoader(str(p_file_path))
+        loader.streaming = True
+        loader.chunk_size = 2
+
+        assert [tabledata.table_name for tabledata in loader.load()] == expected
+
+    def test_exception_streaming_mixed_schema(self, tmpdir):
+        # the first member is the JSON schema (4), but the others are not
+        p_file_path = tmpdir.join("tmp.json")
+        with open(str(p_file_path), "w") as f:
+            f.write('{"t1": [{"a": 1}], "t2": [1, 2]}')
+
+        loader = ptr.JsonTableFileLoader(str(p_file_path))
+        assert len(list(loader.load())) == 1
+
+        loader.streaming = True
+        with pytest.raises(ptr.ValidationError, match="streaming=False"):
+            for _tabledata in loader.load():
+                pass
+
     @pytest.mark.parametrize(
         ["table_text", "filename", "expected"],
         [
             ["[]", "tmp.json", ptr.DataError],
+            ['[{"attr_a": 1}, {"attr_a": 2}', "tmp.json", ptr.ValidationError],
+            ['[{"attr_a": 1}, {"attr_a": 2]', "tmp.json", ptr.ValidationError],
+            ['[{"attr_a": 1}] []', "tmp.json", ptr.ValidationError],
+            ['{"table_a": [{"attr_a": 1}], "table_b": 1}', "tmp.json", ptr.ValidationError],
         ],
     )
-    def test_exception(self, tmpdir, table_text, filename, expected):
+    @pytest.mark.parametrize(["streaming"], [[False], [True]])
+    def test_exception(self, tmpdir, table_text, filename, streaming, expected):
         p_file_path = tmpdir.join(filename)
 
         with open(str(p_file_path), "w") as f:
             f.write(table_text)
 
         loader = ptr.JsonTableFileLoader(str(p_file_path))
+        loader.streaming = streaming
 
         with pytest.raises(expected):
             for _tabletuple in loader.load():
@@ -426,10 +522,12 @@ class Test_JsonTableTextLoader_load:
             [test_data_multi_20.value, "%(key)s", test_data_multi_20.expected],
         ],
     )
-    def test_normal(self, table_text, table_name, expected_tabletuple_list):
+    @pytest.mark.parametrize(["skip_validation"], [[False], [True]])
+    def test_normal(self, table_text, table_name, skip_validation, expected_tabletuple_list):
         ptr.JsonTableFileLoader.clear_table_count()
         loader = ptr.JsonTableTextLoader(table_text)
         loader.table_name = table_name
+        loader.skip_validation = skip_validation
 
         load = False
         for tabledata in loader.load():
@@ -457,10 +555,72 @@ class Test_JsonTableTextLoader_load:
         for _tabletuple in loader.load():
             pass
 
+    @pytest.mark.parametrize(
+        ["table_text", "type_hint_rules", "expected_typenames", "expected"],
+        [
+            [
+                '{"a": [1, 2, null], "b": [1.5, 2, 3], "c": [true, false, true], "d": ["1", "x", null]}',
+                None,
+                ["INTEGER", "REAL_NUMBER", "BOOL", "STRING"],
+                [[1, Decimal("1.5"), True, 1], [2, 2, False, "x"], [None, 3, True, None]],
+            ],
+            [
+                '{"a_text": [1, 2], "b": [1, 2.5], "c": ["a", 1]}',
+                TYPE_HINT_RULES,
+                ["STRING", "REAL_NUMBER", "STRING"],
+                [["1", 1, "a"], ["2", Decimal("2.5"), 1]],
+            ],
+        ],
+    )
+    def test_normal_columnar(self, table_text, type_hint_rules, expected_typenames, expected):
+        loader = ptr.JsonTableTextLoader(table_text, type_hint_rules=type_hint_rules)
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == 1
+        tabledata = tabledata_list[0]
+        assert len(tabledata.rows) == len(expected)
+        assert tabledata.rows[-1] == tuple(tabledata.rows)[-1]
+        assert [col_dp.typename for col_dp in tabledata.column_dp_list] == expected_typenames
+        assert tabledata.value_matrix == expected
+
+    def test_normal_fallback_converter(self):
+        # every value is a list of objects, but the objects include arrays:
+        # loaded as a columnar table of the objects
+        table_text = '{"t": [{"a": [1, 2]}]}'
+
+        loader = ptr.JsonTableTextLoader(table_text)
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == 1
+        assert tabledata_list[0].headers == ["t"]
+        assert len(tabledata_list[0].rows) == 1
+
+    def test_normal_skip_validation(self):
+        table_text = '{"attr_a": [1, [2, 3]], "attr_b": ["a", "b"]}'
+
+        loader = ptr.JsonTableTextLoader(table_text)
+        loader.table_name = "dummy"
+        with pytest.raises(ptr.ValidationError):
+            for _tabletuple in loader.load():
+                pass
+
+        loader = ptr.JsonTableTextLoader(table_text)
+        loader.table_name = "dummy"
+        loader.skip_validation = True
+        tabledata_list = list(loader.load())
+
+        assert len(tabledata_list) == 1
+        assert tabledata_list[0].headers == ["attr_a", "attr_b"]
+
     @pytest.mark.parametrize(
         ["table_text", "expected"],
         [
             ["[]", ptr.DataError],
+            ['[{"attr_a": 1}, [1, 2]]', ptr.ValidationError],
+            ['{"attr_a": [1, [2, 3]]}', ptr.ValidationError],
+            ['[{"attr_a": [1, 2]}]', ptr.ValidationError],
+            ["1", ptr.ValidationError],
+            ['{"table_a": [{"attr_a": 1}], "table_b": {"attr_a": 1}}', ptr.ValidationError],
         ],
     )
     def test_exception(self, table_text, expected):
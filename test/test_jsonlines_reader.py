@@ -194,7 +194,10 @@ class Test_JsonLinesTableFileLoader_load:
             ],
         ],
     )
-    def test_normal(self, tmpdir, table_text, filename, table_name, expected_tabletuple_list):
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
+    def test_normal(
+        self, tmpdir, table_text, filename, table_name, use_mmap, expected_tabletuple_list
+    ):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
 
@@ -202,6 +205,7 @@ class Test_JsonLinesTableFileLoader_load:
             f.write(table_text)
 
         loader = self.LOADER_CLASS(file_path)
+        loader.use_mmap = use_mmap
         load = False
         for tabledata in loader.load():
             print(f"[actual]\n{dumps_tabledata(tabledata)}")
@@ -267,6 +271,138 @@ class Test_JsonLinesTableFileLoader_load:
                 pass
 
 
+class Test_JsonLinesTableFileLoader_iter_rows:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        [
+            "table_text",
+            "headers",
+            "header_sample_size",
+            "batch_size",
+            "expected_headers",
+            "expected",
+        ],
+        [
+            [
+                test_data_single_01.value,
+                [],
+                1000,
+                None,
+                ["attr_b", "attr_c", "attr_a"],
+                [[4, "a", 1], [2.1, "bb", 2], [120.9, "ccc", 3]],
+            ],
+            [
+                test_data_single_01.value,
+                [],
+                1000,
+                2,
+                ["attr_b", "attr_c", "attr_a"],
+                [[[4, "a", 1], [2.1, "bb", 2]], [[120.9, "ccc", 3]]],
+            ],
+            [
+                test_data_single_02.value,
+                [],
+                1000,
+                None,
+                ["attr_a", "attr_b", "attr_c"],
+                [[1, None, None], [None, 2.1, "bb"]],
+            ],
+            [
+                test_data_single_02.value,
+                [],
+                1,
+                None,
+                ["attr_a"],
+                [[1], [None]],
+            ],
+            [
+                test_data_single_02.value,
+                ["attr_c", "attr_a"],
+                1,
+                None,
+                ["attr_c", "attr_a"],
+                [[None, 1], ["bb", None]],
+            ],
+        ],
+    )
+    def test_normal(
+        self,
+        tmpdir,
+        table_text,
+        headers,
+        header_sample_size,
+        batch_size,
+        expected_headers,
+        expected,
+    ):
+        p_file_path = tmpdir.join("tmp.jsonl")
+        with open(str(p_file_path), "w") as f:
+            f.write(table_text)
+
+        loader = ptr.JsonLinesTableFileLoader(str(p_file_path))
+        loader.headers = headers
+        loader.header_sample_size = header_sample_size
+        row_iter = loader.iter_rows(batch_size=batch_size)
+
+        assert row_iter.headers == expected_headers
+        assert list(row_iter) == expected
+
+    @pytest.mark.parametrize(
+        ["skip_validation", "expected"],
+        [
+            [False, ptr.ValidationError],
+            [True, [[1], [[2, 3]]]],
+        ],
+    )
+    def test_skip_validation(self, tmpdir, skip_validation, expected):
+        p_file_path = tmpdir.join("tmp.jsonl")
+        with open(str(p_file_path), "w") as f:
+            f.write('{"attr_a": 1}\n{"attr_a": [2, 3]}\n')
+
+        loader = ptr.JsonLinesTableFileLoader(str(p_file_path))
+        loader.skip_validation = skip_validation
+
+        if skip_validation:
+            assert list(loader.iter_rows()) == expected
+        else:
+            with pytest.raises(expected):
+                list(loader.iter_rows())
+
+    def test_normal_type_hint_rules(self, tmpdir):
+        p_file_path = tmpdir.join("tmp.jsonl")
+        with open(str(p_file_path), "w") as f:
+            f.write(test_data_single_03.value)
+
+        loader = ptr.JsonLinesTableFileLoader(str(p_file_path), type_hint_rules=TYPE_HINT_RULES)
+        row_iter = loader.iter_rows()
+
+        assert row_iter.headers == ["attr_a", "attr_b", "attr_c"]
+        assert len(row_iter.type_hints) == 3
+        assert len(list(row_iter)) == 3
+
+    @pytest.mark.parametrize(
+        ["table_text", "batch_size", "expected"],
+        [
+            ["", None, ptr.DataError],
+            ['{"attr_a": 1}\n[1, 2]\n', None, ptr.ValidationError],
+            ['{"attr_a": 1}\n{"attr_a": \n', None, ptr.ValidationError],
+            [test_data_single_01.value, 0, ValueError],
+        ],
+    )
+    def test_exception(self, tmpdir, table_text, batch_size, expected):
+        p_file_path = tmpdir.join("tmp.jsonl")
+        with open(str(p_file_path), "w") as f:
+            f.write(table_text)
+
+        loader = ptr.JsonLinesTableFileLoader(str(p_file_path))
+        loader.header_sample_size = 1
+
+        with pytest.raises(expected):
+            list(loader.iter_rows(batch_size=batch_size))
+
+
 class Test_JsonLinesTableTextLoader_make_table_name:
     LOADER_CLASS = ptr.JsonLinesTableTextLoader
 
@@ -10,6 +10,7 @@ import pytest
 from path import Path
 from pytablewriter import dumps_tabledata
 from tabledata import TableData
+from typepy import Integer, RealNumber, String
 
 import pytablereader as ptr
 from pytablereader import DataError, InvalidHeaderNameError, InvalidTableNameError
@@ -85,7 +86,8 @@ class Test_LtsvTableFileLoader_load:
         ["test_id", "table_text", "filename", "expected"],
         [[0, test_data_00.value, "tmp.ltsv", test_data_00.expected]],
     )
-    def test_normal(self, tmpdir, test_id, table_text, filename, expected):
+    @pytest.mark.parametrize(["use_mmap"], [[False], [True]])
+    def test_normal(self, tmpdir, test_id, table_text, filename, use_mmap, expected):
         file_path = Path(str(tmpdir.join(filename)))
         file_path.parent.makedirs_p()
 
@@ -93,6 +95,7 @@ class Test_LtsvTableFileLoader_load:
             f.write(table_text)
 
         loader = ptr.LtsvTableFileLoader(file_path)
+        loader.use_mmap = use_mmap
 
         for tabledata in loader.load():
             print(f"test-id={test_id}")
@@ -133,6 +136,123 @@ class Test_LtsvTableFileLoader_load:
                 pass
 
 
+class Test_LtsvTableFileLoader_load_chunk:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["chunk_size", "expected"],
+        [
+            [
+                2,
+                [
+                    ["tmp_ltsv1", ["a", "b"], [[1, 2], [3, 4]]],
+                    ["tmp_ltsv2", ["a", "c"], [[5, 6]]],
+                ],
+            ],
+            [
+                10,
+                [["tmp_ltsv1", ["a", "b", "c"], [[1, 2, None], [3, 4, None], [5, None, 6]]]],
+            ],
+        ],
+    )
+    def test_normal(self, tmpdir, chunk_size, expected):
+        p_ltsv = tmpdir.join("tmp.ltsv")
+        with open(str(p_ltsv), "w", encoding="utf-8") as f:
+            f.write("a:1\tb:2\na:3\tb:4\n\na:5\tc:6\n")
+
+        loader = ptr.LtsvTableFileLoader(str(p_ltsv))
+        loader.table_name = "%(filename)s_%(format_name)s%(format_id)s"
+        loader.chunk_size = chunk_size
+
+        assert [
+            [tabledata.table_name, tabledata.headers, tabledata.value_matrix]
+            for tabledata in loader.load()
+        ] == expected
+
+    def test_normal_default_table_name(self, tmpdir):
+        p_ltsv = tmpdir.join("log.ltsv")
+        with open(str(p_ltsv), "w", encoding="utf-8") as f:
+            f.write("\n".join(f"a:{i}" for i in range(5)))
+
+        loader = ptr.LtsvTableFileLoader(str(p_ltsv))
+        loader.chunk_size = 2
+
+        assert [tabledata.table_name for tabledata in loader.load()] == ["log_1", "log_2", "log_3"]
+
+
+class Test_LtsvTableFileLoader_iter_rows:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["headers", "header_sample_size", "batch_size", "expected_headers", "expected"],
+        [
+            [
+                [],
+                1000,
+                None,
+                ["a", "b", "c"],
+                [["1", "2", None], ["3", "4", None], ["5", None, "6"]],
+            ],
+            [[], 1, None, ["a", "b"], [["1", "2"], ["3", "4"], ["5", None]]],
+            [
+                [],
+                1000,
+                2,
+                ["a", "b", "c"],
+                [[["1", "2", None], ["3", "4", None]], [["5", None, "6"]]],
+            ],
+            [["c", "a"], 1, None, ["c", "a"], [[None, "1"], [None, "3"], ["6", "5"]]],
+        ],
+    )
+    def test_normal(
+        self, tmpdir, headers, header_sample_size, batch_size, expected_headers, expected
+    ):
+        p_ltsv = tmpdir.join("tmp.ltsv")
+        with open(str(p_ltsv), "w", encoding="utf-8") as f:
+            f.write("b:2\ta:1\na:3\tb:4\n\na:5\tc:6\n")
+
+        loader = ptr.LtsvTableFileLoader(str(p_ltsv))
+        loader.headers = headers
+        loader.header_sample_size = header_sample_size
+        row_iter = loader.iter_rows(batch_size=batch_size)
+
+        assert row_iter.headers == expected_headers
+        assert list(row_iter) == expected
+
+    def test_normal_type_hint_rules(self, tmpdir):
+        p_ltsv = tmpdir.join("tmp.ltsv")
+        with open(str(p_ltsv), "w", encoding="utf-8") as f:
+            f.write("a_text:1\tb_integer:2\tc_real:3.3\n")
+
+        loader = ptr.LtsvTableFileLoader(str(p_ltsv), type_hint_rules=TYPE_HINT_RULES)
+        row_iter = loader.iter_rows()
+
+        assert row_iter.type_hints == [String, Integer, RealNumber]
+        assert list(row_iter) == [["1", "2", "3.3"]]
+
+    @pytest.mark.parametrize(
+        ["table_text", "batch_size", "expected"],
+        [
+            ["", None, ptr.DataError],
+            ["a:1\nb\n", None, ptr.DataError],
+            ["a:1\nb!:2\n", None, InvalidHeaderNameError],
+            ["a:1\n", 0, ValueError],
+        ],
+    )
+    def test_exception(self, tmpdir, table_text, batch_size, expected):
+        p_ltsv = tmpdir.join("tmp.ltsv")
+        with open(str(p_ltsv), "w", encoding="utf-8") as f:
+            f.write(table_text)
+
+        loader = ptr.LtsvTableFileLoader(str(p_ltsv))
+        loader.header_sample_size = 1
+
+        with pytest.raises(expected):
+            list(loader.iter_rows(batch_size=batch_size))
+
+
 class Test_LtsvTableTextLoader_make_table_name:
     def setup_method(self, method):
         AbstractTableReader.clear_table_count()
@@ -194,6 +314,23 @@ class Test_LtsvTableTextLoader_load:
             assert tbldata.headers == ["a_text", "b_integer", "c_integer"]
             assert tbldata.value_matrix == [["1", 1, 1], ["2", 2, 1], ["3", 3, 1]]
 
+    def test_normal_colon_in_value(self):
+        table_text = dedent(
+            """\
+            time:2017-01-01T00:00:00\t"host":127.0.0.1\tua:a:b
+            time:2017-01-01T00:00:01\thost:::1\tua:
+            """
+        )
+
+        loader = ptr.LtsvTableTextLoader(table_text)
+        row_iter = loader.iter_rows()
+
+        assert row_iter.headers == ["host", "time", "ua"]
+        assert list(row_iter) == [
+            ["127.0.0.1", "2017-01-01T00:00:00", "a:b"],
+            ["::1", "2017-01-01T00:00:01", ""],
+        ]
+
     @pytest.mark.parametrize(
         ["table_text", "table_name", "expected"],
         [
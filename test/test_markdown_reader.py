@@ -15,7 +15,7 @@ from pytablereader.interface import AbstractTableReader
 from pytablereader.markdown.formatter import MarkdownTableFormatter
 
 
-Markdown = pytest.importorskip("Markdown", minversion="2.6.6")
+Markdown = pytest.importorskip("markdown", minversion="2.6.6")
 
 
 Data = collections.namedtuple("Data", "value expected")
@@ -306,9 +306,11 @@ class Test_MarkdownTableTextLoader_load:
             [2, test_data_02.value, "%(default)s", test_data_02.expected],
         ],
     )
-    def test_normal(self, test_id, table_text, table_name, expected_tabletuple_list):
+    @pytest.mark.parametrize("engine", ["native", "markdown"])
+    def test_normal(self, test_id, table_text, table_name, expected_tabletuple_list, engine):
         loader = ptr.MarkdownTableTextLoader(table_text)
         loader.table_name = table_name
+        loader.engine = engine
 
         load = False
         for table_data in loader.load():
@@ -324,6 +326,137 @@ class Test_MarkdownTableTextLoader_load:
 
         assert load
 
+    @pytest.mark.parametrize(
+        ["table_text", "selector", "expected"],
+        [
+            [
+                test_data_04.value,
+                ptr.TableSelector(index=1),
+                [TableData("markdown1", ["a", "b"], [[1, "123.1"], [2, "2.2"], ["3", "3.3"]])],
+            ],
+            [
+                test_data_04.value,
+                ptr.TableSelector(headers=["c"]),
+                [
+                    TableData(
+                        "markdown1",
+                        ["a", "b", "c"],
+                        [[1, "123.1", "a"], [2, "2.2", "bb"], ["3", "3.3", "ccc"]],
+                    )
+                ],
+            ],
+        ],
+    )
+    @pytest.mark.parametrize("engine", ["native", "markdown"])
+    def test_normal_table_selector(self, table_text, selector, expected, engine):
+        loader = ptr.MarkdownTableTextLoader(table_text)
+        loader.table_selector = selector
+        loader.engine = engine
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected)
+        for table_data in actual:
+            assert table_data.in_tabledata_list(expected)
+
+    @pytest.mark.parametrize(
+        ["table_text", "expected"],
+        [
+            [
+                # leading/trailing pipes are optional and rows are padded
+                dedent(
+                    """\
+                    a | b
+                    :-|--
+                    1 | x
+                    2
+                    """
+                ),
+                [TableData("markdown1", ["a", "b"], [[1, "x"], [2, ""]])],
+            ],
+            [
+                # escaped pipes
+                dedent(
+                    """\
+                    | a | b |
+                    |---|---|
+                    | x \\| y | z |
+                    """
+                ),
+                [TableData("markdown1", ["a", "b"], [["x | y", "z"]])],
+            ],
+            [
+                # tables in fenced code blocks are ignored
+                dedent(
+                    """\
+                    ```
+                    | a | b |
+                    |---|---|
+                    | 1 | 2 |
+                    ```
+
+                    ~~~~
+                    ```
+                    | c |
+                    |---|
+                    ~~~~
+
+                    | d |
+                    |---|
+                    | 3 |
+
+                    # heading
+                    """
+                ),
+                [TableData("markdown1", ["d"], [[3]])],
+            ],
+            [
+                # the numbers of cells of the header and the delimiter row differ
+                dedent(
+                    """\
+                    | a | b |
+                    |---|
+                    | 1 | 2 |
+                    """
+                ),
+                [],
+            ],
+        ],
+    )
+    def test_normal_native(self, table_text, expected):
+        loader = ptr.MarkdownTableTextLoader(table_text)
+        loader.engine = "native"
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected)
+        for table_data in actual:
+            print(f"[actual]\n{dumps_tabledata(table_data)}")
+
+            assert table_data.in_tabledata_list(expected)
+
+    def test_normal_default_engine(self):
+        table_text = dedent(
+            """\
+            | a | b | c | d |
+            |---|---|---|---|
+            | **bold** | `code` | [link](http://example.com) | &amp; |
+            """
+        )
+        loader = ptr.MarkdownTableTextLoader(table_text)
+
+        assert loader.engine == "markdown"
+        for table_data in loader.load():
+            assert table_data.value_matrix == [["bold", "code", "link", "&"]]
+
+    def test_exception_engine(self):
+        loader = ptr.MarkdownTableTextLoader(test_data_01.value)
+        loader.engine = "unknown"
+
+        with pytest.raises(ValueError):
+            for _tabletuple in loader.load():
+                pass
+
     @pytest.mark.parametrize(["table_text", "expected"], [["", ptr.DataError]])
     def test_exception_invalid_data(self, table_text, expected):
         loader = ptr.MarkdownTableTextLoader(table_text)
@@ -308,7 +308,6 @@ class Test_MediaWikiTableFormatter_make_table_name:
             print(formatter._make_table_name())
 
 
-@pytest.mark.xfail(run=False)
 class Test_MediaWikiTableFileLoader_load:
     def setup_method(self, method):
         AbstractTableReader.clear_table_count()
@@ -378,7 +377,6 @@ class Test_MediaWikiTableFileLoader_load:
                 pass
 
 
-@pytest.mark.xfail(run=False)
 class Test_MediaWikiTableTextLoader_load:
     def setup_method(self, method):
         AbstractTableReader.clear_table_count()
@@ -417,6 +415,104 @@ class Test_MediaWikiTableTextLoader_load:
         for _tabletuple in loader.load():
             raise ValueError("should not reach this line")
 
+    @pytest.mark.parametrize(
+        ["table_text", "expected"],
+        [
+            [
+                # cells in a line, and a row without the leading row separator
+                dedent(
+                    """\
+                    {|
+                    ! a !! b
+                    |-
+                    | 1 || x
+                    |-
+                    | 2 || y
+                    |}
+                    """
+                ),
+                [TableData("mediawiki1", ["a", "b"], [["1", "x"], ["2", "y"]])],
+            ],
+            [
+                # markups in cells and multi-line cells
+                dedent(
+                    """\
+                    {| class="wikitable"
+                    |+ style="font-weight:bold" | ''caption''
+                    ! '''a'''
+                    ! b
+                    |-
+                    | [[Page|link]]
+                    | first line
+                    second line
+                    |-
+                    | [https://example.com text]
+                    | 1&lt;2<br />
+                    |}
+                    """
+                ),
+                [
+                    TableData(
+                        "caption",
+                        ["a", "b"],
+                        [["link", "first line\nsecond line"], ["text", "1<2"]],
+                    )
+                ],
+            ],
+            [
+                # nested tables
+                dedent(
+                    """\
+                    {|
+                    ! a
+                    |-
+                    |
+                    {|
+                    |+ inner
+                    ! b
+                    |-
+                    | 2
+                    |}
+                    |-
+                    | 1
+                    |}
+                    """
+                ),
+                [
+                    TableData("mediawiki1", ["a"], [[""], ["1"]]),
+                    TableData("inner", ["b"], [["2"]]),
+                ],
+            ],
+        ],
+    )
+    def test_normal_native(self, table_text, expected):
+        loader = ptr.MediaWikiTableTextLoader(table_text)
+
+        actual = list(loader.load())
+
+        assert len(actual) == len(expected)
+        for tabledata in actual:
+            print(f"[tabledata]\n{tabledata}")
+
+            assert tabledata in expected
+
+    def test_normal_table_selector(self):
+        loader = ptr.MediaWikiTableTextLoader(test_data_04.value)
+        loader.table_selector = ptr.TableSelector(caption="^tablename$")
+
+        actual = list(loader.load())
+
+        assert len(actual) == 1
+        assert actual[0].headers == ["a", "b", "c"]
+
+    def test_exception_engine(self):
+        loader = ptr.MediaWikiTableTextLoader(test_data_01.value)
+        loader.engine = "unknown"
+
+        with pytest.raises(ValueError):
+            for _tabletuple in loader.load():
+                pass
+
     @pytest.mark.parametrize(
         ["table_text", "expected"],
         [
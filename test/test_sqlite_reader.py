@@ -3,13 +3,16 @@
 """
 
 import collections
+import re
 from decimal import Decimal
 
 import pytest
+import typepy
 from path import Path
 from pytablewriter import dumps_tabledata
 from simplesqlite import SimpleSQLite
 from tabledata import TableData
+from typepy import Typecode
 
 import pytablereader as ptr
 from pytablereader.interface import AbstractTableReader
@@ -150,3 +153,133 @@ class Test_SqliteFileLoader_load:
         with pytest.raises(expected):
             for _tabletuple in loader.load():
                 pass
+
+
+class Test_SqliteFileLoader_load_chunk:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    @pytest.mark.parametrize(
+        ["chunk_size", "expected"],
+        [
+            [None, [5]],
+            [0, [5]],
+            [1, [1, 1, 1, 1, 1]],
+            [2, [2, 2, 1]],
+            [5, [5]],
+            [10, [5]],
+        ],
+    )
+    def test_normal(self, tmpdir, chunk_size, expected):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table_from_tabledata(
+            TableData("tmp", ["attr_a", "attr_b"], [[i, f"v{i:d}"] for i in range(5)])
+        )
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        loader.chunk_size = chunk_size
+
+        actual = list(loader.load())
+
+        assert [len(tabledata.rows) for tabledata in actual] == expected
+        assert all([tabledata.table_name == "tmp" for tabledata in actual])
+        assert [row for tabledata in actual for row in tabledata.rows] == [
+            (i, f"v{i:d}") for i in range(5)
+        ]
+
+    def test_normal_empty_table(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table("empty", ["attr_a INTEGER"])
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        loader.chunk_size = 2
+
+        actual = list(loader.load())
+
+        assert len(actual) == 1
+        assert actual[0].rows == []
+
+
+class Test_SqliteFileLoader_load_type_hints:
+    def setup_method(self, method):
+        AbstractTableReader.clear_table_count()
+
+    def test_normal(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table(
+            "tmp",
+            ["int_col INTEGER", "text_col TEXT", "real_col REAL", "any_col", "num_col NUMERIC"],
+        )
+        con.insert_many("tmp", [[1, "a", 1.5, "x", 2], [2, "b", 2.5, "y", 3]])
+        con.commit()
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        tabledata = list(loader.load())[0]
+
+        assert [dp.typecode for dp in tabledata.value_dp_matrix[0]] == [
+            Typecode.INTEGER,
+            Typecode.STRING,
+            Typecode.REAL_NUMBER,
+            Typecode.STRING,
+            Typecode.INTEGER,
+        ]
+
+    def test_normal_mismatched_storage_class(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table("tmp", ["int_col INTEGER", "real_col REAL", "int_ok_col INTEGER"])
+        con.insert_many("tmp", [[1, 1.5, 1], [1.5, "x", 2]])
+        con.commit()
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        tabledata = list(loader.load())[0]
+
+        assert tabledata.value_matrix == [[1, Decimal("1.5"), 1], [Decimal("1.5"), "x", 2]]
+
+    def test_normal_null_text(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table("tmp", ["text_col TEXT", "varchar_col VARCHAR(10)", "int_col INTEGER"])
+        con.insert_many("tmp", [[None, None, None], ["a", "b", 1]])
+        con.commit()
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        tabledata = list(loader.load())[0]
+
+        assert [dp.data for dp in tabledata.value_dp_matrix[0]] == [None, None, None]
+        assert [dp.typecode for dp in tabledata.value_dp_matrix[0]] == [
+            Typecode.NONE,
+            Typecode.NONE,
+            Typecode.NONE,
+        ]
+
+    def test_normal_type_hint_rules(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.sqlite"))
+
+        con = SimpleSQLite(file_path, "w")
+        con.create_table("tmp", ["int_col INTEGER", "text_col TEXT"])
+        con.insert_many("tmp", [[1, "a"], [2, "b"]])
+        con.commit()
+        con.close()
+
+        loader = ptr.SqliteFileLoader(file_path)
+        loader.type_hint_rules = {re.compile("^int_"): typepy.String}
+        tabledata = list(loader.load())[0]
+
+        assert [dp.typecode for dp in tabledata.value_dp_matrix[0]] == [
+            Typecode.STRING,
+            Typecode.STRING,
+        ]
@@ -196,6 +196,18 @@ class Test_TsvTableFileLoader_load:
                 pass
 
 
+class Test_TsvTableFileLoader_iter_rows:
+    def test_normal(self, tmpdir):
+        file_path = str(tmpdir.join("tmp.tsv"))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(test_data_00.value)
+
+        row_iter = ptr.TsvTableFileLoader(file_path).iter_rows(batch_size=2)
+
+        assert row_iter.headers == ["attr_a", "attr_b", "attr_c"]
+        assert list(row_iter) == [[["1", "4", "a"], ["2", "2.1", "bb"]], [["3", "120.9", "ccc"]]]
+
+
 class Test_TsvTableTextLoader_make_table_name:
     def setup_method(self, method):
         AbstractTableReader.clear_table_count()